@@ -0,0 +1,89 @@
+# benchmarks/bench_fleet_loop.py
+"""
+BENCHMARK - BOUCLE DE CONTRÔLE CONTRE LA FLOTTE SIMULÉE
+Contrôleur -> UDP -> FleetSimulator (processus) -> télémétrie -> TelemetryStore.
+Mesure la latence commande -> effet observé (réponse à un échelon de
+vitesse), le coût d'envoi d'un tick et le débit de télémétrie.
+
+Usage: python benchmarks/bench_fleet_loop.py [n_robots] [latency_s] [loss] [trials]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.config import config
+from low_level.fleet_simulator import FleetProcess
+from low_level.real_time_control import RealTimeController
+from low_level.telemetry import TelemetryStore, TelemetryListener
+
+
+def step_latency(controller, store, n_robots, timeout=2.0):
+    """Envoie un échelon de vitesse (cap actuel) et attend le premier déplacement observé."""
+    still = np.zeros((2, n_robots))
+    for _ in range(6):   # Robots à l'arrêt et télémétrie à jour
+        controller.send_velocities(still)
+        time.sleep(1.0 / config.FPS)
+    before = controller.latest_poses().copy()
+    heading = before[2]
+    step = 0.1 * np.array([np.cos(heading), np.sin(heading)])
+    sent = time.perf_counter()
+    controller.send_velocities(step)
+    next_send = sent + 1.0 / config.FPS
+    while time.perf_counter() - sent < timeout:
+        poses = controller.latest_poses()
+        if np.median(np.hypot(poses[0] - before[0], poses[1] - before[1])) > 1e-4:
+            return time.perf_counter() - sent
+        if time.perf_counter() >= next_send:
+            controller.send_velocities(step)
+            next_send += 1.0 / config.FPS
+        time.sleep(0.0002)
+    return np.nan
+
+
+def main():
+    n_robots = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    loss = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    trials = int(sys.argv[4]) if len(sys.argv) > 4 else 20
+
+    print(f"🤖 Flotte simulée: {n_robots} robots, latence {latency * 1000:.0f} ms, perte {loss:.0%}")
+    store = TelemetryStore(n_robots)
+    with TelemetryListener(store) as listener:
+        fleet = FleetProcess(n_robots, listener.address, latency=latency, loss=loss)
+        controller = RealTimeController(address=fleet.start(), telemetry=store)
+        controller.connect()
+        time.sleep(0.3)
+
+        latencies = np.array([step_latency(controller, store, n_robots) for _ in range(trials)])
+
+        velocities = np.full((2, n_robots), 0.01)
+        colors = np.zeros((n_robots, 3), dtype=np.uint8)
+        t0 = time.perf_counter()
+        for tick in range(300):
+            colors[tick % n_robots] = 255
+            controller.set_colors(colors)
+            controller.send_velocities(velocities)
+        send_us = (time.perf_counter() - t0) / 300 * 1e6
+
+        controller.disconnect()
+        stats = fleet.stop()
+
+    ms = latencies * 1e3
+    print(f"   Latence commande -> effet: médiane {np.nanmedian(ms):.1f} ms, "
+          f"p95 {np.nanpercentile(ms, 95):.1f} ms, max {np.nanmax(ms):.1f} ms "
+          f"({np.isnan(ms).sum()} échecs sur {trials})")
+    print(f"   Envoi d'un tick (vitesses + LEDs): {send_us:.0f} µs")
+    print(f"   Flotte: {stats['ticks']} ticks, tick max {stats['max_tick_ms']:.1f} ms, "
+          f"{stats['overruns']} dépassements")
+    print(f"   Commandes: {stats['commands']} reçues, {stats['commands_dropped']} perdues (injectées), "
+          f"{stats['lost_commands']} manquantes au décodage (rafale d'envoi incluse)")
+    print(f"   Télémétrie: {store.stats['records']} enregistrements, {store.seq} trames publiées, "
+          f"{stats['telemetry_dropped']} datagrammes perdus (injectés)")
+
+
+if __name__ == "__main__":
+    main()
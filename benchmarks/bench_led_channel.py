@@ -0,0 +1,129 @@
+# benchmarks/bench_led_channel.py
+"""
+BENCHMARK - CANAL LED (VITESSES + COULEURS EN UN DATAGRAMME)
+Rejoue chaque projet à travers RealTimeController vers un récepteur UDP
+local: vérifie que chaque trame de couleurs reconstruite est exacte et
+mesure le débit économisé par l'envoi en delta des couleurs.
+
+Limite: la plupart des projets ont des noms de phase que
+ColorAnimator.get_phase_colors ne reconnaît pas (orange constant), leurs
+trames LED ne sont alors que les trames complètes périodiques. Les cas
+synthétiques (phases "Carte"/"Finale", fractions de robots changeant de
+couleur à chaque frame) mesurent le chemin delta avec des couleurs qui varient.
+
+Usage: python benchmarks/bench_led_channel.py [n_robots] [max_frames]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.baking import PROJECTS, load_project, iter_baked_chunks
+from utils.config import config
+from utils.random_streams import stream
+from animations.color_animations import ColorAnimator
+from low_level.protocol import LoopbackReceiver
+from low_level.real_time_control import RealTimeController, positions_to_velocities
+
+
+def baked_frames(key, n_robots, max_frames):
+    """Frames (positions, couleurs, temps) d'un projet précalculé."""
+    for positions, colors, _, times in iter_baked_chunks(load_project(key, n_robots),
+                                                         max_frames=max_frames):
+        for k in range(len(times)):
+            yield positions[k], colors[k], times[k]
+
+
+def phase_frames(phase_name, n_robots, n_frames):
+    """Robots alignés immobiles, couleurs d'une phase animée de ColorAnimator."""
+    positions = np.vstack([np.linspace(-1.5, 1.5, n_robots), np.zeros((2, n_robots))])
+    animator = ColorAnimator()
+    for frame in range(n_frames):
+        time_val = frame / config.FPS
+        yield positions, animator.get_phase_colors(positions, phase_name, time_val), time_val
+
+
+def random_delta_frames(fraction, n_robots, n_frames):
+    """Robots immobiles dont une fraction tirée au hasard change de couleur à chaque frame."""
+    rng = stream(phase='bench_led')
+    positions = np.zeros((3, n_robots))
+    colors = rng.integers(0, 256, (n_robots, 3), dtype=np.uint8)
+    changed = max(1, int(round(fraction * n_robots)))
+    for frame in range(n_frames):
+        robots = rng.choice(n_robots, changed, replace=False)
+        colors[robots] = rng.integers(0, 256, (changed, 3), dtype=np.uint8)
+        yield positions, colors.copy(), frame / config.FPS
+
+
+def replay(frames):
+    """Envoie les frames tick par tick et vérifie l'état LED reçu après chaque tick."""
+    with LoopbackReceiver() as receiver:
+        controller = RealTimeController(address=receiver.address)
+        controller.connect()
+        decoder = receiver.decoder
+        previous = None
+        count = mismatches = 0
+        t0 = time.perf_counter()
+        for positions, colors, time_val in frames:
+            current = previous if previous is not None else positions
+            velocities = positions_to_velocities(current, positions, 1.0 / config.FPS)
+            controller.set_colors(colors)
+            controller.send_velocities(velocities, time_val)
+            previous = positions.copy()
+            receiver.poll(timeout=0.05)
+            mismatches += not np.array_equal(decoder.colors, colors)
+            count += 1
+        elapsed = time.perf_counter() - t0
+        controller.disconnect()
+        stats = controller.encoder.stats
+
+    return {
+        'frames': count,
+        'kb_sent': stats['bytes'] / 1e3,
+        'led_full_kb': stats['full_color_bytes'] / 1e3,
+        'led_delta_kb': stats['color_bytes'] / 1e3,
+        'saved': 1 - stats['color_bytes'] / max(stats['full_color_bytes'], 1),
+        'lost': decoder.stats['lost'],
+        'corrupt': decoder.stats['corrupt'] + mismatches,
+        'tick_us': elapsed / max(count, 1) * 1e6,
+    }
+
+
+def main():
+    n_robots = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    max_frames = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    print(f"💡 Canal LED UDP local, {n_robots} robots")
+    print(f"{'Projet':>6} {'Frames':>7} {'Envoyé kB':>10} {'LED brut kB':>12} "
+          f"{'LED delta kB':>13} {'Économie':>9} {'Perdus':>7} {'Erreurs':>8} {'µs/tick':>8}")
+
+    total_full = total_delta = 0.0
+    for key in PROJECTS:
+        r = replay(baked_frames(key, n_robots, max_frames))
+        total_full += r['led_full_kb']
+        total_delta += r['led_delta_kb']
+        print_row(key, r)
+
+    print(f"{'Total':>6} {'':>7} {'':>10} {total_full:>12.0f} {total_delta:>13.0f} "
+          f"{1 - total_delta / max(total_full, 1e-9):>8.0%}")
+
+    # Couleurs qui changent réellement: le chemin delta est mesuré
+    n_frames = max_frames or 30 * config.FPS
+    print(f"\nCouleurs variables, {n_frames} frames")
+    for phase_name in ('Carte du Niger', 'Finale'):
+        print_row(phase_name.split()[0], replay(phase_frames(phase_name, n_robots, n_frames)))
+    for fraction in (0.01, 0.1, 0.5):
+        print_row(f"{fraction:.0%}", replay(random_delta_frames(fraction, n_robots, n_frames)))
+
+
+def print_row(name, r):
+    print(f"{name:>6} {r['frames']:>7} {r['kb_sent']:>10.0f} {r['led_full_kb']:>12.0f} "
+          f"{r['led_delta_kb']:>13.0f} {r['saved']:>8.0%} {r['lost']:>7} "
+          f"{r['corrupt']:>8} {r['tick_us']:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/bench_renderer.py
+"""
+BENCHMARK - RENDU DE L'ESSAIM
+Temps de rendu d'une frame 3D (dessin + rastérisation Agg) selon N, en
+scatter (halo + cœur) et en mode densité. Le mode densité doit rester à
+peu près constant quand N grandit.
+
+Usage: python benchmarks/bench_renderer.py [frames]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.config import config
+from utils.swarm_renderer import SwarmRenderer
+
+
+def bench(n_robots, frames, lod_threshold, rng):
+    fig = plt.figure(figsize=(15, 10))
+    ax = fig.add_subplot(111, projection='3d')
+    renderer = SwarmRenderer(ax, lod_threshold=lod_threshold)
+    positions = np.vstack([rng.uniform(-1.4, 1.4, n_robots), rng.uniform(-0.85, 0.85, n_robots),
+                           rng.uniform(0.0, 1.2, n_robots)])
+    colors = rng.uniform(0, 1, (n_robots, 3))
+    times = []
+    for frame in range(frames):
+        t0 = time.perf_counter()
+        ax.clear()
+        ax.set_axis_off()
+        ax.set_xlim(-config.ARENA_WIDTH/2, config.ARENA_WIDTH/2)
+        ax.set_ylim(-config.ARENA_HEIGHT/2, config.ARENA_HEIGHT/2)
+        ax.set_zlim(0, config.ARENA_DEPTH)
+        ax.view_init(elev=20, azim=frame * 5)
+        renderer.draw(positions, colors=colors)
+        fig.canvas.draw()
+        times.append(time.perf_counter() - t0)
+    plt.close(fig)
+    return np.array(times[1:]) * 1000  # Première frame exclue (mise en place)
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    rng = np.random.default_rng(0)
+    print(f"🎨 Rendu 3D - budget par frame: {1000 / config.FPS:.1f} ms")
+    print(f"{'N':>7} {'Scatter ms':>11} {'Densité ms':>11}")
+    for n_robots in (250, 1000, 4000, 16000, 64000):
+        scatter = bench(n_robots, frames, np.inf, rng) if n_robots <= 16000 else None
+        density = bench(n_robots, frames, 0, rng)
+        scatter_txt = f"{scatter.mean():>11.1f}" if scatter is not None else f"{'-':>11}"
+        print(f"{n_robots:>7} {scatter_txt} {density.mean():>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
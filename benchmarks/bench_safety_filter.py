@@ -0,0 +1,82 @@
+# benchmarks/bench_safety_filter.py
+"""
+BENCHMARK - FILTRE ANTI-COLLISION
+Temps par tick de contrôle (position -> vitesse -> filtre) selon N, sur un
+croisement réalisable; vérifie la distance minimale atteinte et compte les
+ticks où le solveur n'a pas convergé (repli par ralentissement).
+
+Usage: python benchmarks/bench_safety_filter.py [ticks]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from low_level.real_time_control import positions_to_velocities
+from low_level.safety_filter import SafetyFilter, neighbor_pairs
+from utils.config import config
+
+
+def crossing(n_robots, spacing=0.35):
+    """
+    Deux grilles séparées qui échangent leurs places, rangées décalées d'une
+    demi-maille: croisement dense mais réalisable à 2 * ROBOT_RADIUS (l'arène
+    réelle ne contient pas 1000 robots, la scène n'y est donc pas bornée).
+    """
+    half = n_robots // 2
+    cols = int(np.ceil(np.sqrt(half)))
+    k = np.arange(half)
+    gx, gy = (k % cols) * spacing, (k // cols) * spacing
+    gy = gy - gy.mean()
+    width = gx.max()
+    left = np.vstack([gx - width - 0.3, gy])
+    right = np.vstack([gx + 0.3, gy + spacing / 2])
+    return np.hstack([left, right]), np.hstack([right, left])
+
+
+def min_separation(positions):
+    """Plus petite distance entre deux robots (via les paires voisines)."""
+    i, j = neighbor_pairs(positions, 1.0)
+    if len(i) == 0:
+        return np.inf
+    return float(np.sqrt(((positions[:, i] - positions[:, j]) ** 2).sum(axis=0)).min())
+
+
+def bench(n_robots, ticks):
+    """Croisement de deux moitiés de l'essaim (cas le plus dense en conflits)."""
+    current, target = crossing(n_robots)
+    safety = SafetyFilter()
+    dt = 1.0 / config.FPS
+
+    times, iterations = [], []
+    closest, fallbacks = np.inf, 0
+    for _ in range(ticks):
+        t0 = time.perf_counter()
+        velocities = positions_to_velocities(current, target, dt)
+        velocities = safety.filter(current, velocities)
+        times.append(time.perf_counter() - t0)
+        current = current + velocities * dt
+        closest = min(closest, min_separation(current))
+        fallbacks += not safety.last_stats['converged']
+        iterations.append(safety.last_stats['iterations'])
+    return np.array(times) * 1000, np.array(iterations), closest, fallbacks
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    safety_distance = SafetyFilter().min_distance
+    budget_ms = 1000 / config.FPS
+    print(f"🛡️  Filtre CBF - budget par tick: {budget_ms:.1f} ms, "
+          f"distance minimale {safety_distance:.3f} m")
+    print(f"{'N':>6} {'Moy ms':>8} {'P99 ms':>8} {'Itér. moy':>10} {'Itér. max':>10} "
+          f"{'Repli':>6} {'Dist. min':>10}")
+    for n_robots in (100, 250, 500, 1000, 2000):
+        times, iterations, closest, fallbacks = bench(n_robots, ticks)
+        print(f"{n_robots:>6} {times.mean():>8.2f} {np.percentile(times, 99):>8.2f} "
+              f"{iterations.mean():>10.1f} {iterations.max():>10} {fallbacks:>6} {closest:>10.4f}")
+
+if __name__ == "__main__":
+    main()
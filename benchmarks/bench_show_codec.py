@@ -0,0 +1,77 @@
+# benchmarks/bench_show_codec.py
+"""
+BENCHMARK - COMPRESSION DES TRAJECTOIRES PRÉ-CALCULÉES
+Taux de compression et débit de décodage sur les onze projets.
+
+Usage: python benchmarks/bench_show_codec.py [n_robots] [resolution] [zlib|lzma]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.baking import PROJECTS, load_project, bake_positions
+from utils.show_codec import ShowCodec, ShowWriter, ShowReader
+
+
+def bench_project(key, n_robots, codec):
+    """Bake un projet, l'écrit compressé puis mesure le décodage complet."""
+    frames = bake_positions(load_project(key, n_robots))
+    raw_bytes = frames.astype('float32').nbytes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"projet_{key}.amsf")
+        t0 = time.perf_counter()
+        file_bytes = ShowWriter(path, codec).write(frames)
+        encode_time = time.perf_counter() - t0
+
+        with ShowReader(path, codec) as reader:
+            t0 = time.perf_counter()
+            max_err = 0.0
+            for block_idx in range(len(reader.index)):
+                decoded = reader.read_block(block_idx)
+                start = block_idx * reader.block_frames
+                chunk = frames[start:start + len(decoded)]
+                max_err = max(max_err, float(abs(decoded - chunk).max()))
+            decode_time = time.perf_counter() - t0
+
+    return {
+        'frames': len(frames),
+        'raw_mb': raw_bytes / 1e6,
+        'file_mb': file_bytes / 1e6,
+        'ratio': raw_bytes / max(file_bytes, 1),
+        'encode_s': encode_time,
+        'decode_fps': len(frames) / max(decode_time, 1e-9),
+        'decode_mbs': raw_bytes / 1e6 / max(decode_time, 1e-9),
+        'max_err': max_err,
+    }
+
+
+def main():
+    n_robots = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    resolution = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    method = sys.argv[3] if len(sys.argv) > 3 else 'zlib'
+    codec = ShowCodec(resolution=resolution, method=method)
+
+    print(f"📦 Codec: {method}, résolution {resolution*1000:.1f} mm, {n_robots} robots")
+    print(f"{'Projet':>6} {'Frames':>7} {'Brut MB':>8} {'Fichier MB':>10} "
+          f"{'Ratio':>6} {'Décodage f/s':>13} {'MB/s':>8} {'Err max':>8}")
+
+    total_raw = total_file = 0.0
+    for key in PROJECTS:
+        r = bench_project(key, n_robots, codec)
+        total_raw += r['raw_mb']
+        total_file += r['file_mb']
+        print(f"{key:>6} {r['frames']:>7} {r['raw_mb']:>8.1f} {r['file_mb']:>10.2f} "
+              f"{r['ratio']:>6.1f} {r['decode_fps']:>13.0f} {r['decode_mbs']:>8.0f} "
+              f"{r['max_err']*1000:>6.2f}mm")
+
+    print(f"{'Total':>6} {'':>7} {total_raw:>8.1f} {total_file:>10.2f} "
+          f"{total_raw / max(total_file, 1e-9):>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_tracking.py
+"""
+BENCHMARK - SUIVI EN BOUCLE FERMÉE CONTRE LA FLOTTE SIMULÉE
+Un projet pré-calculé est joué en boucle fermée: télémétrie de la flotte
+simulée -> TrackingController -> commandes UDP, à config.FPS. Rapporte
+l'erreur de suivi, la mise à l'échelle de l'horloge et le coût du calcul
+par tick.
+
+Usage: python benchmarks/bench_tracking.py [projet] [n_robots] [secondes] [latency_s] [loss]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.baking import load_project, bake_positions
+from utils.config import config
+from low_level.fleet_simulator import FleetProcess
+from low_level.real_time_control import RealTimeController
+from low_level.telemetry import TelemetryStore, TelemetryListener
+from low_level.tracking import TrackingController
+
+
+def main():
+    key = sys.argv[1] if len(sys.argv) > 1 else '03'
+    n_robots = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+    latency = float(sys.argv[4]) if len(sys.argv) > 4 else 0.0
+    loss = float(sys.argv[5]) if len(sys.argv) > 5 else 0.0
+
+    targets = bake_positions(load_project(key, n_robots), max_frames=int(seconds * config.FPS))
+    tracker = TrackingController(targets)
+    start = np.zeros((3, n_robots))
+    start[:2] = targets[0, :2]
+    start[2] = np.pi / 2
+
+    print(f"🎯 Suivi du projet {key}: {n_robots} robots, {len(targets)} frames, "
+          f"latence {latency * 1000:.0f} ms, perte {loss:.0%}")
+    store = TelemetryStore(n_robots)
+    with TelemetryListener(store) as listener:
+        fleet = FleetProcess(n_robots, listener.address, latency=latency, loss=loss, poses=start)
+        controller = RealTimeController(address=fleet.start(), telemetry=store)
+        controller.connect()
+        while store.seq == 0:
+            time.sleep(0.01)
+
+        period = 1.0 / config.FPS
+        compute = []
+        t0 = time.perf_counter()
+        tick = 0
+        while not tracker.done:
+            tick_start = time.perf_counter()
+            controller.command_tracking(tracker, period)
+            compute.append(time.perf_counter() - tick_start)
+            if tick % config.FPS == 0:
+                r = tracker.report()
+                print(f"   t={tick_start - t0:5.1f}s spectacle={r['show_time']:5.1f}s "
+                      f"rate={r['rate']:.2f} erreur moy={r['mean'] * 1000:5.1f} mm "
+                      f"p95={r['p95'] * 1000:5.1f} mm en retard={r['lagging']}")
+            tick += 1
+            time.sleep(max(0.0, t0 + tick * period - time.perf_counter()))
+        wall = time.perf_counter() - t0
+        controller.disconnect()
+        stats = fleet.stop()
+
+    r = tracker.report()
+    compute_ms = np.array(compute) * 1e3
+    print(f"   Spectacle de {tracker.duration:.1f} s joué en {wall:.1f} s")
+    print(f"   Erreur RMS par robot: moyenne {r['rms_mean'] * 1000:.1f} mm, "
+          f"pire {tracker.robot_rms().max() * 1000:.1f} mm (robot {r['worst_robot']}), "
+          f"max {r['worst_max'] * 1000:.1f} mm")
+    print(f"   Calcul d'un tick: médiane {np.median(compute_ms):.2f} ms, "
+          f"max {compute_ms.max():.2f} ms (budget {period * 1000:.1f} ms)")
+    print(f"   Flotte: tick max {stats['max_tick_ms']:.1f} ms, {stats['overruns']} dépassements")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,7 @@ from projects.project_10_architecture import Project10PatrimoineArchitectural
 from projects.project_11_naissance_nation import Project11NaissanceNation
 
 from utils.config import config
+from utils.swarm_renderer import SwarmRenderer
 
 def setup_visualization():
     """Configure la visualisation matplotlib 3D pour le show cinéma."""
@@ -44,12 +45,19 @@ def setup_visualization():
     
     return fig, ax
 
+def draw_particles(ax, pool, size=4):
+    """Particules décoratives d'un ParticlePool (opacité décroissante avec l'âge)."""
+    if pool.count:
+        ax.scatter(pool.positions[0], pool.positions[1], c=pool.colors(), s=size,
+                   alpha=pool.fade(), marker='.', linewidths=0)
+
 def run_project_01_full():
     """Exécute le Projet 1: ANEM en Lumière avec visualisation complète."""
     print("🎬 LANCEMENT DU PROJET #1: ANEM EN LUMIÈRE")
     
     project = Project01AnemLumiere()
     fig, ax = setup_visualization()
+    renderer = SwarmRenderer(ax)
     
     # Configuration vidéo (optionnel)
     video_writer = None
@@ -97,7 +105,8 @@ def run_project_01_full():
             # GÉNÉRER LES COULEURS POUR CHAQUE ROBOT
             colors_list = []
             for i in range(positions.shape[1]):
-                color = project.colors.get_phase_color(positions, phase_name, time_val, i)
+                color = project.colors.get_phase_color(positions, phase_name, time_val, i,
+                                                       shading=project.frame_shading)
                 colors_list.append(color)
             
             # Simuler la profondeur (Z) si non fournie par le projet (compatibilité 2D)
@@ -109,18 +118,8 @@ def run_project_01_full():
                 z_pos = 0.2 * np.sin(positions[0] * 2 + time_val)
             
             # ==== DRONE LIGHT SHOW EFFECT 3D ====
-            # Layer: Glow & Glow 
-            ax.scatter(positions[0], positions[1], z_pos,
-                      c=colors_list,
-                      s=150, alpha=0.2, 
-                      marker='o')
-            
-            # Layer: Bright core
-            ax.scatter(positions[0], positions[1], z_pos,
-                      c=colors_list,
-                      s=40, alpha=1.0, 
-                      edgecolors='white', linewidth=0.5,
-                      marker='o')
+            # Halo + cœur lumineux, ou image de densité pour les très grands essaims
+            renderer.draw(positions, z_pos, colors_list)
             
             # Informations en temps réel
             info_text = (
@@ -207,7 +206,8 @@ def run_project_01_fast():
             # Compter les couleurs pour vérification
             colors_count = {"orange": 0, "blanc": 0, "vert": 0, "autre": 0}
             for i in range(positions.shape[1]):
-                color = project.colors.get_phase_color(positions, phase_name, time_val, i)
+                color = project.colors.get_phase_color(positions, phase_name, time_val, i,
+                                                       shading=project.frame_shading)
                 if color == config.COLORS['orange_niger']:
                     colors_count["orange"] += 1
                 elif color == config.COLORS['blanc_pure']:
@@ -237,7 +237,7 @@ def run_project_01_colors_test():
         print(f"\n🧪 Test phase: {phase_name}")
         
         # Positions de test
-        positions = project.letters.random_positions()
+        positions = project.letters.random_positions(project.random.stream('test_phases'))
         
         # Tester différentes frames
         for time_val in [0, 1, 2, 3]:
@@ -600,6 +600,9 @@ def run_project_05_full():
                       edgecolors='yellow', linewidth=0.5,
                       marker='.')  # Points pour les étincelles
             
+            # Traînées d'étincelles décoratives
+            draw_particles(ax, project.update_particles(time_val, positions), size=3)
+            
             # Informations en temps réel
             info_text = (
                 f"Phase: {phase_name}\n"
@@ -961,6 +964,101 @@ def test_formations_only():
     
     print("✅ Test des formations terminé!")
 
+def run_playlist_full(playlist=None):
+    """Enchaîne plusieurs tableaux (soirée) avec pré-calcul en tâche de fond."""
+    from utils.playlist import PlaylistRunner
+    from animations.color_animations import ColorAnimator
+    
+    # Programme par défaut: (projet, durée en secondes)
+    playlist = playlist or [('11', 60), ('04', 60), ('06', 45), ('05', 45)]
+    print("🎞️  LANCEMENT DE LA PLAYLIST: " + " → ".join(f"#{k} ({d}s)" for k, d in playlist))
+    
+    runner = PlaylistRunner(playlist)
+    colors = ColorAnimator()
+    fig, ax = setup_visualization()
+    renderer = SwarmRenderer(ax)
+    
+    try:
+        for positions, phase_name, time_val, frame in runner.run():
+            ax.clear()
+            ax.set_axis_off()
+            ax.set_xlim(-config.ARENA_WIDTH/2, config.ARENA_WIDTH/2)
+            ax.set_ylim(-config.ARENA_HEIGHT/2, config.ARENA_HEIGHT/2)
+            ax.set_zlim(0, config.ARENA_DEPTH)
+            ax.set_facecolor('#000000')
+            ax.view_init(elev=20 + 5 * np.sin(time_val * 0.2), azim=(time_val * 5) % 360)
+            ax.set_title(f"ANEM 2025 - SOIRÉE\nTableau: {phase_name.upper()}",
+                         color='white', fontsize=16, pad=-20, weight='bold')
+            
+            colors_list = [colors.get_phase_color(positions, phase_name, time_val, i)
+                           for i in range(positions.shape[1])]
+            renderer.draw(positions, positions[2], colors_list)
+            
+            plt.draw()
+            plt.pause(1/config.FPS)
+            
+            if frame % 30 == 0:
+                print(f"📊 Frame {frame:05d} | {phase_name:25} | {time_val:06.1f}s")
+    
+    except KeyboardInterrupt:
+        print("\n⏹️  Playlist interrompue par l'utilisateur")
+    finally:
+        if runner.stalls:
+            print(f"⚠️  Shows non prêts au changement: {runner.stalls}")
+        print("🎉 Playlist terminée!")
+        plt.show()
+
+def run_project_pipelined(key='01'):
+    """Génération et rendu dans deux processus reliés par un bus en mémoire partagée."""
+    import multiprocessing as mp
+    from utils.frame_bus import FrameBus, project_producer
+    
+    print(f"🔀 PROJET #{key} EN PIPELINE (générateur et rendu séparés)")
+    bus = FrameBus(n_slots=16, dims=3, n_robots=config.N_ROBOTS)
+    producer = mp.Process(target=project_producer, args=(key, bus.name), daemon=True)
+    producer.start()
+    fig, ax = setup_visualization()
+    renderer = SwarmRenderer(ax)
+    
+    try:
+        while True:
+            # latest=True: si le rendu prend du retard, on saute aux frames récentes
+            item = bus.acquire(latest=True)
+            if item is None:
+                break
+            positions, colors, time_val, frame, phase_name = item
+            
+            ax.clear()
+            ax.set_axis_off()
+            ax.set_xlim(-config.ARENA_WIDTH/2, config.ARENA_WIDTH/2)
+            ax.set_ylim(-config.ARENA_HEIGHT/2, config.ARENA_HEIGHT/2)
+            ax.set_zlim(0, config.ARENA_DEPTH)
+            ax.set_facecolor('#000000')
+            ax.view_init(elev=20 + 5 * np.sin(time_val * 0.2), azim=(time_val * 5) % 360)
+            ax.set_title(f"ANEM 2025 - PIPELINE\nTableau: {phase_name.upper()}",
+                         color='white', fontsize=16, pad=-20, weight='bold')
+            renderer.draw(positions, positions[2], colors.T.copy())
+            del positions, colors, item
+            bus.release()
+            
+            plt.draw()
+            plt.pause(1/config.FPS)
+            
+            if frame % 30 == 0:
+                stats = bus.stats()
+                print(f"📊 Frame {frame:04d} | {phase_name:25} | {time_val:05.1f}s | "
+                      f"perdues: {stats['dropped_consumer']}")
+    
+    except KeyboardInterrupt:
+        print("\n⏹️  Animation interrompue par l'utilisateur")
+    finally:
+        print(f"📈 Bus: {bus.stats()}")
+        producer.terminate()
+        producer.join()
+        bus.close()
+        print("🎉 Animation terminée!")
+        plt.show()
+
 # Mettre à jour le menu principal
 def main():
     """Fonction principale avec menu interactif."""
@@ -984,9 +1082,11 @@ def main():
         print("12. ⚡ Projet #1: Version rapide")
         print("13. 🎨 Test spécifique des couleurs drapeau")
         print("14. 🧪 Tester les formations seulement")
-        print("15. 🚪 Quitter")
+        print("15. 🎞️  Playlist de la soirée (enchaînement des tableaux)")
+        print("16. 🔀 Projet #1 en pipeline (générateur / rendu séparés)")
+        print("17. 🚪 Quitter")
         
-        choix = input("\n🎮 Choisissez une option (1-14): ").strip()
+        choix = input("\n🎮 Choisissez une option (1-17): ").strip()
         
         if choix == "1":
             run_project_01_full()
@@ -1017,10 +1117,14 @@ def main():
         elif choix == "14":
             test_formations_only()
         elif choix == "15":
+            run_playlist_full()
+        elif choix == "16":
+            run_project_pipelined('01')
+        elif choix == "17":
             print("👋 Au revoir ! À bientôt sur Robotarium ANEM 2025!")
             break
         else:
-            print("❌ Choix invalide. Veuillez choisir 1-14.")
+            print("❌ Choix invalide. Veuillez choisir 1-17.")
 
 # Ajouter la fonction pour le projet 10
 def run_project_10_full():
@@ -1368,6 +1472,9 @@ def run_project_08_full():
                       edgecolors='gold', linewidth=1,
                       marker='o')
             
+            # Gouttes d'encre décoratives
+            draw_particles(ax, project.update_particles(time_val, positions), size=6)
+            
             # Informations en temps réel
             info_text = (
                 f"Mot: {phase_name}\n"
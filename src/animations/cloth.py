@@ -0,0 +1,235 @@
+# src/animations/cloth.py
+"""
+DRAPEAU EN TISSU (ÉQUATION DES ONDES SUR GRILLE)
+Le drapeau est une grille rows x cols dont chaque nœud porte un
+déplacement hors plan z. z obéit à une équation des ondes amortie, forcée
+par un vent qui remonte le drapeau vers son bord libre:
+    z_tt = c²·∇²z - amortissement·z_t + vent(x, y, t)
+intégrée par Verlet explicite (pochoir à 5 points sur le tableau 2D, bords
+libres par cellules fantômes, bord gauche épinglé à la hampe). Les robots
+échantillonnent la grille par interpolation bilinéaire: position 3D et
+ombrage (normale du tissu vs lumière) en une passe par frame, sans
+allocation (tampons de travail préalloués).
+"""
+
+import numpy as np
+from formations.base_formations import split_counts
+
+
+class FlagCloth:
+    """Drapeau simulé; bind() associe les robots à des points (u, v) du tissu."""
+
+    def __init__(self, cols=40, rows=25, width=2.6, height=1.2, center=(0.0, 0.0),
+                 wave_speed=1.2, damping=1.5, wind=0.8, wind_frequency=0.6,
+                 wavelength=1.4, light=(-0.7, 0.2, 0.7), ambient=0.35):
+        self.cols, self.rows = cols, rows
+        self.width, self.height = width, height
+        self.center = np.asarray(center, dtype=float)
+        self.hx, self.hy = width / (cols - 1), height / (rows - 1)
+        self.wave_speed = wave_speed
+        self.damping = damping
+        self.wind = wind
+        self.omega = 2 * np.pi * wind_frequency
+        light = np.asarray(light, dtype=float)
+        self.light = light / np.linalg.norm(light)
+        self.ambient = ambient
+        self.time = 0.0
+
+        # Grille au repos (u vers la droite depuis la hampe, v vers le haut)
+        u, v = np.meshgrid(np.linspace(0.0, 1.0, cols), np.linspace(0.0, 1.0, rows))
+        self.rest_x = self.center[0] - width / 2 + width * u
+        self.rest_y = self.center[1] - height / 2 + height * v
+        # Phase spatiale du vent: onde progressive de la hampe vers le bord libre
+        self.wind_phase = 2 * np.pi * (self.rest_x - self.rest_x[0, 0]) / wavelength + 0.6 * self.rest_y
+
+        # Tableaux à plat avec une couronne de cellules fantômes: chaque terme du
+        # pochoir est une tranche 1D contiguë (aucun tampon temporaire numpy)
+        self.stride = cols + 2
+        size = (rows + 2) * self.stride
+        self._lo = self.stride + 1
+        self._hi = rows * self.stride + cols + 1
+        self._z = np.zeros(size)
+        self._z_prev = np.zeros(size)
+        self._shade = np.ones(size)
+        flat_x = np.zeros((rows + 2, self.stride))
+        flat_x[1:-1, 1:-1] = self.wind_phase
+        self._wind_phase = flat_x.reshape(-1)[self._lo:self._hi].copy()
+        length = self._hi - self._lo
+        self._acc = np.empty(length)
+        self._tmp = np.empty(length)
+        self._dzdx = np.empty(length)
+        self._dzdy = np.empty(length)
+        self._sampler = None
+
+    def _grid(self, flat):
+        return flat.reshape(self.rows + 2, self.stride)
+
+    @property
+    def z(self):
+        """Déplacement hors plan (rows, cols) des nœuds du tissu."""
+        return self._grid(self._z)[1:-1, 1:-1]
+
+    @property
+    def shade(self):
+        """Ombrage (rows, cols) des nœuds du tissu."""
+        return self._grid(self._shade)[1:-1, 1:-1]
+
+    # ========== SIMULATION ==========
+
+    def substeps(self, dt):
+        """Sous-pas assurant la condition CFL: c·dt·sqrt(1/hx² + 1/hy²) ≤ 0.9."""
+        courant = self.wave_speed * dt * np.sqrt(1 / self.hx**2 + 1 / self.hy**2)
+        return max(1, int(np.ceil(courant / 0.9)))
+
+    def step(self, dt):
+        """Avance la simulation de dt secondes (Verlet, sous-pas stables)."""
+        n_sub = self.substeps(dt)
+        h = dt / n_sub
+        decay = max(0.0, 1.0 - self.damping * h)
+        c2 = self.wave_speed**2
+        inner = slice(self._lo, self._hi)
+        for _ in range(n_sub):
+            self.time += h
+            acc = self._laplacian(self._acc)
+            acc *= c2
+            # Vent: pression sinusoïdale progressive
+            np.subtract(self._wind_phase, self.omega * self.time, out=self._tmp)
+            np.sin(self._tmp, out=self._tmp)
+            self._tmp *= self.wind
+            acc += self._tmp
+            acc *= h * h
+            # z_next = z + decay·(z - z_prev) + h²·acc, écrit dans z_prev puis échangé
+            z, z_next = self._z[inner], self._z_prev[inner]
+            np.subtract(z, z_next, out=z_next)
+            z_next *= decay
+            z_next += z
+            z_next += acc
+            self._z, self._z_prev = self._z_prev, self._z
+            # Hampe: bord gauche épinglé
+            self._grid(self._z)[1:-1, 1] = 0.0
+            self._grid(self._z_prev)[1:-1, 1] = 0.0
+        self._update_shading()
+
+    def _refresh_ghosts(self):
+        """Bords libres: chaque cellule fantôme recopie le nœud du bord voisin."""
+        grid = self._grid(self._z)
+        grid[0] = grid[1]
+        grid[-1] = grid[-2]
+        grid[:, 0] = grid[:, 1]
+        grid[:, -1] = grid[:, -2]
+
+    def _laplacian(self, out):
+        """Pochoir à 5 points sur la zone intérieure (tranches décalées de ±1 et ±stride)."""
+        self._refresh_ghosts()
+        z, lo, hi, w = self._z, self._lo, self._hi, self.stride
+        center = z[lo:hi]
+        np.add(z[lo + 1:hi + 1], z[lo - 1:hi - 1], out=out)
+        out -= center
+        out -= center
+        out *= 1.0 / self.hx**2
+        np.add(z[lo + w:hi + w], z[lo - w:hi - w], out=self._tmp)
+        self._tmp -= center
+        self._tmp -= center
+        self._tmp *= 1.0 / self.hy**2
+        out += self._tmp
+        return out
+
+    def _update_shading(self):
+        """Ombrage lambertien: normale (-∂z/∂x, -∂z/∂y, 1) normalisée vs lumière."""
+        self._refresh_ghosts()
+        z, lo, hi, w = self._z, self._lo, self._hi, self.stride
+        dzdx, dzdy, tmp = self._dzdx, self._dzdy, self._tmp
+        shade = self._shade[lo:hi]
+        # Différences centrées (demi-différences aux bords libres)
+        np.subtract(z[lo + 1:hi + 1], z[lo - 1:hi - 1], out=dzdx)
+        dzdx *= 0.5 / self.hx
+        np.subtract(z[lo + w:hi + w], z[lo - w:hi - w], out=dzdy)
+        dzdy *= 0.5 / self.hy
+
+        lx, ly, lz = self.light
+        # cos = (lz - lx·dzdx - ly·dzdy) / sqrt(1 + dzdx² + dzdy²)
+        np.multiply(dzdx, -lx, out=shade)
+        np.multiply(dzdy, ly, out=tmp)
+        shade -= tmp
+        shade += lz
+        np.square(dzdx, out=dzdx)
+        np.square(dzdy, out=dzdy)
+        dzdx += dzdy
+        dzdx += 1.0
+        np.sqrt(dzdx, out=dzdx)
+        shade /= dzdx
+        np.clip(shade, 0.0, 1.0, out=shade)
+        shade *= 1.0 - self.ambient
+        shade += self.ambient
+
+    # ========== ROBOTS ==========
+
+    def grid_uv(self, n_robots):
+        """Coordonnées (u, v) (2, N) de N robots en rangées régulières sur le drapeau."""
+        n_rows = max(1, int(round(np.sqrt(n_robots * self.height / self.width))))
+        counts = split_counts(n_robots, n_rows)
+        row_of = np.repeat(np.arange(n_rows), counts)
+        col = np.arange(n_robots) - (np.cumsum(counts) - counts)[row_of]
+        u = col / np.maximum(1, counts[row_of] - 1)
+        v = row_of / max(1, n_rows - 1)
+        return np.array([u, v])
+
+    def uv_from_xy(self, xy):
+        """(u, v) des positions xy (2, N) au repos, bornées au tissu."""
+        u = (xy[0] - self.center[0] + self.width / 2) / self.width
+        v = (xy[1] - self.center[1] + self.height / 2) / self.height
+        return np.clip(np.array([u, v]), 0.0, 1.0)
+
+    def bind(self, uv):
+        """Précalcule indices et poids bilinéaires des robots (u, v) (2, N)."""
+        gx = np.asarray(uv[0], dtype=float) * (self.cols - 1)
+        gy = np.asarray(uv[1], dtype=float) * (self.rows - 1)
+        i0 = np.minimum(gx.astype(int), self.cols - 2)
+        j0 = np.minimum(gy.astype(int), self.rows - 2)
+        fx, fy = gx - i0, gy - j0
+        base = (j0 + 1) * self.stride + i0 + 1
+        index = np.array([base, base + 1, base + self.stride, base + self.stride + 1])
+        weight = np.array([(1 - fx) * (1 - fy), fx * (1 - fy), (1 - fx) * fy, fx * fy])
+        rest_xy = np.array([self.center[0] - self.width / 2 + self.width * uv[0],
+                            self.center[1] - self.height / 2 + self.height * uv[1]])
+        self._sampler = (index, weight, rest_xy, np.empty(len(gx)))
+        return self
+
+    def _sample(self, flat, out):
+        # mode='clip': np.take n'écrit directement dans out qu'hors du mode 'raise'
+        index, weight, _, scratch = self._sampler
+        np.take(flat, index[0], out=out, mode='clip')
+        out *= weight[0]
+        for k in range(1, 4):
+            np.take(flat, index[k], out=scratch, mode='clip')
+            scratch *= weight[k]
+            out += scratch
+        return out
+
+    def _bound(self):
+        if self._sampler is None:
+            raise RuntimeError("Aucun robot lié au drapeau: appeler bind(uv) d'abord")
+        return self._sampler
+
+    def heights(self, out=None):
+        """Déplacement z (N,) des robots liés."""
+        out = np.empty(self._bound()[2].shape[1]) if out is None else out
+        return self._sample(self._z, out)
+
+    def shading(self, out=None):
+        """Ombrage (N,) des robots liés, dans [ambient, 1]."""
+        out = np.empty(self._bound()[2].shape[1]) if out is None else out
+        return self._sample(self._shade, out)
+
+    def sample(self, out=None, shade=None):
+        """Positions (3, N) des robots liés (xy au repos, z du tissu) et ombrage (N,)."""
+        rest_xy = self._bound()[2]
+        out = np.empty((3, rest_xy.shape[1])) if out is None else out
+        out[:2] = rest_xy
+        self.heights(out[2])
+        return out, self.shading(shade)
+
+    def frame(self, dt, out=None, shade=None):
+        """Une frame: step(dt) puis sample()."""
+        self.step(dt)
+        return self.sample(out, shade)
@@ -7,12 +7,15 @@ Includes light effects for Project 1 ceremony
 import numpy as np
 import colorsys
 from utils.config import config
+from utils.random_streams import ShowRandom, frame_index
 
 class ColorAnimator:
     """Gère les animations de couleurs avec effets lumineux artistiques."""
     
-    def __init__(self):
+    def __init__(self, seed=None):
         self.colors = config.COLORS
+        self.random = ShowRandom(seed)
+        self._noise_cache = (None, None)
         # Couleurs drapeau Niger en ordre
         self.drapeau_colors = [
             self.colors['orange_niger'],
@@ -94,8 +97,8 @@ class ColorAnimator:
     
     # ========== FLOATING FLAG COLORS ==========
     
-    def get_drapeau_flottant_color(self, positions, robot_index, time_val):
-        """Colors for floating flag with wave effect."""
+    def get_drapeau_flottant_color(self, positions, robot_index, time_val, shading=None):
+        """Colors for floating flag with wave effect (shading: cloth shading (N,) of this frame)."""
         if robot_index >= positions.shape[1]:
             return self.colors['orange_niger']
         
@@ -113,11 +116,26 @@ class ColorAnimator:
         else:
             base_color = self.colors['vert_espoir']
         
-        # Add fabric shimmer effect
-        shimmer = 0.9 + 0.1 * np.sin(2 * np.pi * 0.5 * time_val + x_pos * 3)
+        # Fabric shading from the cloth normals when available, shimmer otherwise
+        if shading is not None and len(shading) == positions.shape[1]:
+            shimmer = shading[robot_index]
+        else:
+            shimmer = 0.9 + 0.1 * np.sin(2 * np.pi * 0.5 * time_val + x_pos * 3)
         r, g, b = self.hex_to_rgb(base_color)
         return self.rgb_to_hex(int(r * shimmer), int(g * shimmer), int(b * shimmer))
     
+    def get_drapeau_flottant_colors(self, positions, time_val, shading=None):
+        """Floating flag colors for all robots at once: (N, 3) uint8 RGB (same shading as above)."""
+        x_pos, y_pos = positions[0], positions[1]
+        bands = np.array([self.hex_to_rgb(self.colors[name]) for name in
+                          ('vert_espoir', 'blanc_pure', 'orange_niger', 'or_soleil')], dtype=float)
+        band = np.digitize(y_pos, [-0.25, 0.25], right=True)
+        band[(band == 1) & (np.abs(x_pos) < 0.15) & (np.abs(y_pos) < 0.15)] = 3
+        if shading is None or len(shading) != len(x_pos):
+            shading = 0.9 + 0.1 * np.sin(2 * np.pi * 0.5 * time_val + x_pos * 3)
+        rgb = bands[band] * np.asarray(shading)[:, None]
+        return np.clip(rgb.astype(int), 0, 255).astype(np.uint8)
+    
     # ========== TEXT FORMATION COLORS ==========
     
     def get_text_color(self, phase_name, time_val, effect_type='gold'):
@@ -155,7 +173,14 @@ class ColorAnimator:
     
     # ========== MAIN COLOR DISPATCHER ==========
     
-    def get_tempête_color(self, robot_index, time_val):
+    def _frame_noise(self, phase, time_val, n):
+        """Bruit uniforme [0, 1) d'une frame, tiré une seule fois pour tous les robots."""
+        key = (phase, frame_index(time_val), n)
+        if self._noise_cache[0] != key:
+            self._noise_cache = (key, self.random.at_time(phase, time_val).random(n))
+        return self._noise_cache[1]
+
+    def get_tempête_color(self, robot_index, time_val, n_robots=None):
         """Couleurs pour la tempête de sable (Orange terreux avec variations)."""
         # Mélange de orange Niger et de terre d'Agadez
         r1, g1, b1 = self.hex_to_rgb(self.colors['orange_niger'])
@@ -168,12 +193,14 @@ class ColorAnimator:
         b = int(b1 * mix + b2 * (1 - mix))
         
         # Effet de poussière (plus ou moins sombre)
-        brilliance = 0.7 + 0.3 * np.random.rand()
+        noise = self._frame_noise('tempête_color', time_val, max(n_robots or 0, robot_index + 1))
+        brilliance = 0.7 + 0.3 * noise[robot_index]
         return self.rgb_to_hex(int(r * brilliance), int(g * brilliance), int(b * brilliance))
 
-    def get_phase_color(self, positions, phase_name, time_val, robot_index=None):
+    def get_phase_color(self, positions, phase_name, time_val, robot_index=None, shading=None):
         """
         Main color dispatcher for all phases - VERSION CINÉMA 3D.
+        shading: per-robot fabric shading (N,) yielded with the frame (flag phases), or None.
         """
         if positions is None or robot_index is None:
             return self.colors['orange_niger']
@@ -185,7 +212,7 @@ class ColorAnimator:
         
         # TABLEAU #1: NAISSANCE D'UNE NATION (CINÉMA)
         if "tempête" in phase_lower:
-            return self.get_tempête_color(robot_index, time_val)
+            return self.get_tempête_color(robot_index, time_val, positions.shape[1])
         
         elif "vert" in phase_lower:
             # Émergence progressive du vert
@@ -200,7 +227,7 @@ class ColorAnimator:
             return self.pulsation_effect(self.colors['or_soleil'], time_val, frequency=1.0)
             
         elif "ondulant" in phase_lower or "flottant" in phase_lower:
-            return self.get_drapeau_flottant_color(positions, robot_index, time_val)
+            return self.get_drapeau_flottant_color(positions, robot_index, time_val, shading)
             
         elif "niger" in phase_lower:
             # NIGER 3D - Or brillant
@@ -221,7 +248,68 @@ class ColorAnimator:
         
         # Default: orange
         return self.colors['orange_niger']
-    
+
+    # ========== BATCH COLORS ==========
+
+    def get_phase_colors(self, positions, phase_name, time_val, out=None, shading=None):
+        """
+        Batch version of get_phase_color: (N, 3) uint8 RGB for all robots,
+        identical to the robot-by-robot dispatcher (same branches, same
+        truncation to integers).
+        """
+        n = positions.shape[1]
+        out = np.empty((n, 3), dtype=np.uint8) if out is None else out
+        index = np.arange(n)
+        phase_lower = phase_name.lower()
+
+        if "tempête" in phase_lower:
+            mix = (0.5 + 0.5 * np.sin(time_val * 2 + index * 0.1))[:, None]
+            rgb = np.trunc(self._rgb('orange_niger') * mix + self._rgb('terre_agadez') * (1 - mix))
+            brilliance = 0.7 + 0.3 * self._frame_noise('tempête_color', time_val, n)
+            return self._scaled(rgb, brilliance, out)
+        elif "vert" in phase_lower:
+            return self._scaled(self._rgb('vert_espoir'), 1.0, out)
+        elif "blanc" in phase_lower:
+            return self._scaled(self._rgb('blanc_pure'), 1.0, out)
+        elif "soleil" in phase_lower:
+            pulse = 0.7 + 0.3 * np.sin(2 * np.pi * 1.0 * time_val)
+            return self._scaled(self._rgb('or_soleil'), pulse, out)
+        elif "ondulant" in phase_lower or "flottant" in phase_lower:
+            out[...] = self.get_drapeau_flottant_colors(positions, time_val, shading)
+            return out
+        elif "niger" in phase_lower:
+            return self._breathing_gold(time_val, out)
+        elif "pluie" in phase_lower and "drapeau" in phase_lower:
+            bands = np.array([self._rgb(name) for name in ('vert_espoir', 'blanc_pure', 'orange_niger')])
+            out[...] = bands[np.digitize(positions[1], [-0.3, 0.3], right=True)]
+            return out
+        elif any(text in phase_lower for text in ['anem', 'jcn', 'edition', 'fes', 'meknes']):
+            return self._breathing_gold(time_val, out)
+        elif "carte" in phase_lower:
+            base = np.array([self.hex_to_rgb(c) for c in self.drapeau_colors], dtype=float)[index % 3]
+            variation = 0.9 + 0.1 * np.sin(2 * np.pi * 0.2 * time_val + index * 0.05)
+            return self._scaled(base, variation, out)
+        elif "finale" in phase_lower or "etoile" in phase_lower:
+            hue = (time_val * 0.5 + index * 0.01) % 1.0
+            return self._scaled(_hsv_to_rgb(hue, 0.9, 0.9), 255, out)
+
+        return self._scaled(self._rgb('orange_niger'), 1.0, out)
+
+    def _rgb(self, name):
+        return np.array(self.hex_to_rgb(self.colors[name]), dtype=float)
+
+    def _breathing_gold(self, time_val, out):
+        breath = 0.85 + 0.15 * np.sin(2 * np.pi * 0.3 * time_val)
+        return self._scaled(self._rgb('or_soleil'), breath, out)
+
+    def _scaled(self, rgb, factor, out):
+        """int(channel * factor) clamped to [0, 255], per robot if factor is an array."""
+        factor = np.asarray(factor, dtype=float)
+        if factor.ndim:
+            factor = factor[:, None]
+        out[...] = np.clip(np.trunc(rgb * factor), 0, 255)
+        return out
+
     # ========== HELPER METHODS FOR OTHER PROJECTS ==========
     
     def _get_wave_color(self, positions, robot_index, time_val):
@@ -277,4 +365,17 @@ class ColorAnimator:
         """Parade dynamic colors."""
         hue = (time_val * 0.3 + robot_index * 0.02) % 1.0
         rgb = colorsys.hsv_to_rgb(hue, 0.8, 0.9)
-        return self.rgb_to_hex(int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
\ No newline at end of file
+        return self.rgb_to_hex(int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
+
+def _hsv_to_rgb(h, s, v):
+    """Vectorized colorsys.hsv_to_rgb (same operations, same results): (N, 3) floats."""
+    h = np.asarray(h, dtype=float)
+    i = np.trunc(h * 6.0)
+    f = (h * 6.0) - i
+    p = np.full_like(h, v * (1.0 - s))
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    v = np.full_like(h, v)
+    sector = i.astype(int) % 6
+    choices = [(v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q)]
+    return np.stack([np.choose(sector, [c[k] for c in choices]) for k in range(3)], axis=1)
@@ -0,0 +1,138 @@
+# src/animations/flow_field.py
+"""
+CHAMPS D'ÉCOULEMENT (TEMPÊTES, TOURBILLONS)
+Superposition de tourbillons, puits, vent uniforme et bruit de rotationnel
+(curl noise, sans divergence: les robots ne s'agglutinent pas), évaluée
+pour tous les robots en une passe vectorisée. Un champ peut aussi être
+pré-calculé sur une grille (texture de vitesses) puis échantillonné par
+interpolation bilinéaire.
+"""
+
+import numpy as np
+
+
+class FlowField:
+    """Champ de déplacement 2D: somme de composantes évaluées sur (2, N) positions."""
+
+    def __init__(self):
+        self.components = []
+
+    # ========== COMPOSANTES ==========
+
+    def add_vortex(self, center, strength=0.1, radius=0.6):
+        """
+        Tourbillon (sens trigonométrique si strength > 0): vitesse tangentielle
+        strength·(radius - d)/radius, nulle au-delà de radius.
+        """
+        self.components.append(('vortex', np.asarray(center, dtype=float), strength, radius))
+        return self
+
+    def add_sink(self, center, strength=0.1, radius=0.6):
+        """Puits (strength > 0) ou source (< 0): vitesse radiale, même décroissance."""
+        self.components.append(('sink', np.asarray(center, dtype=float), strength, radius))
+        return self
+
+    def add_wind(self, velocity, gust=0.0, gust_frequency=0.5):
+        """Vent uniforme, éventuellement en rafales: velocity·(1 + gust·sin(2π f t))."""
+        self.components.append(('wind', np.asarray(velocity, dtype=float), gust, gust_frequency))
+        return self
+
+    def add_curl_noise(self, rng, amplitude=0.05, scale=1.0, speed=0.2, octaves=4):
+        """
+        Bruit de rotationnel d'un potentiel ψ = Σ sin(k·p + ω t + φ) / |k|:
+        v = (∂ψ/∂y, -∂ψ/∂x), dérivées analytiques. rng (flux du spectacle,
+        ShowRandom.stream) fixe directions et phases.
+        """
+        angle = rng.uniform(0, 2 * np.pi, octaves)
+        norm = scale * 2.0 ** np.arange(octaves)
+        waves = norm[:, None] * np.array([np.cos(angle), np.sin(angle)]).T   # (octaves, 2)
+        phase = rng.uniform(0, 2 * np.pi, octaves)
+        omega = speed * 2 * np.pi * norm / scale
+        self.components.append(('curl', waves, phase, omega, amplitude / np.sqrt(octaves)))
+        return self
+
+    # ========== ÉVALUATION ==========
+
+    def velocity(self, positions, time_val=0.0, out=None):
+        """Vitesse (2, N) du champ aux positions données (toutes composantes sommées)."""
+        x, y = positions[0], positions[1]
+        if out is None:
+            out = np.zeros((2, x.shape[0]))
+        else:
+            out[...] = 0.0
+        for component in self.components:
+            kind = component[0]
+            if kind in ('vortex', 'sink'):
+                _, center, strength, radius = component
+                dx, dy = x - center[0], y - center[1]
+                distance = np.hypot(dx, dy)
+                inside = (distance < radius) & (distance > 0)
+                safe = np.where(inside, distance, 1.0)
+                magnitude = np.where(inside, strength * (radius - distance) / radius, 0.0) / safe
+                if kind == 'vortex':
+                    out[0] -= magnitude * dy
+                    out[1] += magnitude * dx
+                else:
+                    out[0] -= magnitude * dx
+                    out[1] -= magnitude * dy
+            elif kind == 'wind':
+                _, wind, gust, frequency = component
+                out += wind[:, None] * (1 + gust * np.sin(2 * np.pi * frequency * time_val))
+            else:
+                _, waves, phase, omega, amplitude = component
+                arg = waves @ positions[:2] + (phase + omega * time_val)[:, None]   # (octaves, N)
+                weight = np.cos(arg) / np.linalg.norm(waves, axis=1)[:, None]
+                # ψ = Σ sin(arg)/|k| -> ∇ψ = Σ k·cos(arg)/|k|
+                grad = waves.T @ weight
+                out[0] += amplitude * grad[1]
+                out[1] -= amplitude * grad[0]
+        return out
+
+    def advect(self, positions, time_val, dt, bounds=None, out=None):
+        """
+        Un pas d'Euler: positions + v·dt. bounds (x_min, x_max, y_min, y_max):
+        les robots sortis réapparaissent du côté opposé (tempête continue).
+        """
+        out = np.array(positions, dtype=float) if out is None else out
+        if out is not positions:
+            out[...] = positions
+        out[:2] += self.velocity(positions, time_val) * dt
+        if bounds is not None:
+            x_min, x_max, y_min, y_max = bounds
+            out[0] = x_min + np.mod(out[0] - x_min, x_max - x_min)
+            out[1] = y_min + np.mod(out[1] - y_min, y_max - y_min)
+        return out
+
+    def bake(self, bounds, resolution=(64, 40), time_val=0.0):
+        """Pré-calcule le champ sur une grille: texture de vitesses échantillonnable."""
+        x_min, x_max, y_min, y_max = bounds
+        width, height = resolution
+        xx, yy = np.meshgrid(np.linspace(x_min, x_max, width), np.linspace(y_min, y_max, height))
+        grid = self.velocity(np.array([xx.ravel(), yy.ravel()]), time_val)
+        return VelocityGrid(grid.reshape(2, height, width), bounds)
+
+
+class VelocityGrid:
+    """Texture de vitesses (2, H, W) sur bounds, lue par interpolation bilinéaire."""
+
+    def __init__(self, grid, bounds):
+        self.grid = np.asarray(grid, dtype=float)
+        self.bounds = bounds
+
+    def sample(self, positions, out=None):
+        """Vitesses (2, N) aux positions (bord de grille tenu hors limites)."""
+        x_min, x_max, y_min, y_max = self.bounds
+        height, width = self.grid.shape[1:]
+        gx = np.clip((positions[0] - x_min) / (x_max - x_min) * (width - 1), 0, width - 1)
+        gy = np.clip((positions[1] - y_min) / (y_max - y_min) * (height - 1), 0, height - 1)
+        x0 = np.minimum(gx.astype(int), width - 2)
+        y0 = np.minimum(gy.astype(int), height - 2)
+        fx, fy = gx - x0, gy - y0
+        g = self.grid
+        top = g[:, y0, x0] * (1 - fx) + g[:, y0, x0 + 1] * fx
+        bottom = g[:, y0 + 1, x0] * (1 - fx) + g[:, y0 + 1, x0 + 1] * fx
+        result = top * (1 - fy) + bottom * fy
+        if out is None:
+            return result
+        out[...] = result
+        return out
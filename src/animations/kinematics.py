@@ -0,0 +1,93 @@
+# src/animations/kinematics.py
+"""
+CINÉMATIQUE VECTORISÉE
+Noyaux de mouvement évalués sur tout l'essaim en quelques opérations de
+tableaux: rotation différentielle, pulsation autour d'un centre, transformées
+affines. Les grandeurs statiques (rayons, vitesses angulaires) sont calculées
+une fois par phase; chaque noyau peut écrire dans un tampon préalloué (out).
+"""
+
+import numpy as np
+
+
+class DifferentialRotation:
+    """
+    Rotation différentielle type galaxie: ω(r) = omega / (1 + k·r).
+
+    Le rayon et la vitesse angulaire de chaque robot sont figés à la
+    construction (positions de base statiques pendant la phase).
+    """
+
+    def __init__(self, base_positions, omega=0.5, k=2.0, center=(0.0, 0.0)):
+        base = np.asarray(base_positions, dtype=float)
+        self.center = np.asarray(center, dtype=float).reshape(2, 1)
+        self.rel = base[:2] - self.center
+        self.radius = np.hypot(self.rel[0], self.rel[1])
+        self.angular_speed = omega / (1.0 + k * self.radius)
+        # Tampons de travail réutilisés à chaque frame
+        self._angle = np.empty_like(self.radius)
+        self._cos = np.empty_like(self.radius)
+        self._sin = np.empty_like(self.radius)
+        self._tmp = np.empty_like(self.radius)
+
+    @property
+    def n(self):
+        return self.radius.shape[0]
+
+    def evaluate(self, time_val, out=None):
+        """Positions (2, N) à l'instant time_val (angle = ω(r)·t)."""
+        if out is None:
+            out = np.empty_like(self.rel)
+        np.multiply(self.angular_speed, time_val, out=self._angle)
+        np.cos(self._angle, out=self._cos)
+        np.sin(self._angle, out=self._sin)
+        x, y = self.rel
+        # x' = cx + x·cos - y·sin
+        np.multiply(x, self._cos, out=out[0])
+        np.multiply(y, self._sin, out=self._tmp)
+        out[0] -= self._tmp
+        out[0] += self.center[0]
+        # y' = cy + x·sin + y·cos
+        np.multiply(x, self._sin, out=out[1])
+        np.multiply(y, self._cos, out=self._tmp)
+        out[1] += self._tmp
+        out[1] += self.center[1]
+        return out
+
+
+def pulsate(positions, factor, center=None, out=None):
+    """
+    Dilatation (factor > 1) ou contraction autour d'un centre.
+
+    center=None: centre de masse de l'essaim (recalculé sur positions).
+    out peut être positions lui-même (mise à l'échelle en place).
+    """
+    if center is None:
+        center = positions.mean(axis=1, keepdims=True)
+    else:
+        center = np.asarray(center, dtype=float).reshape(-1, 1)[:positions.shape[0]]
+    if out is None:
+        out = np.empty_like(positions, dtype=float)
+    np.subtract(positions, center, out=out)
+    out *= factor
+    out += center
+    return out
+
+
+def affine(positions, matrix, offset=None, out=None):
+    """Transformée affine M·p + offset sur un tableau (dims, N)."""
+    matrix = np.asarray(matrix, dtype=float)
+    if out is None:
+        out = np.empty((matrix.shape[0], positions.shape[1]))
+    elif out is positions:
+        positions = positions.copy()  # matmul ne supporte pas l'aliasing
+    np.matmul(matrix, positions, out=out)
+    if offset is not None:
+        out += np.asarray(offset, dtype=float).reshape(-1, 1)
+    return out
+
+
+def rotation_matrix(angle, scale=1.0):
+    """Matrice 2x2 de rotation (et mise à l'échelle uniforme)."""
+    c, s = np.cos(angle) * scale, np.sin(angle) * scale
+    return np.array([[c, -s], [s, c]])
@@ -4,12 +4,14 @@ ANIMATIONS DE MOUVEMENT
 """
 
 import numpy as np
+from utils.random_streams import ShowRandom
 
 class MotionAnimator:
     """Gestionnaire de mouvements dynamiques."""
     
-    def __init__(self):
-        pass
+    def __init__(self, seed=None):
+        self.random = ShowRandom(seed)  # Flux aléatoires du spectacle propriétaire
+        self._jitter_calls = 0  # Clé de frame des tremblements sans temps ni rng
         
     def wave(self, positions, time_val, amplitude=0.1, frequency=1.0, direction='x'):
         """Applique une ondulation aux positions."""
@@ -26,9 +28,19 @@ class MotionAnimator:
             
         return new_pos
 
-    def jitter(self, positions, magnitude=0.01):
-        """Ajoute un bruit aléatoire (tremblement)."""
-        noise = np.random.uniform(-magnitude, magnitude, positions.shape)
+    def jitter(self, positions, magnitude=0.01, rng=None, time_val=None):
+        """
+        Ajoute un bruit aléatoire (tremblement), tiré depuis rng (flux du show),
+        sinon depuis le flux de la frame de time_val, sinon d'un flux neuf par appel
+        (flux dérivés de la graine de l'animateur).
+        """
+        if rng is None:
+            if time_val is not None:
+                rng = self.random.at_time('jitter', time_val)
+            else:
+                rng = self.random.stream('jitter', self._jitter_calls)
+                self._jitter_calls += 1
+        noise = rng.uniform(-magnitude, magnitude, positions.shape)
         return positions + noise
     
     def rotate(self, positions, angle, center=(0, 0)):
@@ -0,0 +1,142 @@
+# src/animations/particles.py
+"""
+SYSTÈME DE PARTICULES DÉCORATIVES (POOL SoA)
+Sable, étincelles, gouttes d'encre, étoiles: des dizaines de milliers de
+particules purement visuelles, indépendantes des robots.
+
+Stockage en structure de tableaux de capacité fixe (position, vitesse, âge,
+durée de vie, indice de couleur). Les particules vivantes occupent
+toujours le préfixe [0, count): émettre écrit à la suite, et les mortes sont
+remplacées par les vivantes de la fin du préfixe (compaction de la liste
+libre, sans réallocation). L'intégration est vectorisée sur le préfixe.
+"""
+
+import numpy as np
+
+
+class ParticlePool:
+    """Pool de capacity particules en dims dimensions."""
+
+    def __init__(self, capacity, rng, dims=2, palette=None):
+        self.capacity = capacity
+        self.dims = dims
+        self.pos = np.zeros((dims, capacity))
+        self.vel = np.zeros((dims, capacity))
+        self.age = np.zeros(capacity)
+        self.lifetime = np.full(capacity, np.inf)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self.palette = list(palette) if palette is not None else ['#ffffff']
+        self.rng = rng   # Flux du spectacle (ShowRandom.stream): aléa propre à la graine
+        self.count = 0
+        self.dropped = 0   # Émissions refusées faute de place
+        self.time = 0.0
+
+    # ========== VUES SUR LES VIVANTES ==========
+
+    @property
+    def positions(self):
+        """Positions (dims, count) des particules vivantes (vue)."""
+        return self.pos[:, :self.count]
+
+    @property
+    def velocities(self):
+        return self.vel[:, :self.count]
+
+    def fade(self, out=None):
+        """Opacité (count,): 1 à la naissance, 0 en fin de vie (1 si immortelle)."""
+        age, life = self.age[:self.count], self.lifetime[:self.count]
+        out = np.empty(self.count) if out is None else out[:self.count]
+        np.divide(age, life, out=out)
+        np.subtract(1.0, out, out=out)
+        return np.clip(out, 0.0, 1.0, out=out)
+
+    def colors(self):
+        """Couleurs hex des particules vivantes (pour matplotlib)."""
+        palette = np.asarray(self.palette)
+        return palette[self.color[:self.count]]
+
+    # ========== ÉMISSION / DESTRUCTION ==========
+
+    def emit(self, n, position, velocity=0.0, lifetime=np.inf, color=0,
+             position_spread=0.0, velocity_spread=0.0):
+        """
+        Émet jusqu'à n particules (le surplus au-delà de la capacité est
+        compté dans dropped). position/velocity: (dims,) ou (dims, n);
+        spread: écart-type gaussien ajouté. Renvoie la tranche des nouvelles.
+        """
+        free = self.capacity - self.count
+        accepted = min(n, free)
+        self.dropped += n - accepted
+        new = slice(self.count, self.count + accepted)
+        if accepted == 0:
+            return new
+        self.pos[:, new] = self._columns(position, n)[:, :accepted]
+        self.vel[:, new] = self._columns(velocity, n)[:, :accepted]
+        if position_spread:
+            self.pos[:, new] += self.rng.normal(0.0, position_spread, (self.dims, accepted))
+        if velocity_spread:
+            self.vel[:, new] += self.rng.normal(0.0, velocity_spread, (self.dims, accepted))
+        self.age[new] = 0.0
+        self.lifetime[new] = np.broadcast_to(lifetime, (n,))[:accepted]
+        self.color[new] = np.broadcast_to(color, (n,))[:accepted]
+        self.count += accepted
+        return new
+
+    def _columns(self, value, n):
+        """Diffuse un scalaire, un vecteur (dims,) ou un tableau (dims, n) en (dims, n)."""
+        value = np.asarray(value, dtype=float)
+        if value.ndim == 1:
+            value = value[:, None]
+        return np.broadcast_to(value, (self.dims, n))
+
+    def kill(self, dead):
+        """
+        Supprime les particules du masque dead (count,) en comblant les trous
+        avec les vivantes de la fin du préfixe (l'ordre n'est pas conservé).
+        """
+        dead_idx = np.flatnonzero(dead[:self.count])
+        if len(dead_idx) == 0:
+            return 0
+        new_count = self.count - len(dead_idx)
+        holes = dead_idx[dead_idx < new_count]
+        tail = np.arange(new_count, self.count)
+        movers = tail[~dead[new_count:self.count]]
+        self.pos[:, holes] = self.pos[:, movers]
+        self.vel[:, holes] = self.vel[:, movers]
+        self.age[holes] = self.age[movers]
+        self.lifetime[holes] = self.lifetime[movers]
+        self.color[holes] = self.color[movers]
+        self.count = new_count
+        return len(dead_idx)
+
+    def clear(self):
+        self.count = 0
+
+    # ========== INTÉGRATION ==========
+
+    def step(self, dt, gravity=None, drag=0.0, field=None, bounds=None, time_val=None):
+        """
+        Avance les particules de dt: vieillissement et mort, gravité,
+        traînée (fraction de vitesse perdue par seconde), transport par un
+        champ d'écoulement (FlowField, évalué à time_val si donné) et repli
+        aux bornes (x_min, x_max, y_min, y_max) pour les particules permanentes.
+        """
+        self.time = self.time + dt if time_val is None else time_val
+        n = self.count
+        age = self.age[:n]
+        age += dt
+        self.kill(age >= self.lifetime[:n])
+        n = self.count
+        pos, vel = self.pos[:, :n], self.vel[:, :n]
+        if gravity is not None:
+            vel += np.reshape(gravity, (-1, 1)) * dt
+        if drag:
+            vel *= max(0.0, 1.0 - drag * dt)
+        pos += vel * dt
+        if field is not None:
+            pos[:2] += field.velocity(pos[:2], self.time) * dt
+        if bounds is not None:
+            x_min, x_max, y_min, y_max = bounds
+            pos[0] = x_min + np.mod(pos[0] - x_min, x_max - x_min)
+            pos[1] = y_min + np.mod(pos[1] - y_min, y_max - y_min)
+        return self.positions
@@ -0,0 +1,149 @@
+# src/animations/splines.py
+"""
+TRAJECTOIRES SPLINES MULTI-IMAGES CLÉS
+Au lieu d'enchaîner des interpolations linéaires entre deux formations
+(vitesse discontinue à chaque changement de phase), une spline passe par
+toute la suite de formations pour les N robots à la fois:
+- 'cubic': spline cubique C2 (accélération continue), coefficients obtenus
+  par un seul système tridiagonal résolu pour toutes les coordonnées;
+- 'catmull_rom': spline de Catmull-Rom C1, locale (une formation ne
+  modifie que les deux segments voisins).
+Les robots partent et arrivent au repos (vitesse nulle aux extrémités).
+"""
+
+import numpy as np
+
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    """
+    Algorithme de Thomas vectorisé: résout A·x = rhs pour toutes les colonnes.
+
+    lower, diag, upper: diagonales (K,) (lower[0] et upper[-1] ignorés);
+    rhs: (K, M), une colonne par coordonnée de robot.
+    """
+    k = len(diag)
+    c = np.empty(k)
+    d = np.empty_like(rhs, dtype=float)
+    c[0] = upper[0] / diag[0]
+    d[0] = rhs[0] / diag[0]
+    for i in range(1, k):
+        denom = diag[i] - lower[i] * c[i-1]
+        c[i] = upper[i] / denom if i < k - 1 else 0.0
+        d[i] = (rhs[i] - lower[i] * d[i-1]) / denom
+    for i in range(k - 2, -1, -1):
+        d[i] -= c[i] * d[i+1]
+    return d
+
+
+class SplineTrajectory:
+    """
+    Trajectoire passant par formations[k] à l'instant times[k].
+
+    formations: (K, dims, N); la trajectoire s'évalue à n'importe quel
+    instant (tenue de la première/dernière formation hors de [t0, tK]).
+    """
+
+    def __init__(self, times, formations, method='cubic', start_velocity=None, end_velocity=None):
+        self.times = np.asarray(times, dtype=float)
+        points = np.asarray(formations, dtype=float)
+        if points.shape[0] != len(self.times) or len(self.times) < 2:
+            raise ValueError("Il faut au moins deux formations, une par instant")
+        if np.any(np.diff(self.times) <= 0):
+            raise ValueError("Les instants doivent être strictement croissants")
+        if method not in ('cubic', 'catmull_rom'):
+            raise ValueError(f"Méthode de spline inconnue: {method}")
+        self.method = method
+        self.shape = points.shape[1:]
+        self.points = points.reshape(len(self.times), -1)  # (K, dims·N)
+        zero = np.zeros(self.points.shape[1])
+        v0 = zero if start_velocity is None else np.asarray(start_velocity, dtype=float).reshape(-1)
+        vn = zero if end_velocity is None else np.asarray(end_velocity, dtype=float).reshape(-1)
+        self.h = np.diff(self.times)
+        self.slopes = np.diff(self.points, axis=0) / self.h[:, None]
+
+        if method == 'cubic':
+            self.second = self._second_derivatives(v0, vn)
+        else:
+            self.tangents = self._catmull_rom_tangents(v0, vn)
+
+    def _second_derivatives(self, v0, vn):
+        """Dérivées secondes aux nœuds d'une spline cubique à pentes imposées aux bords."""
+        h, slopes = self.h, self.slopes
+        k = len(self.times)
+        lower = np.zeros(k)
+        diag = np.empty(k)
+        upper = np.zeros(k)
+        rhs = np.empty_like(self.points)
+        diag[0], upper[0] = 2 * h[0], h[0]
+        rhs[0] = 6 * (slopes[0] - v0)
+        lower[1:-1], diag[1:-1], upper[1:-1] = h[:-1], 2 * (h[:-1] + h[1:]), h[1:]
+        rhs[1:-1] = 6 * (slopes[1:] - slopes[:-1])
+        lower[-1], diag[-1] = h[-1], 2 * h[-1]
+        rhs[-1] = 6 * (vn - slopes[-1])
+        return solve_tridiagonal(lower, diag, upper, rhs)
+
+    def _catmull_rom_tangents(self, v0, vn):
+        """Tangentes de Catmull-Rom non uniformes: (p[i+1] - p[i-1]) / (t[i+1] - t[i-1])."""
+        tangents = np.empty_like(self.points)
+        tangents[0], tangents[-1] = v0, vn
+        span = (self.times[2:] - self.times[:-2])[:, None]
+        tangents[1:-1] = (self.points[2:] - self.points[:-2]) / span
+        return tangents
+
+    @property
+    def duration(self):
+        return self.times[-1] - self.times[0]
+
+    def _locate(self, t):
+        t = np.clip(np.asarray(t, dtype=float), self.times[0], self.times[-1])
+        seg = np.clip(np.searchsorted(self.times, t, side='right') - 1, 0, len(self.h) - 1)
+        h = self.h[seg][..., None]
+        u = (t - self.times[seg])[..., None] / h
+        return seg, u, h
+
+    def evaluate(self, t, derivative=0, out=None):
+        """
+        Positions (dims, N) à l'instant t, ou (T, dims, N) pour un tableau d'instants.
+
+        derivative=1 donne les vitesses, derivative=2 les accélérations.
+        """
+        scalar = np.ndim(t) == 0
+        seg, u, h = self._locate(np.atleast_1d(t))
+        p0, p1 = self.points[seg], self.points[seg + 1]
+
+        if self.method == 'cubic':
+            m0, m1 = self.second[seg], self.second[seg + 1]
+            a, b = 1 - u, u
+            if derivative == 0:
+                value = a * p0 + b * p1 + ((a**3 - a) * m0 + (b**3 - b) * m1) * h**2 / 6
+            elif derivative == 1:
+                value = self.slopes[seg] + ((1 - 3 * a**2) * m0 + (3 * b**2 - 1) * m1) * h / 6
+            else:
+                value = a * m0 + b * m1
+        else:
+            m0, m1 = self.tangents[seg] * h, self.tangents[seg + 1] * h
+            if derivative == 0:
+                u2, u3 = u * u, u * u * u
+                value = ((2*u3 - 3*u2 + 1) * p0 + (u3 - 2*u2 + u) * m0
+                         + (-2*u3 + 3*u2) * p1 + (u3 - u2) * m1)
+            elif derivative == 1:
+                u2 = u * u
+                value = ((6*u2 - 6*u) * p0 + (3*u2 - 4*u + 1) * m0
+                         + (-6*u2 + 6*u) * p1 + (3*u2 - 2*u) * m1) / h
+            else:
+                value = ((12*u - 6) * p0 + (6*u - 4) * m0
+                         + (-12*u + 6) * p1 + (6*u - 2) * m1) / h**2
+
+        value = value.reshape((-1,) + self.shape)
+        if scalar:
+            value = value[0]
+        if out is None:
+            return value
+        out[...] = value
+        return out
+
+    def frames(self, fps=30):
+        """Générateur des positions à fps images/s sur toute la trajectoire."""
+        steps = int(round(self.duration * fps))
+        for step in range(steps):
+            yield self.evaluate(self.times[0] + step / fps)
@@ -0,0 +1,92 @@
+# src/animations/time_scaling.py
+"""
+PLANIFICATION DES TRANSITIONS EN TEMPS MINIMAL
+Au lieu d'une durée fixée à la main, la durée d'une transition est la plus
+courte qui respecte la vitesse (MAX_LINEAR_VELOCITY) et l'accélération
+(MAX_LINEAR_ACCELERATION) du robot le plus éloigné. Chaque robot suit
+ensuite un profil de vitesse trapézoïdal à la même accélération, avec sa
+propre vitesse de croisière, pour que tous arrivent ensemble.
+"""
+
+import numpy as np
+from utils.config import config
+
+
+def minimum_time(distance, max_speed, max_accel):
+    """
+    Durée minimale d'un trajet départ/arrivée à l'arrêt (vectorisé).
+
+    Profil trapézoïdal si la vitesse maximale est atteinte (d ≥ v²/a),
+    triangulaire sinon.
+    """
+    distance = np.asarray(distance, dtype=float)
+    trapezoid = distance / max_speed + max_speed / max_accel
+    triangle = 2 * np.sqrt(distance / max_accel)
+    return np.where(distance >= max_speed**2 / max_accel, trapezoid, triangle)
+
+
+class TrapezoidalPlan:
+    """
+    Transition synchronisée start -> end: tous les robots partent et
+    arrivent ensemble, accélération bornée, vitesse de croisière propre à
+    chaque robot.
+    """
+
+    def __init__(self, start_pos, end_pos, duration=None, max_speed=None, max_accel=None):
+        """
+        duration=None: durée minimale faisable. Une durée plus courte que le
+        minimum lève ValueError; une durée plus longue ralentit les robots.
+        """
+        self.start = np.asarray(start_pos, dtype=float)
+        self.end = np.asarray(end_pos, dtype=float)
+        if self.start.shape != self.end.shape:
+            raise ValueError(f"Formations incompatibles: {self.start.shape} et {self.end.shape}")
+        self.max_speed = max_speed or config.MAX_LINEAR_VELOCITY
+        self.max_accel = max_accel or config.MAX_LINEAR_ACCELERATION
+        self.delta = self.end - self.start
+        self.distance = np.sqrt(np.sum(self.delta**2, axis=0))  # (N,)
+
+        self.minimum_duration = float(np.max(minimum_time(self.distance, self.max_speed, self.max_accel),
+                                             initial=0.0))
+        if duration is None:
+            duration = self.minimum_duration
+        elif duration < self.minimum_duration - 1e-9:
+            raise ValueError(f"Transition de {duration:.2f}s infaisable: "
+                             f"minimum {self.minimum_duration:.2f}s")
+        self.duration = float(duration)
+
+        # Vitesse de croisière v telle que d = v·T - v²/a (accélération a commune)
+        a, T = self.max_accel, self.duration
+        discriminant = np.maximum(a * a * T * T - 4 * a * self.distance, 0.0)
+        self.cruise_speed = (a * T - np.sqrt(discriminant)) / 2
+        self.accel_time = self.cruise_speed / a
+
+    def progress(self, t):
+        """Fraction du trajet parcourue par chaque robot: (N,) ou (T, N) pour un tableau d'instants."""
+        t = np.clip(np.asarray(t, dtype=float), 0.0, self.duration)[..., None]
+        a, v, tau, T = self.max_accel, self.cruise_speed, self.accel_time, self.duration
+        covered = np.where(t < tau, 0.5 * a * t * t,
+                           np.where(t <= T - tau, 0.5 * a * tau * tau + v * (t - tau),
+                                    self.distance - 0.5 * a * (T - t)**2))
+        return np.divide(covered, self.distance, out=np.ones_like(covered), where=self.distance > 0)
+
+    def evaluate(self, t):
+        """Positions (dims, N) à l'instant t (depuis le début de la transition), ou (T, dims, N)."""
+        progress = self.progress(t)
+        return self.start + self.delta * progress[..., None, :]
+
+    def speed(self, t):
+        """Vitesse scalaire de chaque robot à l'instant t."""
+        t = np.clip(np.asarray(t, dtype=float), 0.0, self.duration)[..., None]
+        a, v, T = self.max_accel, self.cruise_speed, self.duration
+        return np.minimum(np.minimum(a * t, v), a * (T - t))
+
+    def n_frames(self, fps=None):
+        return int(np.ceil(self.duration * (fps or config.FPS) - 1e-9))
+
+    def frames(self, fps=None):
+        """Générateur des positions; la dernière frame est exactement la cible."""
+        fps = fps or config.FPS
+        steps = self.n_frames(fps)
+        for step in range(1, steps + 1):
+            yield self.evaluate(min(step / fps, self.duration))
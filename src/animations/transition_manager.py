@@ -4,6 +4,8 @@ GESTIONNAIRE DE TRANSITIONS - VERSION COMPLÈTE
 """
 
 import numpy as np
+from animations.splines import SplineTrajectory
+from animations.time_scaling import TrapezoidalPlan
 
 class TransitionManager:
     """Gère les transitions fluides entre différentes formations."""
@@ -38,17 +40,47 @@ class TransitionManager:
         return np.sin(13 * np.pi / 2 * t) * np.power(2, -10 * t)
     
     def interpolate_positions(self, start_pos, end_pos, duration, 
-                            transition_type='ease_in_out', fps=30):
+                            transition_type='ease_in_out', fps=30, buffers=None):
         """
         Génère des positions intermédiaires pour une transition fluide.
+
+        buffers (FrameBuffers): chaque frame est écrite en place dans le
+        prochain tampon au lieu d'un tableau neuf (voir utils.frame_buffers).
         """
         steps = int(duration * fps)
         transition_func = self.transition_functions[transition_type]
-        
+
+        if buffers is not None:
+            # Départ et écart figés une fois: start_pos peut être un tampon de l'anneau
+            start = buffers.snapshot(start_pos)
+            delta = buffers.snapshot(end_pos)
+            delta -= start
+
         for step in range(steps):
             t = step / steps
             progress = transition_func(t)
-            
+
             # Interpolation linéaire des positions
-            current_pos = start_pos + (end_pos - start_pos) * progress
-            yield current_pos
\ No newline at end of file
+            if buffers is None:
+                current_pos = start_pos + (end_pos - start_pos) * progress
+            else:
+                current_pos = np.multiply(delta, progress, out=buffers.next())
+                current_pos += start
+            yield current_pos
+    
+    def interpolate_keyframes(self, formations, durations, method='cubic', fps=30):
+        """
+        Enchaîne plusieurs formations sur une seule spline (vitesse continue
+        aux changements de formation). durations[k]: temps pour aller de
+        formations[k] à formations[k+1].
+        """
+        times = np.concatenate([[0.0], np.cumsum(durations)])
+        trajectory = SplineTrajectory(times, np.stack(formations), method)
+        yield from trajectory.frames(fps)
+
+    def interpolate_timed(self, start_pos, end_pos, duration=None, fps=30):
+        """
+        Transition en temps minimal (ou en duration secondes si faisable):
+        profils trapézoïdaux synchronisés, vitesse et accélération bornées.
+        """
+        yield from TrapezoidalPlan(start_pos, end_pos, duration).frames(fps)
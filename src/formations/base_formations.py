@@ -5,13 +5,22 @@ FORMATIONS GÉOMÉTRIQUES DE BASE - VERSION COMPLÈTE
 
 import numpy as np
 from utils.config import config
+from utils.random_streams import ShowRandom
+
+def split_counts(total, parts):
+    """Répartit total robots en parts groupes (les premiers reçoivent le reste)."""
+    counts = np.full(parts, total // parts)
+    counts[:total % parts] += 1
+    return counts
 
 class BaseFormations:
     """Bibliothèque de formations géométriques fondamentales."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.zone = config.safe_zone
+        self.random = ShowRandom(seed)  # Graine des tirages sans rng
+        self._random_draws = 0  # Clé de frame des tirages sans rng (un flux neuf par appel)
     
     def grid(self, rows=5, cols=10):
         """Grille rectangulaire parfaite."""
@@ -37,10 +46,17 @@ class BaseFormations:
         y = r * np.sin(theta)
         return np.array([x, y])
     
-    def random_positions(self):
-        """Positions aléatoires dans la zone sûre."""
-        x = np.random.uniform(self.zone['x_min'], self.zone['x_max'], self.n)
-        y = np.random.uniform(self.zone['y_min'], self.zone['y_max'], self.n)
+    def random_positions(self, rng=None):
+        """
+        Positions aléatoires dans la zone sûre (rng: flux du show). Sans rng,
+        chaque appel tire dans le flux suivant de la graine seed: reproductible
+        d'une exécution à l'autre sans renvoyer deux fois les mêmes positions.
+        """
+        if rng is None:
+            rng = self.random.stream('random_positions', self._random_draws)
+            self._random_draws += 1
+        x = rng.uniform(self.zone['x_min'], self.zone['x_max'], self.n)
+        y = rng.uniform(self.zone['y_min'], self.zone['y_max'], self.n)
         return np.array([x, y])
     
     def line(self, start=(-1.0, 0), end=(1.0, 0)):
@@ -75,4 +91,17 @@ class BaseFormations:
             positions.extend(zip(segment_x, segment_y))
         
         positions = np.array(positions[:self.n]).T
-        return positions
\ No newline at end of file
+        return positions
+    
+    def polygon(self, vertices):
+        """
+        Contour d'un polygone fermé (sommets (k, 2)): robots répartis côté par
+        côté, sans doublon aux sommets, quel que soit N.
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        counts = split_counts(self.n, len(vertices))
+        side = np.repeat(np.arange(len(vertices)), counts)
+        offsets = np.cumsum(counts) - counts
+        t = (np.arange(self.n) - offsets[side]) / counts[side]
+        start, end = vertices[side], vertices[(side + 1) % len(vertices)]
+        return (start + t[:, None] * (end - start)).T
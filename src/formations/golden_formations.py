@@ -0,0 +1,142 @@
+# src/formations/golden_formations.py
+"""
+FORMATIONS DORÉES (PHYLLOTAXIE)
+Spirale de Vogel, tournesol, rectangles dorés et carrés de Fibonacci,
+calculés par arithmétique d'indices vectorisée. Chaque formation est
+mémorisée par (N, paramètres): les tableaux renvoyés sont partagés et en
+lecture seule (copier avant de les modifier).
+"""
+
+import numpy as np
+from formations.base_formations import BaseFormations
+
+PHI = (1 + np.sqrt(5)) / 2          # Nombre d'or
+GOLDEN_ANGLE = 2 * np.pi / PHI**2    # Angle d'or (~137.5°)
+
+# Cache partagé entre instances: (formation, N, paramètres) -> tableau (2, N)
+_CACHE = {}
+
+
+def fibonacci_numbers(n):
+    """Les n premiers termes de la suite de Fibonacci (0, 1, 1, 2, ...)."""
+    fib = [0, 1]
+    for i in range(2, n):
+        fib.append(fib[i-1] + fib[i-2])
+    return fib[:n]
+
+
+def _memoized(name, n, params, build):
+    key = (name, n) + tuple(params)
+    positions = _CACHE.get(key)
+    if positions is None:
+        positions = build()
+        positions.setflags(write=False)
+        _CACHE[key] = positions
+    return positions
+
+
+def _grid_points(x_range, y_range, side, count):
+    """Les count premiers points d'une grille side x side (ordre de meshgrid().flatten())."""
+    k = np.arange(count)
+    x = np.linspace(x_range[0], x_range[1], side)[k % side]
+    y = np.linspace(y_range[0], y_range[1], side)[k // side]
+    return x, y
+
+
+class GoldenFormations(BaseFormations):
+    """Formations issues du nombre d'or, mémorisées par nombre de robots."""
+
+    def vogel(self, scale=0.1, angle=GOLDEN_ANGLE):
+        """Spirale de Vogel: r = scale·√(i+1), θ = i·angle."""
+        def build():
+            i = np.arange(self.n)
+            r = scale * np.sqrt(i + 1)
+            theta = i * angle
+            return np.array([r * np.cos(theta), r * np.sin(theta)])
+        return _memoized('vogel', self.n, (scale, angle), build)
+
+    def sunflower(self, radius=0.8, alpha=2.0, center=(0.0, 0.0)):
+        """
+        Tournesol remplissant un disque de rayon donné.
+
+        alpha règle le nombre de graines posées sur le bord (≈ alpha·√N),
+        ce qui donne un contour net au lieu d'un bord effiloché.
+        """
+        def build():
+            k = np.arange(1, self.n + 1)
+            n_boundary = min(int(round(alpha * np.sqrt(self.n))), self.n - 1)
+            inner = max(self.n - (n_boundary + 1) / 2, 1.0)
+            r = np.where(k > self.n - n_boundary, 1.0, np.sqrt(k - 0.5) / np.sqrt(inner))
+            r = np.minimum(r, 1.0) * radius
+            theta = k * GOLDEN_ANGLE
+            return np.array([center[0] + r * np.cos(theta), center[1] + r * np.sin(theta)])
+        return _memoized('sunflower', self.n, (radius, alpha) + tuple(center), build)
+
+    def golden_rectangles(self, n_terms=10, unit=0.1, fill=0.7):
+        """
+        Rectangles dorés imbriqués (côtés F(i), F(i+1)) tournant d'un quart de tour.
+
+        fill: part des robots répartie sur les rectangles; le reste suit la
+        spirale de Vogel au centre.
+        """
+        def build():
+            positions = np.zeros((2, self.n))
+            fib = fibonacci_numbers(n_terms)
+            n_rect = int(self.n * fill / len(fib))
+            count = 0
+            cx, cy = 0.0, 0.0
+            direction = 0  # 0: droite, 1: haut, 2: gauche, 3: bas
+
+            for i in range(len(fib) - 1):
+                place = min(n_rect, self.n - count)
+                if place <= 0:
+                    break
+                a, b = fib[i] * unit, fib[i+1] * unit  # Petit et grand côtés
+                side = int(np.sqrt(place))
+                if direction == 0:
+                    x_range, y_range = (cx, cx + b), (cy, cy + a)
+                    cx += b
+                elif direction == 1:
+                    x_range, y_range = (cx - a, cx), (cy, cy + b)
+                    cy += b
+                elif direction == 2:
+                    x_range, y_range = (cx - b, cx), (cy - a, cy)
+                    cx -= b
+                else:
+                    x_range, y_range = (cx, cx + a), (cy - b, cy)
+                    cy -= b
+                n_place = min(place, side * side)
+                positions[:, count:count+n_place] = _grid_points(x_range, y_range, side, n_place)
+                count += n_place
+                direction = (direction + 1) % 4
+
+            if count < self.n:
+                positions[:, count:] = self.vogel()[:, :self.n - count]
+            return positions
+        return _memoized('golden_rectangles', self.n, (n_terms, unit, fill), build)
+
+    def fibonacci_squares(self, n_terms=8, unit=0.08, gap=0.05):
+        """Carrés de côtés F(i) posés alternativement vers la droite et vers le haut."""
+        def build():
+            positions = np.zeros((2, self.n))
+            sizes = [f for f in fibonacci_numbers(n_terms) if f > 0]
+            n_square = int(self.n / len(sizes))
+            count = 0
+            cx, cy = 0.0, 0.0
+
+            for i, size in enumerate(sizes):
+                place = min(n_square, self.n - count)
+                if place <= 0:
+                    break
+                length = size * unit
+                side = max(int(np.sqrt(place)), 2)
+                n_place = min(place, side * side)
+                positions[:, count:count+n_place] = _grid_points(
+                    (cx, cx + length), (cy, cy + length), side, n_place)
+                count += n_place
+                if i % 2 == 0:
+                    cx += length + gap
+                else:
+                    cy += length + gap
+            return positions
+        return _memoized('fibonacci_squares', self.n, (n_terms, unit, gap), build)
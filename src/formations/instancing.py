@@ -0,0 +1,103 @@
+# src/formations/instancing.py
+"""
+INSTANCIATION DE SOUS-FORMATIONS
+Une forme de base (2, M) est construite une fois puis placée K fois
+(troupeaux, caravanes, maisons d'un village) avec une transformée affine
+par instance: translation, échelle, rotation, miroir. Toutes les instances
+sont évaluées par une seule multiplication matricielle groupée; animer une
+frame revient à modifier les transformées, pas à régénérer les points.
+"""
+
+import numpy as np
+
+
+def instance_matrices(translate=None, scale=None, rotate=None, mirror=None, count=None):
+    """
+    Matrices affines (K, 2, 3) = [R(rotate)·S(scale)·Miroir | translate].
+
+    Chaque argument est commun (scalaire, translate (2,)) ou donné par
+    instance (K,); scale accepte aussi (K, 2) pour une échelle anisotrope.
+    mirror retourne la forme selon x (animal tourné dans l'autre sens).
+    """
+    if count is None:
+        count = len(translate) if translate is not None and np.ndim(translate) == 2 else 1
+        for values in (scale, rotate, mirror):
+            if values is not None and np.ndim(values) >= 1:
+                count = max(count, np.shape(values)[0])
+
+    scale = np.ones(count) if scale is None else np.asarray(scale, dtype=float)
+    sx, sy = (scale[:, 0], scale[:, 1]) if scale.ndim == 2 else (scale, scale)
+    sx = np.broadcast_to(sx, (count,)).astype(float)
+    sy = np.broadcast_to(sy, (count,))
+    if mirror is not None:
+        sx = np.where(np.broadcast_to(mirror, (count,)), -sx, sx)
+    angle = np.broadcast_to(0.0 if rotate is None else np.asarray(rotate, dtype=float), (count,))
+    c, s = np.cos(angle), np.sin(angle)
+
+    matrices = np.empty((count, 2, 3))
+    matrices[:, 0, 0] = c * sx
+    matrices[:, 0, 1] = -s * sy
+    matrices[:, 1, 0] = s * sx
+    matrices[:, 1, 1] = c * sy
+    matrices[:, :, 2] = np.broadcast_to(np.zeros(2) if translate is None
+                                        else np.asarray(translate, dtype=float), (count, 2))
+    return matrices
+
+
+def split_counts(n_robots, n_instances):
+    """Répartit n_robots sur n_instances (les premières reçoivent le reste)."""
+    counts = np.full(n_instances, n_robots // n_instances)
+    counts[:n_robots % n_instances] += 1
+    return counts
+
+
+class InstancedFormation:
+    """
+    K instances d'une forme de base, placées par des transformées affines.
+
+    counts permet aux instances d'utiliser un préfixe de la forme de base
+    (N non divisible par K): l'instance k garde ses counts[k] premiers points.
+    """
+
+    def __init__(self, base_shape, n_instances, counts=None):
+        self.base = np.asarray(base_shape, dtype=float)
+        self.k = n_instances
+        self.m = self.base.shape[1]
+        self.transforms = instance_matrices(count=n_instances)
+        if counts is None:
+            self.counts = np.full(n_instances, self.m)
+            self._index = None
+        else:
+            self.counts = np.asarray(counts, dtype=int)
+            if np.any(self.counts > self.m):
+                raise ValueError(f"Une instance demande plus de {self.m} points")
+            self._index = np.concatenate([k * self.m + np.arange(c) for k, c in enumerate(self.counts)])
+        self._batch = np.empty((n_instances, 2, self.m))
+
+    @property
+    def n(self):
+        return int(self.counts.sum())
+
+    def instance_slices(self):
+        """Plage de robots de chaque instance dans la sortie."""
+        bounds = np.concatenate([[0], np.cumsum(self.counts)]).tolist()
+        return [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def set_transforms(self, translate=None, scale=None, rotate=None, mirror=None):
+        """Remplace les transformées de toutes les instances (arguments vectorisés)."""
+        self.transforms = instance_matrices(translate, scale, rotate, mirror, count=self.k)
+        return self
+
+    def evaluate(self, out=None):
+        """Positions (2, N) de toutes les instances."""
+        np.matmul(self.transforms[:, :, :2], self.base, out=self._batch)
+        self._batch += self.transforms[:, :, 2:]
+        # (K, 2, M) -> (2, K·M): instances contiguës dans l'ordre des robots
+        flat = self._batch.transpose(1, 0, 2).reshape(2, self.k * self.m)
+        if out is None:
+            return flat if self._index is None else flat[:, self._index]
+        if self._index is None:
+            out[...] = flat
+        else:
+            np.take(flat, self._index, axis=1, out=out)
+        return out
@@ -5,13 +5,14 @@ FORMATIONS DES LETTRES A-N-E-M - TAILLES OPTIMISÉES POUR L'ARÈNE
 
 import numpy as np
 from .base_formations import BaseFormations
+from .scene_graph import SceneGraph, SceneNode
 from utils.config import config
 
 class LetterFormations(BaseFormations):
     """Générateur de formations pour les lettres A, N, E, M - TAILLES RÉDUITES."""
     
-    def __init__(self, n_robots=None):
-        super().__init__(n_robots)
+    def __init__(self, n_robots=None, seed=None):
+        super().__init__(n_robots, seed)
         # TAILLES FORTEMENT RÉDUITES pour bien tenir dans l'arène
         self.letter_height = 0.4   # Réduit de 1.2 à 0.6 (50% plus petit)
         self.letter_width = 0.4   # Réduit de 0.8 à 0.4 (50% plus petit)
@@ -181,43 +182,40 @@ class LetterFormations(BaseFormations):
     
     def get_ANEM_formation(self):
         """Formation complète ANEM avec espacement réduit."""
-        robots_per_letter = self.n // 4
-        remainder = self.n % 4
-        
-        A_pos = self.letter_A(robots_per_letter + (1 if remainder >= 1 else 0))
-        N_pos = self.letter_N(robots_per_letter + (1 if remainder >= 2 else 0))
-        E_pos = self.letter_E(robots_per_letter + (1 if remainder >= 3 else 0))
-        M_pos = self.letter_M(robots_per_letter)
-        
-        # Largeur totale RÉDUITE
-        total_width = 4 * self.letter_width + 3 * self.spacing
+        return SceneGraph(self.word_scene("ANEM"), self.n).compile().copy()
+
+    def word_scene(self, word):
+        """
+        Graphe de scène d'un mot: une lettre par nœud, robots répartis
+        équitablement (le reste aux premières lettres), lettres centrées
+        verticalement. Déplacer une lettre ne recalcule que ses points.
+        """
+        total_width = len(word) * self.letter_width + (len(word) - 1) * self.spacing
         start_x = -total_width / 2 + self.letter_width / 2
-        
-        # Positionner chaque lettre
-        A_pos[0, :] += start_x
-        N_pos[0, :] += start_x + self.letter_width + self.spacing
-        E_pos[0, :] += start_x + 2 * (self.letter_width + self.spacing)
-        M_pos[0, :] += start_x + 3 * (self.letter_width + self.spacing)
-        
-        # Centrer verticalement
-        for letter_pos in [A_pos, N_pos, E_pos, M_pos]:
-            letter_pos[1, :] -= letter_pos[1, :].mean()
-        
-        # Combiner
-        all_x = np.concatenate([A_pos[0], N_pos[0], E_pos[0], M_pos[0]])
-        all_y = np.concatenate([A_pos[1], N_pos[1], E_pos[1], M_pos[1]])
-        
-        return np.array([all_x, all_y])
+
+        def centered(builder):
+            def shape(count):
+                letter_pos = builder(count)
+                letter_pos[1, :] -= letter_pos[1, :].mean()
+                return letter_pos
+            return shape
+
+        return SceneNode(word, children=[
+            SceneNode(letter, shape=centered(getattr(self, f"letter_{letter}")),
+                      translate=(start_x + i * (self.letter_width + self.spacing), 0.0))
+            for i, letter in enumerate(word)
+        ])
     
     def get_NIGER_formation(self):
         """Formation du mot NIGER - TAILLES RÉDUITES."""
-        # Pour 50 robots, on fait NIGER avec 10 robots par lettre
-        robots_per_letter = min(10, self.n // 5)
-        
-        N_pos = self.letter_N(robots_per_letter)
-        I_pos = self.letter_I(robots_per_letter)
-        G_pos = self.letter_G(robots_per_letter)
-        E_pos = self.letter_E(robots_per_letter)
+        # Tous les robots répartis sur les 5 lettres (10 par lettre pour 50 robots)
+        robots_per_letter = self.n // 5
+        remainder = self.n % 5
+        
+        N_pos = self.letter_N(robots_per_letter + (1 if remainder >= 1 else 0))
+        I_pos = self.letter_I(robots_per_letter + (1 if remainder >= 2 else 0))
+        G_pos = self.letter_G(robots_per_letter + (1 if remainder >= 3 else 0))
+        E_pos = self.letter_E(robots_per_letter + (1 if remainder >= 4 else 0))
         R_pos = self.letter_R(robots_per_letter)
         
         # Positionner chaque lettre avec espacement réduit
@@ -0,0 +1,176 @@
+# src/formations/scene_graph.py
+"""
+GRAPHE DE SCÈNE DES FORMATIONS
+Arbre de nœuds (transformée locale + forme + budget de robots) compilé en
+un seul tableau (2|3, N). Les transformées monde sont mises en cache: quand
+un nœud bouge, seul son sous-arbre est recalculé (le cou de la girafe
+n'entraîne que ses propres points et ceux de la tête).
+"""
+
+import numpy as np
+
+
+def apportion(total, weights):
+    """Répartit total robots selon weights (plus forts restes, égalités vers les premiers)."""
+    weights = np.asarray(weights, dtype=float)
+    if total <= 0 or weights.sum() <= 0:
+        return np.zeros(len(weights), dtype=int)
+    exact = total * weights / weights.sum()
+    counts = np.floor(exact).astype(int)
+    remainder = exact - counts
+    order = np.argsort(-remainder, kind='stable')
+    counts[order[:total - counts.sum()]] += 1
+    return counts
+
+
+class SceneNode:
+    """
+    Nœud du graphe: transformée locale, forme propre et enfants.
+
+    shape: tableau (dims, k) fixe ou fonction n -> (dims, n) (lettre,
+    silhouette...). budget: robots du sous-arbre entier; sinon weight donne
+    la part du nœud dans le reste du budget parent. own_weight règle la part
+    de la forme propre face aux enfants.
+    """
+
+    def __init__(self, name='', shape=None, budget=None, weight=1.0, own_weight=1.0,
+                 translate=None, scale=1.0, rotate=0.0, pivot=None, children=None):
+        self.name = name
+        self.shape = shape
+        self.budget = budget
+        self.weight = weight
+        self.own_weight = own_weight if shape is not None else 0.0
+        self.children = []
+        self.parent = None
+        self.translate = np.zeros(3) if translate is None else self._vec3(translate)
+        self.scale = scale
+        self.rotate = rotate
+        self.pivot = np.zeros(3) if pivot is None else self._vec3(pivot)
+        self._dirty = True
+        self._points = None      # Points locaux de la forme propre (calculés une fois)
+        self._slice = slice(0, 0)
+        self._world = None
+        for child in children or []:
+            self.add(child)
+
+    @staticmethod
+    def _vec3(values):
+        out = np.zeros(3)
+        values = np.asarray(values, dtype=float)
+        out[:len(values)] = values
+        return out
+
+    def add(self, child):
+        """Ajoute un enfant (retourne l'enfant pour chaîner la construction)."""
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    def find(self, name):
+        """Premier nœud du sous-arbre portant ce nom."""
+        if self.name == name:
+            return self
+        for child in self.children:
+            found = child.find(name)
+            if found is not None:
+                return found
+        return None
+
+    def set_transform(self, translate=None, scale=None, rotate=None):
+        """Déplace le nœud: seul son sous-arbre sera recalculé à la compilation."""
+        if translate is not None:
+            self.translate = self._vec3(translate)
+        if scale is not None:
+            self.scale = scale
+        if rotate is not None:
+            self.rotate = rotate
+        self._dirty = True
+        return self
+
+    def set_points(self, points):
+        """Remplace les points locaux (déformation: drapeau, vague...)."""
+        points = np.asarray(points, dtype=float)
+        if self._points is not None and points.shape[1] != self._points.shape[1]:
+            raise ValueError(f"{self.name}: {self._points.shape[1]} points attendus")
+        self._points = points
+        self._dirty = True
+        return self
+
+    def local_matrix(self):
+        """Matrice homogène 4x4: T(translate)·T(pivot)·Rz·S·T(-pivot)."""
+        c, s = np.cos(self.rotate), np.sin(self.rotate)
+        scale = np.ones(3)
+        scale[:2] = self.scale  # Scalaire ou (sx, sy)
+        m = np.eye(4)
+        m[:3, :3] = np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]]) * scale
+        m[:3, 3] = self.translate + self.pivot - m[:3, :3] @ self.pivot
+        return m
+
+
+class SceneGraph:
+    """Compile un arbre de SceneNode en positions (dims, N) avec cache par sous-arbre."""
+
+    def __init__(self, root, n_robots, dims=2):
+        self.root = root
+        self.n = n_robots
+        self.dims = dims
+        self.positions = np.zeros((dims, n_robots))
+        self.last_updated = 0  # Nombre de points recalculés à la dernière compilation
+        self._layout(root, n_robots, 0)
+
+    def _layout(self, node, budget, start):
+        """Attribue à chaque nœud une plage contiguë (forme propre puis enfants)."""
+        fixed = [c.budget for c in node.children if c.budget is not None]
+        free = [c for c in node.children if c.budget is None]
+        rest = max(budget - sum(fixed), 0)
+        shares = apportion(rest, [node.own_weight] + [c.weight for c in free])
+        own = int(shares[0])
+        if node.shape is not None and not callable(node.shape):
+            own = min(budget, np.asarray(node.shape).shape[1])  # Forme fixe: taille imposée
+        free_budgets = iter(shares[1:])
+
+        node._slice = slice(start, start + own)
+        if node.shape is not None:
+            points = node.shape(own) if callable(node.shape) else np.asarray(node.shape)[:, :own]
+            node._points = np.asarray(points, dtype=float)
+        cursor = start + own
+        for child in node.children:
+            child_budget = child.budget if child.budget is not None else int(next(free_budgets))
+            child_budget = min(child_budget, start + budget - cursor)
+            cursor = self._layout(child, child_budget, cursor)
+        node._dirty = True
+        return cursor
+
+    def slice(self, name):
+        """Plage de robots du sous-arbre d'un nœud nommé."""
+        node = self.root.find(name)
+        if node is None:
+            raise KeyError(name)
+        end = node._slice.stop
+        stack = list(node.children)
+        while stack:
+            child = stack.pop()
+            end = max(end, child._slice.stop)
+            stack.extend(child.children)
+        return slice(node._slice.start, end)
+
+    def compile(self):
+        """Met à jour les sous-arbres modifiés et renvoie le tableau (dims, N) (réutilisé)."""
+        self.last_updated = 0
+        self._update(self.root, np.eye(4), False)
+        return self.positions
+
+    def _update(self, node, parent_world, parent_changed):
+        changed = parent_changed or node._dirty
+        if changed:
+            node._world = parent_world @ node.local_matrix()
+            node._dirty = False
+            if node._points is not None and node._points.shape[1]:
+                points = node._points
+                local = np.zeros((3, points.shape[1]))
+                local[:points.shape[0]] = points[:3]
+                world = node._world[:3, :3] @ local + node._world[:3, 3:]
+                self.positions[:, node._slice] = world[:self.dims]
+                self.last_updated += points.shape[1]
+        for child in node.children:
+            self._update(child, node._world, changed)
@@ -0,0 +1,197 @@
+# src/formations/star_catalog.py
+"""
+CATALOGUE D'ÉTOILES EN COLONNES
+Étoiles stockées en tableaux NumPy (positions, magnitudes, classe spectrale,
+constellation) plutôt qu'en listes de dictionnaires: couleurs et luminosités
+de tout le ciel se calculent en une passe vectorisée. Chargement possible
+d'un catalogue CSV d'étoiles brillantes pour des ciels de 2000+ robots.
+"""
+
+import csv
+import numpy as np
+from utils.config import config
+
+# Classes spectrales de la plus chaude à la plus froide
+SPECTRAL_TYPES = "OBAFGKM"
+SPECTRAL_HEX = ["#9BB0FF", "#AABFFF", "#CAD7FF", "#F8F7FF", "#FFF4EA", "#FFD2A1", "#FFCC6F"]
+DEFAULT_SPECTRAL = SPECTRAL_TYPES.index("G")  # Type inconnu: couleur solaire
+
+# Table de correspondance classe spectrale -> RGB (7, 3) uint8
+SPECTRAL_RGB = np.array([[int(h[i:i+2], 16) for i in (1, 3, 5)] for h in SPECTRAL_HEX],
+                        dtype=np.uint8)
+
+# Constellations historiques du projet #4 (coordonnées de l'arène)
+CONSTELLATIONS = {
+    'grande_ourse': [
+        {"nom": "Dubhe", "pos": (0.5, 0.8), "mag": 1.8, "type": "K"},
+        {"nom": "Merak", "pos": (0.7, 0.6), "mag": 2.4, "type": "A"},
+        {"nom": "Phecda", "pos": (0.9, 0.5), "mag": 2.4, "type": "A"},
+        {"nom": "Megrez", "pos": (1.0, 0.7), "mag": 3.3, "type": "A"},
+        {"nom": "Alioth", "pos": (1.2, 0.9), "mag": 1.8, "type": "A"},
+        {"nom": "Mizar", "pos": (1.4, 1.0), "mag": 2.2, "type": "A"},
+        {"nom": "Alkaid", "pos": (1.6, 0.8), "mag": 1.9, "type": "B"}
+    ],
+    'orion': [
+        {"nom": "Bételgeuse", "pos": (-0.8, 0.6), "mag": 0.5, "type": "M"},
+        {"nom": "Rigel", "pos": (0.9, -0.7), "mag": 0.1, "type": "B"},
+        {"nom": "Bellatrix", "pos": (-0.5, 0.4), "mag": 1.6, "type": "B"},
+        {"nom": "Mintaka", "pos": (0.0, 0.0), "mag": 2.2, "type": "O"},
+        {"nom": "Alnilam", "pos": (0.1, 0.1), "mag": 1.7, "type": "B"},
+        {"nom": "Alnitak", "pos": (0.2, 0.2), "mag": 1.9, "type": "O"}
+    ],
+    'croix_sud': [
+        {"nom": "Acrux", "pos": (0.0, 0.6), "mag": 0.8, "type": "B"},
+        {"nom": "Mimosa", "pos": (0.3, 0.3), "mag": 1.3, "type": "B"},
+        {"nom": "Gacrux", "pos": (0.0, -0.6), "mag": 1.6, "type": "M"},
+        {"nom": "Imai", "pos": (-0.3, 0.0), "mag": 2.8, "type": "B"}
+    ]
+}
+
+
+def spectral_index(types):
+    """Types spectraux ('B2V', 'K', ...) -> indices dans SPECTRAL_TYPES."""
+    lookup = {t: i for i, t in enumerate(SPECTRAL_TYPES)}
+    return np.fromiter((lookup.get(str(t).strip()[:1].upper(), DEFAULT_SPECTRAL) for t in types),
+                       dtype=np.int8, count=len(types))
+
+
+class StarCatalog:
+    """Catalogue colonnes: positions (2, S), magnitudes (S,), classes (S,), constellations (S,)."""
+
+    def __init__(self, positions, magnitudes, spectral, constellation=None,
+                 names=None, constellation_names=None):
+        self.positions = np.asarray(positions, dtype=float).reshape(2, -1)
+        self.magnitudes = np.asarray(magnitudes, dtype=float)
+        self.spectral = np.asarray(spectral, dtype=np.int8)
+        size = self.magnitudes.shape[0]
+        self.constellation = (np.zeros(size, dtype=np.int16) if constellation is None
+                              else np.asarray(constellation, dtype=np.int16))
+        self.names = np.asarray(names if names is not None else [''] * size, dtype=object)
+        self.constellation_names = list(constellation_names or ['ciel'])
+
+    def __len__(self):
+        return self.magnitudes.shape[0]
+
+    @classmethod
+    def from_constellations(cls, constellations=None):
+        """Construit le catalogue à partir de dictionnaires {constellation: [étoiles]}."""
+        constellations = constellations or CONSTELLATIONS
+        stars = [(cid, star) for cid, group in enumerate(constellations.values()) for star in group]
+        return cls(positions=np.array([star['pos'] for _, star in stars], dtype=float).T,
+                   magnitudes=[star['mag'] for _, star in stars],
+                   spectral=spectral_index([star['type'] for _, star in stars]),
+                   constellation=[cid for cid, _ in stars],
+                   names=[star['nom'] for _, star in stars],
+                   constellation_names=list(constellations))
+
+    @classmethod
+    def from_csv(cls, path, max_magnitude=None):
+        """
+        Charge un catalogue CSV d'étoiles brillantes.
+
+        Colonnes attendues: mag, spectral et soit x, y (arène), soit ra, dec
+        en degrés (projetées par project_sky). name et constellation sont
+        optionnelles.
+        """
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        if not rows:
+            raise ValueError(f"Catalogue vide: {path}")
+        columns = rows[0].keys()
+        magnitudes = np.array([float(r['mag']) for r in rows])
+        keep = np.ones(len(rows), dtype=bool) if max_magnitude is None else magnitudes <= max_magnitude
+        rows = [r for r, k in zip(rows, keep) if k]
+        magnitudes = magnitudes[keep]
+
+        if 'x' in columns and 'y' in columns:
+            positions = np.array([[float(r['x']) for r in rows], [float(r['y']) for r in rows]])
+        elif 'ra' in columns and 'dec' in columns:
+            positions = project_sky(np.array([float(r['ra']) for r in rows]),
+                                    np.array([float(r['dec']) for r in rows]))
+        else:
+            raise ValueError("Le catalogue doit fournir x, y ou ra, dec")
+
+        labels = [r.get('constellation') or 'ciel' for r in rows]
+        constellation_names = list(dict.fromkeys(labels))
+        ids = {name: i for i, name in enumerate(constellation_names)}
+        return cls(positions, magnitudes, spectral_index([r.get('spectral', '') for r in rows]),
+                   constellation=[ids[label] for label in labels],
+                   names=[r.get('name', '') for r in rows],
+                   constellation_names=constellation_names)
+
+    # ========== SÉLECTIONS ==========
+
+    def indices(self, constellation):
+        """Indices des étoiles d'une constellation (dans l'ordre du catalogue)."""
+        return np.flatnonzero(self.constellation == self.constellation_names.index(constellation))
+
+    def brightest(self, count):
+        """Indices des count étoiles les plus brillantes (magnitude croissante)."""
+        return np.argsort(self.magnitudes, kind='stable')[:count]
+
+    # ========== PHOTOMÉTRIE ==========
+
+    def brightness(self, indices=None, floor=0.2):
+        """
+        Luminosité relative dans [floor, 1] depuis la magnitude (flux ∝ 10^(-0.4·m)),
+        la plus brillante de la sélection valant 1.
+        """
+        mags = self.magnitudes if indices is None else self.magnitudes[indices]
+        if mags.size == 0:
+            return mags.copy()
+        flux = np.power(10.0, -0.4 * (mags - mags.min()))
+        return floor + (1.0 - floor) * flux
+
+    def rgb(self, indices=None, floor=0.2):
+        """Couleurs (S, 3) float dans [0, 1]: teinte spectrale x luminosité."""
+        spectral = self.spectral if indices is None else self.spectral[indices]
+        colors = SPECTRAL_RGB[spectral] / 255.0
+        colors *= self.brightness(indices, floor)[:, None]
+        return colors
+
+    def hex_colors(self, indices=None):
+        """Teinte spectrale de chaque étoile en '#RRGGBB' (format de ColorAnimator)."""
+        spectral = self.spectral if indices is None else self.spectral[indices]
+        return [SPECTRAL_HEX[s] for s in spectral]
+
+    # ========== CIEL NOCTURNE ==========
+
+    def night_sky(self, n_robots, bounds=None):
+        """
+        Les n_robots étoiles les plus brillantes, mises à l'échelle de la zone sûre.
+
+        Retourne (positions (2, n), couleurs (n, 3), indices catalogue).
+        """
+        idx = self.brightest(n_robots)
+        if len(idx) < n_robots:
+            raise ValueError(f"Catalogue trop petit: {len(self)} étoiles pour {n_robots} robots")
+        zone = bounds or config.safe_zone
+        pts = self.positions[:, idx]
+        lo, hi = pts.min(axis=1, keepdims=True), pts.max(axis=1, keepdims=True)
+        span = np.where(hi - lo > 0, hi - lo, 1.0)
+        target_lo = np.array([[zone['x_min']], [zone['y_min']]])
+        target_span = np.array([[zone['x_max'] - zone['x_min']], [zone['y_max'] - zone['y_min']]])
+        # Même échelle sur x et y pour ne pas déformer les constellations
+        scale = np.min(target_span / span)
+        offset = target_lo + (target_span - span * scale) / 2
+        return (pts - lo) * scale + offset, self.rgb(idx), idx
+
+
+def project_sky(ra_deg, dec_deg, center=None):
+    """
+    Projection stéréographique (ra, dec) -> plan tangent autour de center.
+
+    center=None: centre sur la moyenne circulaire des ascensions droites et
+    la moyenne des déclinaisons. Est à gauche, comme vu depuis le sol.
+    """
+    ra, dec = np.radians(ra_deg), np.radians(dec_deg)
+    if center is None:
+        ra0 = np.arctan2(np.sin(ra).mean(), np.cos(ra).mean())
+        dec0 = dec.mean()
+    else:
+        ra0, dec0 = np.radians(center[0]), np.radians(center[1])
+    cos_c = np.sin(dec0) * np.sin(dec) + np.cos(dec0) * np.cos(dec) * np.cos(ra - ra0)
+    k = 2.0 / (1.0 + np.maximum(cos_c, -0.999))
+    x = -k * np.cos(dec) * np.sin(ra - ra0)
+    y = k * (np.cos(dec0) * np.sin(dec) - np.sin(dec0) * np.cos(dec) * np.cos(ra - ra0))
+    return np.array([x, y])
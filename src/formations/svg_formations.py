@@ -0,0 +1,360 @@
+# src/formations/svg_formations.py
+"""
+FORMATIONS SVG (SILHOUETTES)
+Importe des silhouettes dessinées en SVG: les chemins (lignes, Béziers,
+arcs, formes de base) sont aplatis en polylignes, puis N robots sont
+répartis à abscisse curviligne constante sur l'ensemble des traits.
+Chaque silhouette est mise en cache par (fichier, N).
+
+Convention des fichiers: 1 unité SVG = 1 cm, y vers le bas, origine au
+centre de l'arène.
+"""
+
+import os
+import re
+import xml.etree.ElementTree as ET
+import numpy as np
+from formations.base_formations import BaseFormations
+from formations.instancing import InstancedFormation, split_counts
+from formations.scene_graph import SceneNode
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'assets', 'silhouettes')
+SVG_UNIT = 0.01           # Mètres par unité SVG
+FLATTEN_TOLERANCE = 0.5   # Pas d'aplatissement des courbes, en unités SVG
+
+_COMMAND_RE = re.compile(r'([MmLlHhVvCcSsQqTtAaZz])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)')
+_TRANSFORM_RE = re.compile(r'(matrix|translate|scale|rotate)\s*\(([^)]*)\)')
+_ARGS = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0}
+
+# Cache partagé: (fichier, N) -> (positions (2, N), groupes {id: slice})
+_CACHE = {}
+_SHAPES = {}
+
+
+# ========== APLATISSEMENT ==========
+
+def _bezier(points, tolerance=FLATTEN_TOLERANCE):
+    """Échantillonne une Bézier (degré 2 ou 3) en polyligne, t=0 exclu."""
+    points = np.asarray(points, dtype=float)
+    hull = np.sum(np.hypot(*np.diff(points, axis=0).T))
+    steps = int(np.clip(np.ceil(hull / tolerance), 2, 64))
+    t = np.linspace(0.0, 1.0, steps + 1)[1:, None]
+    u = 1.0 - t
+    if len(points) == 3:
+        return u**2 * points[0] + 2*u*t * points[1] + t**2 * points[2]
+    return u**3 * points[0] + 3*u**2*t * points[1] + 3*u*t**2 * points[2] + t**3 * points[3]
+
+
+def _arc(start, rx, ry, phi_deg, large_arc, sweep, end, tolerance=FLATTEN_TOLERANCE):
+    """Arc elliptique SVG (paramétrage par extrémités), t=0 exclu."""
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or np.allclose(start, end):
+        return end[None, :]
+    phi = np.radians(phi_deg)
+    cos_p, sin_p = np.cos(phi), np.sin(phi)
+    dx, dy = (start - end) / 2
+    x1 = cos_p * dx + sin_p * dy
+    y1 = -sin_p * dx + cos_p * dy
+    # Rayons trop petits: agrandis juste assez pour relier les extrémités
+    scale = x1**2 / rx**2 + y1**2 / ry**2
+    if scale > 1:
+        rx, ry = rx * np.sqrt(scale), ry * np.sqrt(scale)
+    num = rx**2 * ry**2 - rx**2 * y1**2 - ry**2 * x1**2
+    den = rx**2 * y1**2 + ry**2 * x1**2
+    coef = np.sqrt(max(num, 0.0) / den) * (-1 if large_arc == sweep else 1)
+    cx1, cy1 = coef * rx * y1 / ry, -coef * ry * x1 / rx
+    center = np.array([cos_p * cx1 - sin_p * cy1, sin_p * cx1 + cos_p * cy1]) + (start + end) / 2
+    theta1 = np.arctan2((y1 - cy1) / ry, (x1 - cx1) / rx)
+    theta2 = np.arctan2((-y1 - cy1) / ry, (-x1 - cx1) / rx)
+    delta = theta2 - theta1
+    if sweep and delta < 0:
+        delta += 2 * np.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * np.pi
+    steps = int(np.clip(np.ceil(abs(delta) * max(rx, ry) / tolerance), 2, 128))
+    theta = theta1 + delta * np.linspace(0.0, 1.0, steps + 1)[1:]
+    x, y = rx * np.cos(theta), ry * np.sin(theta)
+    return np.column_stack([center[0] + cos_p * x - sin_p * y, center[1] + sin_p * x + cos_p * y])
+
+
+def _ellipse(cx, cy, rx, ry, tolerance=FLATTEN_TOLERANCE):
+    steps = int(np.clip(np.ceil(2 * np.pi * max(rx, ry) / tolerance), 8, 256))
+    theta = np.linspace(0.0, 2 * np.pi, steps + 1)
+    return np.column_stack([cx + rx * np.cos(theta), cy + ry * np.sin(theta)])
+
+
+def parse_path(d, tolerance=FLATTEN_TOLERANCE):
+    """Attribut d d'un <path> -> liste de polylignes (k, 2), une par sous-chemin."""
+    tokens = _COMMAND_RE.findall(d)
+    polylines, current = [], []
+    pos = np.zeros(2)
+    start = np.zeros(2)
+    last_control, last_cmd = None, ''
+    i = 0
+    cmd = None
+    while i < len(tokens):
+        if tokens[i][0]:
+            cmd = tokens[i][0]
+            i += 1
+        elif cmd is None:
+            raise ValueError(f"Chemin SVG invalide: {d[:40]!r}")
+        upper = cmd.upper()
+        n_args = _ARGS[upper]
+        args = [float(t[1]) for t in tokens[i:i+n_args]]
+        if len(args) < n_args or any(t[0] for t in tokens[i:i+n_args]):
+            raise ValueError(f"Arguments manquants pour la commande {cmd} dans {d[:40]!r}")
+        i += n_args
+        relative = cmd.islower() and upper != 'Z'
+        base = pos if relative else np.zeros(2)
+
+        if upper == 'M':
+            if len(current) > 1:
+                polylines.append(np.array(current))
+            pos = base + args
+            start = pos.copy()
+            current = [pos.copy()]
+            cmd = 'l' if relative else 'L'  # Paires suivantes: lignes implicites
+            last_control, last_cmd = None, 'M'
+            continue
+        if upper == 'Z':
+            if current and not np.allclose(current[-1], start):
+                current.append(start.copy())
+            if len(current) > 1:
+                polylines.append(np.array(current))
+            pos = start.copy()
+            current = [pos.copy()]
+            last_control, last_cmd = None, 'Z'
+            continue
+        if not current:
+            current = [pos.copy()]
+
+        if upper == 'L':
+            new = [base + args]
+        elif upper == 'H':
+            new = [np.array([args[0] + (pos[0] if relative else 0.0), pos[1]])]
+        elif upper == 'V':
+            new = [np.array([pos[0], args[0] + (pos[1] if relative else 0.0)])]
+        elif upper in 'CS':
+            if upper == 'C':
+                c1 = base + args[0:2]
+                c2, end = base + args[2:4], base + args[4:6]
+            else:
+                c1 = 2 * pos - last_control if last_cmd in 'CS' else pos.copy()
+                c2, end = base + args[0:2], base + args[2:4]
+            new = _bezier([pos, c1, c2, end], tolerance)
+            last_control = c2
+        elif upper in 'QT':
+            if upper == 'Q':
+                c1, end = base + args[0:2], base + args[2:4]
+            else:
+                c1 = 2 * pos - last_control if last_cmd in 'QT' else pos.copy()
+                end = base + args[0:2]
+            new = _bezier([pos, c1, end], tolerance)
+            last_control = c1
+        else:  # 'A'
+            new = _arc(pos, args[0], args[1], args[2], bool(args[3]), bool(args[4]),
+                       base + args[5:7], tolerance)
+        current.extend(np.atleast_2d(new))
+        pos = np.array(current[-1], dtype=float)
+        last_cmd = upper
+
+    if len(current) > 1:
+        polylines.append(np.array(current))
+    return polylines
+
+
+def _parse_transform(text):
+    """Attribut transform -> matrice affine 3x3 (translate, scale, rotate, matrix)."""
+    matrix = np.eye(3)
+    for name, raw in _TRANSFORM_RE.findall(text or ''):
+        v = [float(x) for x in re.split(r'[\s,]+', raw.strip()) if x]
+        m = np.eye(3)
+        if name == 'matrix':
+            m[:2] = np.array(v).reshape(3, 2).T
+        elif name == 'translate':
+            m[:2, 2] = [v[0], v[1] if len(v) > 1 else 0.0]
+        elif name == 'scale':
+            m[0, 0], m[1, 1] = v[0], v[1] if len(v) > 1 else v[0]
+        else:
+            c, s = np.cos(np.radians(v[0])), np.sin(np.radians(v[0]))
+            m[:2, :2] = [[c, -s], [s, c]]
+            if len(v) == 3:
+                pivot = np.eye(3)
+                pivot[:2, 2] = v[1:]
+                back = np.eye(3)
+                back[:2, 2] = [-v[1], -v[2]]
+                m = pivot @ m @ back
+        matrix = matrix @ m
+    return matrix
+
+
+def _element_polylines(elem, tolerance):
+    tag = elem.tag.rsplit('}', 1)[-1]
+    get = lambda key, default=0.0: float(elem.get(key, default))
+    if tag == 'path':
+        return parse_path(elem.get('d', ''), tolerance)
+    if tag == 'line':
+        return [np.array([[get('x1'), get('y1')], [get('x2'), get('y2')]])]
+    if tag in ('polyline', 'polygon'):
+        values = [float(v) for v in re.split(r'[\s,]+', elem.get('points', '').strip()) if v]
+        pts = np.array(values).reshape(-1, 2)
+        if tag == 'polygon' and len(pts):
+            pts = np.vstack([pts, pts[:1]])
+        return [pts] if len(pts) > 1 else []
+    if tag == 'rect':
+        x, y, w, h = get('x'), get('y'), get('width'), get('height')
+        return [np.array([[x, y], [x + w, y], [x + w, y + h], [x, y + h], [x, y]])]
+    if tag == 'circle':
+        return [_ellipse(get('cx'), get('cy'), get('r'), get('r'), tolerance)]
+    if tag == 'ellipse':
+        return [_ellipse(get('cx'), get('cy'), get('rx'), get('ry'), tolerance)]
+    return []
+
+
+def load_svg(path, unit=SVG_UNIT, tolerance=FLATTEN_TOLERANCE):
+    """
+    Lit un fichier SVG -> (polylignes (2, k) en mètres, labels).
+
+    Le label d'un trait est l'id de l'élément, ou à défaut celui du
+    groupe <g> parent le plus proche. L'axe y est inversé (y vers le haut).
+    """
+    root = ET.parse(path).getroot()
+    polylines, labels = [], []
+
+    def walk(elem, matrix, label):
+        matrix = matrix @ _parse_transform(elem.get('transform'))
+        label = elem.get('id', label)
+        for pts in _element_polylines(elem, tolerance):
+            homogeneous = np.vstack([pts.T, np.ones(len(pts))])
+            xy = (matrix @ homogeneous)[:2] * unit
+            xy[1] *= -1
+            polylines.append(xy)
+            labels.append(label)
+        for child in elem:
+            walk(child, matrix, label)
+
+    walk(root, np.eye(3), '')
+    return polylines, labels
+
+
+# ========== RÉÉCHANTILLONNAGE ==========
+
+def resample_polylines(polylines, n_robots, labels=None):
+    """
+    Répartit n_robots à pas constant sur la longueur totale des traits.
+
+    Chaque trait reçoit un nombre de robots proportionnel à sa longueur;
+    les sauts entre traits ne comptent pas. Retourne (positions (2, N),
+    groupes {label: slice}) — les robots d'un même trait sont contigus.
+    """
+    if not polylines:
+        raise ValueError("Aucun trait à échantillonner")
+    starts = np.concatenate([p[:, :-1] for p in polylines], axis=1)
+    ends = np.concatenate([p[:, 1:] for p in polylines], axis=1)
+    seg_len = np.hypot(*(ends - starts))
+    cumulative = np.concatenate([[0.0], np.cumsum(seg_len)])
+    total = cumulative[-1]
+    if total <= 0:
+        return np.repeat(polylines[0][:, :1], n_robots, axis=1), {}
+
+    s = (np.arange(n_robots) + 0.5) * (total / n_robots)
+    seg = np.clip(np.searchsorted(cumulative, s, side='right') - 1, 0, len(seg_len) - 1)
+    frac = (s - cumulative[seg]) / np.where(seg_len[seg] > 0, seg_len[seg], 1.0)
+    positions = starts[:, seg] + (ends[:, seg] - starts[:, seg]) * frac
+
+    groups = {}
+    if labels is not None:
+        stroke_end = cumulative[np.cumsum([p.shape[1] - 1 for p in polylines])]
+        bounds = np.concatenate([[0], np.searchsorted(s, stroke_end, side='right')])
+        for label, lo, hi in zip(labels, bounds[:-1].tolist(), bounds[1:].tolist()):
+            if label and hi > lo:
+                previous = groups.get(label)
+                groups[label] = slice(lo if previous is None else previous.start, hi)
+    return positions, groups
+
+
+def _asset_path(asset, directory=None):
+    if os.path.isfile(asset):
+        return os.path.abspath(asset)
+    name = asset if asset.endswith('.svg') else f"{asset}.svg"
+    return os.path.abspath(os.path.join(directory or ASSETS_DIR, name))
+
+
+def sample_svg(asset, n_robots, directory=None):
+    """Silhouette d'un fichier SVG pour n_robots, mise en cache par (fichier, N)."""
+    path = _asset_path(asset, directory)
+    key = (path, n_robots)
+    if key not in _CACHE:
+        if path not in _SHAPES:
+            _SHAPES[path] = load_svg(path)
+        polylines, labels = _SHAPES[path]
+        positions, groups = resample_polylines(polylines, n_robots, labels)
+        positions.setflags(write=False)
+        _CACHE[key] = (positions, groups)
+    return _CACHE[key]
+
+
+class SvgFormations(BaseFormations):
+    """Silhouettes importées des fichiers SVG de assets/silhouettes."""
+
+    def __init__(self, n_robots=None, directory=None, seed=None):
+        super().__init__(n_robots, seed)
+        self.directory = directory
+
+    def silhouette(self, asset, n_robots=None, offset=None):
+        """Positions (2, N) en cache (lecture seule); copie décalée si offset est donné."""
+        positions, _ = sample_svg(asset, n_robots or self.n, self.directory)
+        if offset is None:
+            return positions
+        return positions + np.asarray(offset, dtype=float).reshape(2, 1)
+
+    def groups(self, asset, n_robots=None):
+        """Plages de robots par partie nommée (id SVG): {'trompe': slice(...), ...}."""
+        return sample_svg(asset, n_robots or self.n, self.directory)[1]
+
+    def instanced(self, asset, n_instances):
+        """
+        n_instances copies d'une silhouette se partageant les N robots.
+
+        La silhouette est échantillonnée une seule fois (⌈N/K⌉ points); les
+        instances se placent ensuite via set_transforms().
+        """
+        counts = split_counts(self.n, n_instances)
+        return InstancedFormation(self.silhouette(asset, max(int(counts.max()), 1)), n_instances, counts)
+
+    def herd(self, asset, offsets):
+        """Plusieurs copies d'une silhouette décalées de offsets (K, 2)."""
+        offsets = np.asarray(offsets, dtype=float)
+        return self.instanced(asset, len(offsets)).set_transforms(translate=offsets).evaluate()
+
+    def scene(self, asset, n_robots=None, parents=None, pivots=None):
+        """
+        Silhouette découpée en nœuds de graphe de scène (un par id SVG).
+
+        parents: {partie: partie parente} (la tête suit le cou); pivots:
+        {partie: (x, y)} centre de rotation de la partie. Les robots restent
+        dans l'ordre de silhouette() tant que chaque enfant suit son parent
+        dans le fichier.
+        """
+        positions, groups = sample_svg(asset, n_robots or self.n, self.directory)
+        parents, pivots = parents or {}, pivots or {}
+        root = SceneNode(asset)
+        nodes = {}
+        cursor = 0
+        parts = sorted(groups.items(), key=lambda item: item[1].start)
+        for label, part in parts + [('', slice(positions.shape[1], positions.shape[1]))]:
+            if part.start > cursor:  # Traits sans id entre deux parties
+                root.add(SceneNode('', shape=positions[:, cursor:part.start], budget=part.start - cursor))
+            if not label:
+                break
+            node = SceneNode(label, shape=positions[:, part], budget=part.stop - part.start,
+                             pivot=pivots.get(label))
+            nodes[label] = node
+            cursor = part.stop
+            parent = nodes.get(parents.get(label), root)
+            parent.add(node)
+            while parent is not root:  # Le budget d'un nœud couvre tout son sous-arbre
+                parent.budget += node.budget
+                parent = parent.parent
+        return root
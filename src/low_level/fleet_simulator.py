@@ -0,0 +1,247 @@
+# src/low_level/fleet_simulator.py
+"""
+FLOTTE SIMULÉE (BANC DE TEST SANS MATÉRIEL)
+Processus sans affichage qui se comporte comme les robots: il reçoit le
+protocole de commande (vitesses + LEDs, low_level.protocol), intègre la
+dynamique unicycle des N robots en une passe vectorisée à cadence fixe et
+renvoie la télémétrie des poses.
+
+Défauts du réseau et des capteurs injectables: latence (dans les deux
+sens), perte de paquets, bruit de mesure. Sans commande récente, les
+robots s'arrêtent d'eux-mêmes (comme le firmware).
+"""
+
+import collections
+import multiprocessing as mp
+import select
+import socket
+import time
+import numpy as np
+from utils.config import config
+from low_level.protocol import (CommandDecoder, MAX_DATAGRAM, FAULT_LOW_BATTERY,
+                                encode_telemetry)
+from low_level.telemetry import telemetry_records
+
+
+def initial_grid(n_robots):
+    """Poses (3, N) de départ: grille régulière dans la zone sûre, cap vers le haut."""
+    zone = config.safe_zone
+    width, height = zone['x_max'] - zone['x_min'], zone['y_max'] - zone['y_min']
+    cols = max(1, int(np.ceil(np.sqrt(n_robots * width / height))))
+    rows = int(np.ceil(n_robots / cols))
+    index = np.arange(n_robots)
+    poses = np.zeros((3, n_robots))
+    poses[0] = zone['x_min'] + width * (index % cols + 0.5) / cols
+    poses[1] = zone['y_min'] + height * (index // cols + 0.5) / rows
+    poses[2] = np.pi / 2
+    return poses
+
+
+class FleetSimulator:
+    """N robots unicycles pilotés par UDP, télémétrie renvoyée à telemetry_address."""
+
+    def __init__(self, n_robots, telemetry_address, rate=100.0, host='127.0.0.1', port=0,
+                 latency=0.0, loss=0.0, noise=0.0, heading_noise=0.0, heading_gain=4.0,
+                 command_timeout=0.5, battery_drain=0.002, poses=None, seed=0):
+        self.n = n_robots
+        self.telemetry_address = tuple(telemetry_address)
+        self.period = 1.0 / rate
+        self.latency = latency
+        self.loss = loss
+        self.noise = noise
+        self.heading_noise = heading_noise
+        self.heading_gain = heading_gain
+        self.command_timeout = command_timeout
+        self.battery_drain = battery_drain    # Fraction de batterie par mètre parcouru
+        self.rng = np.random.default_rng(seed)
+
+        self.poses = initial_grid(n_robots) if poses is None else np.array(poses, dtype=float)
+        self.battery = np.ones(n_robots)
+        self.decoder = CommandDecoder()
+        self.time = 0.0
+        self.tick = 0
+        self._last_command = -np.inf
+        self._inbox = collections.deque()    # (heure d'application, datagramme de commande)
+        self._outbox = collections.deque()   # (heure d'émission, datagramme de télémétrie)
+        self._v = np.zeros(n_robots)
+        self._omega = np.zeros(n_robots)
+
+        self.command_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.command_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+        self.command_socket.bind((host, port))
+        self.command_socket.setblocking(False)
+        self.command_address = self.command_socket.getsockname()
+        self.telemetry_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.stats = {'ticks': 0, 'overruns': 0, 'max_tick_ms': 0.0, 'commands': 0,
+                      'commands_dropped': 0, 'telemetry_sent': 0, 'telemetry_dropped': 0}
+
+    # ========== DYNAMIQUE ==========
+
+    def unicycle_commands(self, velocities):
+        """
+        Vitesses planes (2, N) commandées -> (v, ω) unicycle: v projection sur
+        le cap (marche arrière permise), ω proportionnel à l'écart de cap vers
+        la direction la plus proche (avant ou arrière), tous deux saturés.
+        """
+        vx, vy = velocities[0].astype(float), velocities[1].astype(float)
+        theta = self.poses[2]
+        v = vx * np.cos(theta) + vy * np.sin(theta)
+        error = np.angle(np.exp(1j * (np.arctan2(vy, vx) - theta)))
+        # Marche arrière: viser le cap opposé (écart replié dans [-π/2, π/2])
+        error = np.where(np.abs(error) > np.pi / 2, error - np.copysign(np.pi, error), error)
+        moving = np.hypot(vx, vy) > 1e-6
+        omega = np.where(moving, self.heading_gain * error, 0.0)
+        v = np.clip(v, -config.MAX_LINEAR_VELOCITY, config.MAX_LINEAR_VELOCITY)
+        omega = np.clip(omega, -config.MAX_ANGULAR_VELOCITY, config.MAX_ANGULAR_VELOCITY)
+        return v, omega
+
+    def step(self, dt):
+        """Intègre un pas (arc de cercle exact pour chaque robot)."""
+        theta = self.poses[2]
+        v, omega = self._v, self._omega
+        turning = np.abs(omega) > 1e-9
+        safe = np.where(turning, omega, 1.0)
+        new_theta = theta + omega * dt
+        # Arc exact si ω ≠ 0, ligne droite sinon
+        dx = np.where(turning, v / safe * (np.sin(new_theta) - np.sin(theta)), v * np.cos(theta) * dt)
+        dy = np.where(turning, -v / safe * (np.cos(new_theta) - np.cos(theta)), v * np.sin(theta) * dt)
+        self.poses[0] += dx
+        self.poses[1] += dy
+        self.poses[2] = np.angle(np.exp(1j * new_theta))
+        self.battery -= self.battery_drain * np.abs(v) * dt
+        np.clip(self.battery, 0.0, 1.0, out=self.battery)
+        self.time += dt
+
+    # ========== RÉSEAU ==========
+
+    def _receive(self, timeout):
+        """Attend les commandes jusqu'à timeout; chacune est retardée de latency."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            ready, _, _ = select.select([self.command_socket], [], [], max(0.0, remaining))
+            if not ready:
+                return
+            while True:
+                try:
+                    packet = self.command_socket.recv(MAX_DATAGRAM)
+                except BlockingIOError:
+                    break
+                if self.loss and self.rng.random() < self.loss:
+                    self.stats['commands_dropped'] += 1
+                    continue
+                self._inbox.append((time.perf_counter() + self.latency, packet))
+            if remaining <= 0:
+                return
+
+    def _apply_commands(self, now):
+        """Décode les commandes arrivées à échéance; la dernière fixe (v, ω)."""
+        applied = False
+        while self._inbox and self._inbox[0][0] <= now:
+            _, packet = self._inbox.popleft()
+            try:
+                self.decoder.decode(packet)
+            except ValueError:
+                continue
+            self.stats['commands'] += 1
+            applied = True
+        if applied:
+            self._last_command = now
+            self._v, self._omega = self.unicycle_commands(self.decoder.velocities)
+        elif now - self._last_command > self.command_timeout:
+            self._v[:] = 0.0
+            self._omega[:] = 0.0
+
+    def _publish(self, now):
+        """Télémétrie des poses mesurées (bruitées), retardée de latency."""
+        measured = self.poses
+        if self.noise or self.heading_noise:
+            measured = measured + self.rng.normal(0.0, 1.0, measured.shape) * \
+                np.array([[self.noise], [self.noise], [self.heading_noise]])
+        faults = np.where(self.battery < 0.15, FAULT_LOW_BATTERY, 0)
+        records = telemetry_records(measured, self.time, self.battery, faults)
+        for packet in encode_telemetry(records, self.tick, self.time):
+            if self.loss and self.rng.random() < self.loss:
+                self.stats['telemetry_dropped'] += 1
+                continue
+            self._outbox.append((now + self.latency, packet))
+        while self._outbox and self._outbox[0][0] <= now:
+            self.telemetry_socket.sendto(self._outbox.popleft()[1], self.telemetry_address)
+            self.stats['telemetry_sent'] += 1
+
+    # ========== BOUCLE ==========
+
+    def run(self, stop_event=None, duration=None):
+        """Boucle à cadence fixe jusqu'à stop_event (ou duration secondes)."""
+        start = time.perf_counter()
+        try:
+            while not (stop_event is not None and stop_event.is_set()):
+                if duration is not None and self.tick * self.period >= duration:
+                    break
+                tick_start = time.perf_counter()
+                self._apply_commands(tick_start)
+                self.step(self.period)
+                self._publish(tick_start)
+                self.tick += 1
+                self.stats['ticks'] += 1
+                elapsed = time.perf_counter() - tick_start
+                self.stats['max_tick_ms'] = max(self.stats['max_tick_ms'], elapsed * 1e3)
+                # Cadence fixe sans dérive; le temps libre sert à recevoir les commandes
+                remaining = start + self.tick * self.period - time.perf_counter()
+                if remaining < 0:
+                    self.stats['overruns'] += 1
+                self._receive(max(0.0, remaining))
+        finally:
+            self.close()
+        self.stats.update({'lost_commands': self.decoder.stats['lost'],
+                           'led_corrupt': self.decoder.stats['corrupt']})
+        return self.stats
+
+    def close(self):
+        self.command_socket.close()
+        self.telemetry_socket.close()
+
+
+def _fleet_worker(n_robots, telemetry_address, options, stop_event, results):
+    simulator = FleetSimulator(n_robots, telemetry_address, **options)
+    results.put(simulator.command_address)
+    results.put(simulator.run(stop_event))
+
+
+class FleetProcess:
+    """
+    FleetSimulator dans un processus séparé (tests, benchmarks):
+    start() renvoie l'adresse UDP des commandes, stop() les statistiques.
+    """
+
+    def __init__(self, n_robots, telemetry_address, **options):
+        self.n = n_robots
+        self.telemetry_address = telemetry_address
+        self.options = options
+        self.command_address = None
+        self.stats = None
+        self._stop = mp.Event()
+        self._results = mp.Queue()
+        self._process = None
+
+    def start(self, timeout=10.0):
+        self._process = mp.Process(
+            target=_fleet_worker, daemon=True,
+            args=(self.n, self.telemetry_address, self.options, self._stop, self._results))
+        self._process.start()
+        self.command_address = self._results.get(timeout=timeout)
+        return self.command_address
+
+    def stop(self, timeout=10.0):
+        self._stop.set()
+        self.stats = self._results.get(timeout=timeout)
+        self._process.join(timeout)
+        return self.stats
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._process is not None and self._process.is_alive():
+            self.stop()
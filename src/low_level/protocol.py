@@ -0,0 +1,229 @@
+# src/low_level/protocol.py
+"""
+PROTOCOLE DE COMMANDE DES ROBOTS (UDP)
+Sens montant (contrôleur -> robots): un datagramme par tick de contrôle;
+les vitesses (2, N) et les couleurs LED (N, 3) uint8 du même tick
+partagent un seul en-tête.
+
+Couleurs en delta: seuls les robots dont la couleur a changé depuis le
+tick précédent sont envoyés (indice + RGB, 5 octets). Une trame complète
+part toutes les LED_KEYFRAME_INTERVAL ticks, ou dès qu'elle coûte moins
+cher que le delta. Chaque paquet porte le CRC32 de la trame de couleurs
+complète: le récepteur vérifie l'état qu'il a reconstruit et sait qu'il
+est désynchronisé (paquet perdu) jusqu'à la prochaine trame complète.
+
+Sens descendant (robots -> contrôleur): télémétrie en enregistrements
+binaires de taille fixe (pose, batterie, défauts, horodatage du robot),
+plusieurs robots par datagramme, décodés d'un bloc par numpy.
+"""
+
+import select
+import socket
+import struct
+import zlib
+import numpy as np
+from utils.config import config
+
+COMMAND_MAGIC = b'AMCM'
+PROTOCOL_VERSION = 1
+MAX_DATAGRAM = 65507  # Charge utile UDP maximale (IPv4)
+
+# Drapeaux de l'en-tête
+HAS_VELOCITIES = 0x01
+HAS_COLORS = 0x02
+COLOR_KEYFRAME = 0x04
+
+# magic, version, drapeaux, N, tick, temps, CRC32 des couleurs, robots LED transmis
+_COMMAND_HEADER = struct.Struct('<4sBBHIdII')
+_DELTA_ROBOT_BYTES = 5   # indice uint16 + RGB
+_FULL_ROBOT_BYTES = 3
+
+TELEMETRY_MAGIC = b'AMTL'
+# magic, version, réservé, enregistrements, tick de l'émetteur, temps de l'émetteur
+_TELEMETRY_HEADER = struct.Struct('<4sBBHId')
+# Un enregistrement par robot (24 octets, sans alignement)
+TELEMETRY_RECORD = np.dtype([('robot', '<u2'), ('fault', 'u1'), ('battery', 'u1'),
+                             ('x', '<f4'), ('y', '<f4'), ('theta', '<f4'), ('time', '<f8')])
+TELEMETRY_RECORDS_PER_DATAGRAM = 250   # ~6 ko: pas de fragmentation IP excessive
+
+# Bits du champ fault
+FAULT_MOTOR = 0x01
+FAULT_LOW_BATTERY = 0x02
+FAULT_COLLISION = 0x04
+FAULT_LOST_TRACKING = 0x08
+
+
+class CommandEncoder:
+    """Construit les datagrammes de commande; garde la dernière trame LED transmise."""
+
+    def __init__(self, n_robots, keyframe_interval=None):
+        if n_robots > 0xFFFF:
+            raise ValueError(f"Au plus 65535 robots par canal, reçu {n_robots}")
+        self.n = n_robots
+        self.keyframe_interval = keyframe_interval or config.LED_KEYFRAME_INTERVAL
+        self.last_colors = np.zeros((n_robots, 3), dtype=np.uint8)
+        self._since_keyframe = None   # Première trame toujours complète
+        self.tick = 0
+        self.stats = {'packets': 0, 'bytes': 0, 'color_bytes': 0, 'full_color_bytes': 0}
+
+    def encode(self, velocities=None, colors=None, time_val=0.0):
+        """Datagramme du tick courant (vitesses et/ou couleurs, None pour les omettre)."""
+        flags, crc, sent = 0, 0, 0
+        parts = []
+        if velocities is not None:
+            velocities = np.ascontiguousarray(np.asarray(velocities)[:2], dtype='<f4')
+            if velocities.shape != (2, self.n):
+                raise ValueError(f"Vitesses (2, {self.n}) attendues, reçu {velocities.shape}")
+            flags |= HAS_VELOCITIES
+            parts.append(velocities.tobytes())
+        if colors is not None:
+            colors = np.ascontiguousarray(colors, dtype=np.uint8)
+            if colors.shape != (self.n, 3):
+                raise ValueError(f"Couleurs ({self.n}, 3) attendues, reçu {colors.shape}")
+            flags |= HAS_COLORS
+            payload, sent, keyframe = self._color_payload(colors)
+            if keyframe:
+                flags |= COLOR_KEYFRAME
+            crc = zlib.crc32(colors)
+            parts.append(payload)
+            self.stats['color_bytes'] += len(payload)
+            self.stats['full_color_bytes'] += colors.nbytes
+
+        header = _COMMAND_HEADER.pack(COMMAND_MAGIC, PROTOCOL_VERSION, flags, self.n,
+                                      self.tick, time_val, crc, sent)
+        packet = header + b''.join(parts)
+        if len(packet) > MAX_DATAGRAM:
+            raise ValueError(f"Datagramme de {len(packet)} octets (max {MAX_DATAGRAM})")
+        self.tick = (self.tick + 1) & 0xFFFFFFFF
+        self.stats['packets'] += 1
+        self.stats['bytes'] += len(packet)
+        return packet
+
+    def _color_payload(self, colors):
+        """(octets, robots transmis, trame complète?) avec suppression des robots inchangés."""
+        changed = np.flatnonzero((colors != self.last_colors).any(axis=1))
+        keyframe = (self._since_keyframe is None
+                    or self._since_keyframe + 1 >= self.keyframe_interval
+                    or len(changed) * _DELTA_ROBOT_BYTES >= self.n * _FULL_ROBOT_BYTES)
+        self.last_colors[...] = colors
+        if keyframe:
+            self._since_keyframe = 0
+            return colors.tobytes(), self.n, True
+        self._since_keyframe += 1
+        return changed.astype('<u2').tobytes() + colors[changed].tobytes(), len(changed), False
+
+    def force_keyframe(self):
+        """La prochaine trame LED sera complète (nouveau récepteur, reprise après coupure)."""
+        self._since_keyframe = None
+
+
+class CommandDecoder:
+    """État reconstruit côté robots: dernières vitesses et couleurs, intégrité vérifiée."""
+
+    def __init__(self):
+        self.n = None
+        self.velocities = None
+        self.colors = None
+        self.time = 0.0
+        self.synced = False     # Couleurs reconstruites conformes au CRC de l'émetteur
+        self._last_tick = None
+        self.stats = {'packets': 0, 'bytes': 0, 'lost': 0, 'keyframes': 0,
+                      'intact': 0, 'corrupt': 0}
+
+    def decode(self, packet):
+        """Applique un datagramme; renvoie son numéro de tick."""
+        if len(packet) < _COMMAND_HEADER.size:
+            raise ValueError("Datagramme de commande tronqué")
+        magic, version, flags, n, tick, time_val, crc, sent = _COMMAND_HEADER.unpack_from(packet)
+        if magic != COMMAND_MAGIC or version != PROTOCOL_VERSION:
+            raise ValueError("Datagramme de commande invalide")
+        if n != self.n:
+            self.n = n
+            self.velocities = np.zeros((2, n), dtype=np.float32)
+            self.colors = np.zeros((n, 3), dtype=np.uint8)
+            self.synced = False
+        if self._last_tick is not None:
+            gap = (tick - self._last_tick - 1) & 0xFFFFFFFF
+            if gap < 0x80000000:   # Paquets en retard/dupliqués: pas comptés comme perdus
+                self.stats['lost'] += gap
+        self._last_tick = tick
+        self.time = time_val
+
+        offset = _COMMAND_HEADER.size
+        if flags & HAS_VELOCITIES:
+            self.velocities[...] = np.frombuffer(packet, '<f4', 2 * n, offset).reshape(2, n)
+            offset += 8 * n
+        if flags & HAS_COLORS:
+            if flags & COLOR_KEYFRAME:
+                self.colors[...] = np.frombuffer(packet, np.uint8, 3 * n, offset).reshape(n, 3)
+                self.stats['keyframes'] += 1
+            else:
+                index = np.frombuffer(packet, '<u2', sent, offset)
+                rgb = np.frombuffer(packet, np.uint8, 3 * sent, offset + 2 * sent)
+                self.colors[index] = rgb.reshape(sent, 3)
+            self.synced = zlib.crc32(self.colors) == crc
+            self.stats['intact' if self.synced else 'corrupt'] += 1
+
+        self.stats['packets'] += 1
+        self.stats['bytes'] += len(packet)
+        return tick
+
+
+def encode_telemetry(records, tick=0, time_val=0.0, per_datagram=None):
+    """Découpe un tableau d'enregistrements TELEMETRY_RECORD en datagrammes."""
+    records = np.ascontiguousarray(records, dtype=TELEMETRY_RECORD)
+    per_datagram = per_datagram or TELEMETRY_RECORDS_PER_DATAGRAM
+    return [_TELEMETRY_HEADER.pack(TELEMETRY_MAGIC, PROTOCOL_VERSION, 0, len(chunk), tick, time_val)
+            + chunk.tobytes()
+            for chunk in (records[start:start + per_datagram]
+                          for start in range(0, max(len(records), 1), per_datagram))]
+
+
+def decode_telemetry(packet):
+    """(tick, temps, enregistrements) d'un datagramme; les enregistrements sont une vue."""
+    if len(packet) < _TELEMETRY_HEADER.size:
+        raise ValueError("Datagramme de télémétrie tronqué")
+    magic, version, _, count, tick, time_val = _TELEMETRY_HEADER.unpack_from(packet)
+    if magic != TELEMETRY_MAGIC or version != PROTOCOL_VERSION:
+        raise ValueError("Datagramme de télémétrie invalide")
+    if len(packet) != _TELEMETRY_HEADER.size + count * TELEMETRY_RECORD.itemsize:
+        raise ValueError("Taille de datagramme de télémétrie incohérente")
+    return tick, time_val, np.frombuffer(packet, TELEMETRY_RECORD, count, _TELEMETRY_HEADER.size)
+
+
+class LoopbackReceiver:
+    """
+    Récepteur UDP local (port libre sur 127.0.0.1 par défaut): décode et
+    vérifie chaque datagramme de commande. Remplace les robots pour les
+    tests et les mesures de débit.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, buffer_bytes=4 << 20):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_bytes)
+        self.socket.bind((host, port))
+        self.socket.setblocking(False)
+        self.address = self.socket.getsockname()
+        self.decoder = CommandDecoder()
+
+    def poll(self, timeout=0.0):
+        """Décode tous les datagrammes en attente (attend jusqu'à timeout s'il n'y en a aucun)."""
+        received = 0
+        ready, _, _ = select.select([self.socket], [], [], timeout)
+        while ready:
+            try:
+                packet = self.socket.recv(MAX_DATAGRAM)
+            except BlockingIOError:
+                break
+            self.decoder.decode(packet)
+            received += 1
+        return received
+
+    def close(self):
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
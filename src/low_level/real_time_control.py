@@ -1,31 +1,124 @@
 # src/low_level/real_time_control.py
 """
-CONTRÔLE TEMPS RÉEL (Placeholder)
+CONTRÔLE TEMPS RÉEL
+Vitesses et couleurs LED d'un même tick envoyées en un datagramme UDP
+(voir low_level.protocol); sans adresse, l'envoi est simulé. Les poses
+réelles remontent par la télémétrie (low_level.telemetry).
 """
 
 import logging
+import socket
+import numpy as np
+from utils.config import config
+from low_level.protocol import CommandEncoder
+
+def positions_to_velocities(current_pos, target_pos, dt=None, gain=1.0):
+    """Vitesses (2, N) pour rejoindre target_pos en un pas, saturées à MAX_LINEAR_VELOCITY."""
+    dt = dt or 1.0 / config.FPS
+    velocities = gain * (np.asarray(target_pos[:2]) - np.asarray(current_pos[:2])) / dt
+    speed = np.sqrt((velocities ** 2).sum(axis=0))
+    scale = np.minimum(1.0, config.MAX_LINEAR_VELOCITY / np.maximum(speed, 1e-12))
+    return velocities * scale
 
 class RealTimeController:
     """Interface pour le contrôle temps réel des robots."""
     
-    def __init__(self):
+    def __init__(self, safety_filter=None, address=None, keyframe_interval=None, telemetry=None):
         self.connected = False
         self.logger = logging.getLogger("RealTimeCtrl")
+        # Filtre anti-collision optionnel (SafetyFilter)
+        self.safety_filter = safety_filter
+        # (hôte, port) UDP des robots, ou hôte seul sur config.COMMAND_PORT;
+        # None: envoi simulé (paquets construits, non émis)
+        self.address = (address, config.COMMAND_PORT) if isinstance(address, str) else address
+        self.keyframe_interval = keyframe_interval
+        # Retour d'état (TelemetryStore alimenté par un TelemetryListener)
+        self.telemetry = telemetry
+        self.socket = None
+        self.encoder = None
+        self._pending_colors = None
         
     def connect(self):
-        """Simule la connexion aux robots."""
+        """Ouvre le canal UDP vers les robots (ou simule la connexion sans adresse)."""
         self.logger.info("Connexion au système de contrôle...")
+        if self.address is not None:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if self.encoder is not None:
+            self.encoder.force_keyframe()
         self.connected = True
         return True
         
-    def send_velocities(self, velocities):
-        """Envoie les vitesses aux robots (simulation)."""
+    def command_positions(self, current_pos, target_pos, dt=None, colors=None, time_val=0.0):
+        """Position -> vitesse -> filtre de sécurité -> envoi (avec les LEDs du tick)."""
+        velocities = positions_to_velocities(current_pos, target_pos, dt)
+        if self.safety_filter is not None:
+            velocities = self.safety_filter.filter(current_pos, velocities)
+        if colors is not None:
+            self.set_colors(colors)
+        self.send_velocities(velocities, time_val)
+        return velocities
+    
+    def latest_poses(self):
+        """Dernières poses (3, N) x, y, theta reçues des robots (vue sans copie), ou None."""
+        latest = self.telemetry.latest() if self.telemetry is not None else None
+        return None if latest is None else latest[0]
+    
+    def command_tracking(self, tracker, dt=None, colors=None):
+        """
+        Boucle fermée: poses de la télémétrie -> TrackingController (anticipation
+        + correction, horloge du spectacle) -> filtre de sécurité -> envoi.
+        """
+        dt = dt or 1.0 / config.FPS
+        poses = self.latest_poses()
+        if poses is None:
+            return None
+        velocities = tracker.update(poses, dt, self.telemetry.age())
+        if self.safety_filter is not None:
+            velocities = self.safety_filter.filter(poses[:2], velocities)
+        if colors is not None:
+            self.set_colors(colors)
+        self.send_velocities(velocities, tracker.show_time)
+        return velocities
+    
+    def set_colors(self, colors):
+        """Couleurs LED (N, 3) uint8 du tick courant: partent avec les prochaines vitesses."""
+        self._pending_colors = colors
+        
+    def send_velocities(self, velocities, time_val=0.0):
+        """Envoie les vitesses (et les couleurs en attente) en un seul datagramme."""
         if not self.connected:
             return False
-        # Ici on enverrait les commandes UDP/TCP
+        self._send(velocities, self._pending_colors, time_val)
+        self._pending_colors = None
         return True
+    
+    def send_colors(self, colors, time_val=0.0):
+        """Envoie une trame LED seule (robots immobiles, tableaux lumineux)."""
+        if not self.connected:
+            return False
+        self._send(None, colors, time_val)
+        return True
+    
+    def _send(self, velocities, colors, time_val):
+        n = (velocities if velocities is not None else np.asarray(colors).T).shape[1]
+        if self.encoder is None or self.encoder.n != n:
+            self.encoder = CommandEncoder(n, self.keyframe_interval)
+        packet = self.encoder.encode(velocities, colors, time_val)
+        if self.socket is not None:
+            self.socket.sendto(packet, self.address)
+        
+    def disconnect(self):
+        """Ferme le canal UDP (fin de spectacle normale)."""
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+        self.connected = False
         
     def emergency_stop(self):
         """Arrêt d'urgence."""
         self.logger.warning("ARRÊT D'URGENCE ACTIVÉ!")
-        self.connected = False
+        if self.socket is not None:
+            if self.encoder is not None:
+                # Dernier ordre: vitesses nulles pour tous les robots
+                self.send_velocities(np.zeros((2, self.encoder.n)))
+        self.disconnect()
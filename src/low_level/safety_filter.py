@@ -0,0 +1,204 @@
+# src/low_level/safety_filter.py
+"""
+FILTRE DE SÉCURITÉ ANTI-COLLISION (CONTROL BARRIER FUNCTIONS)
+Modifie au minimum les vitesses commandées pour garder 2*ROBOT_RADIUS
+entre robots. Seules les paires voisines (grille spatiale) sont contraintes.
+"""
+
+import numpy as np
+from utils.config import config
+
+# Demi-voisinage: chaque paire de cellules adjacentes n'est visitée qu'une fois
+_HALF_NEIGHBORHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def neighbor_pairs(positions, radius):
+    """
+    Paires (i, j), i != j, à distance < radius via une grille de hachage.
+
+    Coût O(N + paires) au lieu de O(N²): les robots sont triés par cellule,
+    puis chaque robot cherche ses voisins dans 5 cellules par searchsorted.
+    """
+    xy = np.asarray(positions[:2], dtype=np.float64)
+    n = xy.shape[1]
+    if n < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    cells = np.floor(xy / radius).astype(np.int64)
+    cx = cells[0] - cells[0].min()
+    cy = cells[1] - cells[1].min() + 1   # marge pour dy = -1
+    ny = int(cy.max()) + 2               # marge pour dy = +1 (pas d'aliasing)
+    keys = cx * ny + cy
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    robots = np.arange(n)
+
+    all_i, all_j = [], []
+    for dx, dy in _HALF_NEIGHBORHOOD:
+        target = (cx + dx) * ny + (cy + dy)
+        start = np.searchsorted(sorted_keys, target, side='left')
+        counts = np.searchsorted(sorted_keys, target, side='right') - start
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        i = np.repeat(robots, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        j = order[np.repeat(start, counts) + offsets]
+        keep = (i < j) if (dx, dy) == (0, 0) else np.ones(total, dtype=bool)
+        all_i.append(i[keep])
+        all_j.append(j[keep])
+
+    if not all_i:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    i = np.concatenate(all_i)
+    j = np.concatenate(all_j)
+    d2 = ((xy[:, i] - xy[:, j]) ** 2).sum(axis=0)
+    close = d2 < radius * radius
+    return i[close], j[close]
+
+
+class SafetyFilter:
+    """
+    Filtre CBF entre le calcul position -> vitesse et send_velocities.
+
+    Pour chaque paire voisine, h = |pi - pj|² - dmin² et la contrainte
+    dh/dt >= -gamma * h devient linéaire en vitesses:
+        2 (pi - pj) . (vi - vj) >= -gamma * h
+    Le QP min |v - v_cmd|² sous ces contraintes et |vi| <= max_speed est
+    résolu par montée duale projetée (Jacobi), entièrement vectorisée sur
+    les paires: la vitesse maximale est une contrainte du QP (projection
+    sur le disque), pas une saturation appliquée après coup.
+
+    Sans convergence en max_iterations, les robots des paires encore
+    violées sont ralentis (divisés par deux, puis arrêtés): v = 0 satisfait
+    toute paire encore séparée (h >= 0). Avec des positions intégrées à pas
+    dt, la séparation est garantie tant que gamma * dt <= 1.
+    """
+
+    def __init__(self, min_distance=None, gamma=10.0, max_iterations=200,
+                 tolerance=1e-6, max_speed=None, fallback_rounds=4):
+        self.min_distance = min_distance or 2 * config.ROBOT_RADIUS
+        self.gamma = gamma
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.max_speed = max_speed or config.MAX_LINEAR_VELOCITY
+        self.fallback_rounds = fallback_rounds   # Divisions par deux avant l'arrêt
+        # Rayon de voisinage: au-delà, la contrainte est satisfaite pour toutes
+        # vitesses |v| <= max_speed (gamma * h >= 2 |a| * 2 max_speed, |a| = 2d)
+        v4 = 4 * self.max_speed
+        self.sensing_radius = (v4 + np.sqrt(v4 ** 2 + 4 * gamma ** 2 * self.min_distance ** 2)) / (2 * gamma)
+        self.last_stats = {}
+        # Multiplicateurs du tick précédent par paire (démarrage à chaud)
+        self._warm_keys = np.zeros(0, dtype=np.int64)
+        self._warm_lam = np.zeros(0)
+        self._warm_n = 0
+
+    def _limit_speed(self, v):
+        """Projection de chaque vitesse sur le disque |v| <= max_speed (en place)."""
+        speed = np.sqrt((v * v).sum(axis=0))
+        v *= np.minimum(1.0, self.max_speed / np.maximum(speed, 1e-12))
+        return v
+
+    def filter(self, positions, velocities):
+        """Retourne des vitesses (2, N) sûres, aussi proches que possible de velocities."""
+        xy = np.asarray(positions[:2], dtype=np.float64)
+        v_cmd = np.asarray(velocities[:2], dtype=np.float64)
+        n = xy.shape[1]
+        v = self._limit_speed(v_cmd.copy())
+
+        i, j = neighbor_pairs(xy, self.sensing_radius)
+        n_pairs = len(i)
+        iterations = 0
+        violation = 0.0
+        converged = True
+        slowed = 0
+
+        if n_pairs:
+            a = 2.0 * (xy[:, i] - xy[:, j])                  # gradient de h (2, M)
+            h = (a * a).sum(axis=0) / 4.0 - self.min_distance ** 2
+            b = -self.gamma * h
+            # Marge de tolerance: un résidu <= tolerance respecte la contrainte exacte
+            b_margin = b + self.tolerance
+            # Pas de Jacobi: 1 / (|A_k|² * degré max des deux robots)
+            degree = np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+            row_norm = 2.0 * (a * a).sum(axis=0)
+            step = 1.0 / (np.maximum(row_norm, 1e-12) *
+                          np.maximum(degree[i], degree[j]))
+            keys = i * n + j
+            lam = self._warm_start(keys, n)
+            unconstrained = v_cmd.copy()                      # v_cmd + Aᵀλ
+            correction = a * lam
+            for axis in range(2):
+                unconstrained[axis] += (np.bincount(i, correction[axis], minlength=n) -
+                                        np.bincount(j, correction[axis], minlength=n))
+            v = self._limit_speed(unconstrained.copy())
+
+            converged = False
+            for iterations in range(1, self.max_iterations + 1):
+                residual = b_margin - (a * (v[:, i] - v[:, j])).sum(axis=0)
+                violation = float(residual.max())
+                if violation <= self.tolerance:
+                    converged = True
+                    break
+                new_lam = np.maximum(0.0, lam + step * residual)
+                delta = new_lam - lam
+                lam = new_lam
+                correction = a * delta
+                for axis in range(2):
+                    unconstrained[axis] += (np.bincount(i, correction[axis], minlength=n) -
+                                            np.bincount(j, correction[axis], minlength=n))
+                v = self._limit_speed(unconstrained.copy())
+
+            order = np.argsort(keys)
+            self._warm_keys, self._warm_lam, self._warm_n = keys[order], lam[order], n
+            if not converged:
+                v, slowed, violation = self._fallback(v, a, b, i, j, n)
+
+        self.last_stats = {
+            'pairs': n_pairs,
+            'iterations': iterations,
+            'converged': converged,
+            'slowed': slowed,
+            'max_violation': max(violation, 0.0),
+            'modified': int(np.count_nonzero(np.abs(v - v_cmd).sum(axis=0) > 1e-9)),
+        }
+        return v
+
+    def _warm_start(self, keys, n):
+        """Multiplicateurs initiaux: ceux du tick précédent pour les paires déjà contraintes."""
+        lam = np.zeros(len(keys))
+        if len(self._warm_keys) and self._warm_n == n:
+            index = np.minimum(np.searchsorted(self._warm_keys, keys), len(self._warm_keys) - 1)
+            found = self._warm_keys[index] == keys
+            lam[found] = self._warm_lam[index[found]]
+        return lam
+
+    def _fallback(self, v, a, b, i, j, n):
+        """
+        Ralentit les robots des paires violées jusqu'à satisfaire toutes les
+        contraintes réalisables; renvoie (v, robots ralentis, violation restante).
+        """
+        touched = np.zeros(n, dtype=bool)
+        stopped = np.zeros(n, dtype=bool)
+        round_ = 0
+        while True:
+            residual = b - (a * (v[:, i] - v[:, j])).sum(axis=0)
+            violated = residual > 0
+            if round_ >= self.fallback_rounds:
+                # Paires déjà arrêtées des deux côtés: plus rien à ralentir
+                violated &= ~(stopped[i] & stopped[j])
+            if not violated.any():
+                break
+            robots = np.zeros(n, dtype=bool)
+            robots[i[violated]] = True
+            robots[j[violated]] = True
+            touched |= robots
+            if round_ < self.fallback_rounds:
+                v[:, robots] *= 0.5
+            else:
+                # Arrêt (sûr pour toute paire séparée), propagé aux voisins qui en dépendaient
+                v[:, robots] = 0.0
+                stopped |= robots
+            round_ += 1
+        residual = b - (a * (v[:, i] - v[:, j])).sum(axis=0)
+        return v, int(touched.sum()), float(residual.max())
@@ -0,0 +1,242 @@
+# src/low_level/telemetry.py
+"""
+TÉLÉMÉTRIE DES ROBOTS (RETOUR D'ÉTAT)
+Écoute UDP non bloquante (asyncio) des enregistrements de pose, batterie
+et défauts, rangés dans un magasin en structure de tableaux préalloués.
+
+Historique en anneau sans verrou (un écrivain, des lecteurs): l'écouteur
+écrit la trame en cours dans le slot seq % history et la publie en
+incrémentant seq dès que tous les robots du tick émetteur sont arrivés
+(ou, en cas de perte, au premier datagramme du tick suivant). Un lecteur prend
+des vues sur le dernier slot publié sans copie; elles restent intactes
+tant que l'écrivain n'a pas fait le tour de l'anneau (valid(seq)).
+"""
+
+import asyncio
+import socket
+import threading
+import time
+import numpy as np
+from low_level.protocol import TELEMETRY_RECORD, decode_telemetry, encode_telemetry
+
+POSE_DIMS = 3  # x, y, theta
+
+
+class TelemetryStore:
+    """État des N robots: poses et horodatages en anneau, batterie et défauts courants."""
+
+    def __init__(self, n_robots, history=64):
+        if history < 2:
+            raise ValueError("Il faut au moins deux slots (trame publiée + trame en cours)")
+        self.n = n_robots
+        self.history = history
+        self.poses = np.zeros((history, POSE_DIMS, n_robots))
+        self.stamps = np.full((history, n_robots), -np.inf)   # Horloge des robots
+        self.battery = np.zeros(n_robots, dtype=np.float32)   # Fraction 0..1
+        self.faults = np.zeros(n_robots, dtype=np.uint8)
+        self.received = np.full(n_robots, -np.inf)            # Horloge locale (monotonic)
+        self.seq = 0           # Trames publiées; la trame en cours est le slot seq % history
+        self.tick = None       # Tick émetteur de la trame en cours
+        self._pending = 0      # Enregistrements rangés dans la trame en cours
+        self.stats = {'records': 0, 'stale': 0, 'unknown': 0, 'published': 0}
+
+    # ========== ÉCRIVAIN ==========
+
+    def ingest(self, records, tick=None, now=None):
+        """
+        Range des enregistrements TELEMETRY_RECORD dans la trame en cours,
+        publiée dès qu'elle compte N enregistrements. Un tick émetteur
+        nouveau publie d'abord la trame précédente incomplète. Les
+        enregistrements plus vieux que l'état connu du robot sont ignorés.
+        """
+        if tick is not None and tick != self.tick:
+            if self._pending:
+                self.publish()
+            self.tick = tick
+        robots = records['robot'].astype(np.intp)
+        known = robots < self.n
+        self.stats['unknown'] += int(len(robots) - known.sum())
+        slot = self.seq % self.history
+        stamps = self.stamps[slot]
+        fresh = known.copy()
+        fresh[known] = records['time'][known] >= stamps[robots[known]]
+        self.stats['stale'] += int(known.sum() - fresh.sum())
+        if not fresh.all():
+            records, robots = records[fresh], robots[fresh]
+
+        pose = self.poses[slot]
+        pose[0, robots] = records['x']
+        pose[1, robots] = records['y']
+        pose[2, robots] = records['theta']
+        stamps[robots] = records['time']
+        self.battery[robots] = records['battery'] / 255.0
+        self.faults[robots] = records['fault']
+        self.received[robots] = time.monotonic() if now is None else now
+        self.stats['records'] += len(robots)
+        self._pending += len(robots)
+        if self._pending >= self.n:
+            self.publish()
+        return len(robots)
+
+    def publish(self):
+        """Rend la trame en cours lisible; la suivante repart de son contenu."""
+        current = self.seq % self.history
+        following = (self.seq + 1) % self.history
+        self.poses[following] = self.poses[current]
+        self.stamps[following] = self.stamps[current]
+        self._pending = 0
+        self.seq += 1   # Publication: dernière écriture
+        self.stats['published'] += 1
+
+    # ========== LECTEURS ==========
+
+    def latest(self):
+        """(poses (3, N), horodatages (N,), seq) de la dernière trame publiée (vues, sans copie)."""
+        seq = self.seq
+        if seq == 0:
+            return None
+        slot = (seq - 1) % self.history
+        return self.poses[slot], self.stamps[slot], seq
+
+    def valid(self, seq):
+        """Les vues de la trame seq sont-elles encore intactes (pas réécrites par l'anneau)?"""
+        return self.seq - seq < self.history - 1
+
+    def past(self, frames_back):
+        """Vues de la trame publiée frames_back trames avant la dernière (0: la dernière)."""
+        if not 0 <= frames_back < min(self.seq, self.history - 1):
+            raise IndexError(f"Trame -{frames_back} hors de l'historique")
+        slot = (self.seq - 1 - frames_back) % self.history
+        return self.poses[slot], self.stamps[slot]
+
+    def age(self, now=None):
+        """Âge (N,) en secondes de la dernière réception de chaque robot (inf: jamais reçu)."""
+        return (time.monotonic() if now is None else now) - self.received
+
+
+class _TelemetryProtocol(asyncio.DatagramProtocol):
+    """Protocole asyncio: chaque datagramme est décodé et rangé immédiatement."""
+
+    def __init__(self, listener):
+        self.listener = listener
+
+    def datagram_received(self, data, addr):
+        stats = self.listener.stats
+        stats['datagrams'] += 1
+        stats['bytes'] += len(data)
+        try:
+            tick, _, records = decode_telemetry(data)
+        except ValueError:
+            stats['malformed'] += 1
+            return
+        self.listener.store.ingest(records, tick)
+
+
+class TelemetryListener:
+    """
+    Écouteur UDP de télémétrie alimentant un TelemetryStore.
+
+    Dans une boucle asyncio existante: await start() / close(). Pour un
+    contrôleur synchrone: start_thread() lance sa propre boucle dans un
+    thread démon, les lectures du magasin restent sans verrou.
+    """
+
+    def __init__(self, store, host='127.0.0.1', port=0, buffer_bytes=8 << 20):
+        self.store = store
+        self.host, self.port = host, port
+        self.buffer_bytes = buffer_bytes
+        self.address = None
+        self.transport = None
+        self.stats = {'datagrams': 0, 'bytes': 0, 'malformed': 0}
+        self._loop = None
+        self._thread = None
+
+    async def start(self):
+        """Ouvre le socket (port libre par défaut); renvoie l'adresse d'écoute."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.buffer_bytes)
+        sock.bind((self.host, self.port))
+        sock.setblocking(False)
+        self.transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _TelemetryProtocol(self), sock=sock)
+        self.address = sock.getsockname()
+        return self.address
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    def start_thread(self, timeout=5.0):
+        """Lance l'écoute dans un thread (boucle asyncio dédiée); renvoie l'adresse."""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            ready.set()
+            self._loop.run_forever()
+            self.close()
+            self._loop.run_until_complete(asyncio.sleep(0))
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="TelemetryListener", daemon=True)
+        self._thread.start()
+        if not ready.wait(timeout):
+            raise RuntimeError("L'écouteur de télémétrie n'a pas démarré")
+        return self.address
+
+    def stop(self):
+        """Arrête le thread lancé par start_thread()."""
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start_thread()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def telemetry_records(poses, time_val, battery=1.0, faults=0, robots=None):
+    """Enregistrements TELEMETRY_RECORD de poses (3, N) (robots: indices, tous par défaut)."""
+    n = poses.shape[1]
+    records = np.empty(n, dtype=TELEMETRY_RECORD)
+    records['robot'] = np.arange(n) if robots is None else robots
+    records['x'], records['y'], records['theta'] = poses[0], poses[1], poses[2]
+    records['time'] = time_val
+    records['battery'] = np.clip(np.rint(np.asarray(battery) * 255), 0, 255)
+    records['fault'] = faults
+    return records
+
+
+def fleet_telemetry_process(address, n_robots, rate=100.0, duration=1.0, seed=0):
+    """
+    Processus émetteur minimal (à lancer avec multiprocessing.Process): N
+    robots sur des cercles publient leur pose à rate Hz pendant duration s.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rng = np.random.default_rng(seed)
+    radius = rng.uniform(0.2, 0.9, n_robots)
+    phase = rng.uniform(0, 2 * np.pi, n_robots)
+    poses = np.zeros((POSE_DIMS, n_robots))
+    period = 1.0 / rate
+    start = time.perf_counter()
+    try:
+        for tick in range(int(round(duration * rate))):
+            t = tick * period
+            angle = phase + 0.5 * t
+            poses[0], poses[1] = radius * np.cos(angle), radius * np.sin(angle)
+            poses[2] = angle + np.pi / 2
+            battery = 1.0 - 0.001 * t
+            for packet in encode_telemetry(telemetry_records(poses, t, battery), tick, t):
+                sock.sendto(packet, address)
+            # Cadence fixe, sans dérive cumulée
+            delay = start + (tick + 1) * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    finally:
+        sock.close()
@@ -0,0 +1,130 @@
+# src/low_level/tracking.py
+"""
+SUIVI EN BOUCLE FERMÉE DES TRAJECTOIRES PRÉ-CALCULÉES
+À chaque tick, compare les cibles pré-calculées (bake_positions) aux poses
+remontées par la télémétrie et calcule pour tous les robots, en une passe:
+    v = anticipation (dérivée de la cible à l'horloge du spectacle)
+      + kp · (cible - pose)
+saturé à MAX_LINEAR_VELOCITY. Les robots sans télémétrie récente ne
+reçoivent que l'anticipation.
+
+Horloge du spectacle mise à l'échelle: elle avance de rate · dt par tick,
+rate ∈ [min_rate, 1] baissant quand l'essaim prend du retard (erreur de
+suivi au percentile lag_percentile) ou quand l'anticipation dépasse la
+vitesse des robots, puis remontant progressivement.
+"""
+
+import numpy as np
+from utils.config import config
+
+
+class TrackingController:
+    """Suivi de targets (frames, dims, N) échantillonnées à fps par N robots réels."""
+
+    def __init__(self, targets, fps=None, kp=2.0, slow_error=0.05, stop_error=0.25,
+                 lag_percentile=90, min_rate=0.0, headroom=0.8, rate_down=2.0, rate_up=0.5,
+                 tolerance=0.05, stale_after=0.2):
+        self.targets = np.asarray(targets)
+        if self.targets.ndim != 3 or len(self.targets) < 2:
+            raise ValueError(f"Cibles (frames >= 2, dims, N) attendues, reçu {self.targets.shape}")
+        self.fps = fps or config.FPS
+        self.n = self.targets.shape[2]
+        self.duration = (len(self.targets) - 1) / self.fps
+        self.kp = kp
+        self.slow_error, self.stop_error = slow_error, stop_error
+        self.lag_percentile = lag_percentile
+        self.min_rate = min_rate
+        self.headroom = headroom          # Part de la vitesse max laissée à l'anticipation
+        self.rate_down, self.rate_up = rate_down, rate_up   # Variation max de rate par seconde
+        self.tolerance = tolerance        # Erreur au-delà de laquelle un robot est en retard
+        self.stale_after = stale_after    # Âge max (s) de la télémétrie pour la correction
+
+        self.show_time = 0.0
+        self.rate = 1.0
+        self.target = np.zeros((2, self.n))
+        self.feedforward = np.zeros((2, self.n))
+        self.velocities = np.zeros((2, self.n))
+        self.error = np.zeros(self.n)
+        self._error_sq_sum = np.zeros(self.n)
+        self.error_max = np.zeros(self.n)
+        self.samples = 0
+
+    @property
+    def done(self):
+        return self.show_time >= self.duration
+
+    def sample(self, show_time):
+        """Cible (2, N) et vitesse de référence (2, N), en m par seconde de spectacle."""
+        position = min(max(show_time, 0.0), self.duration) * self.fps
+        i = min(int(position), len(self.targets) - 2)
+        a = position - i
+        before, after = self.targets[i, :2], self.targets[i + 1, :2]
+        np.subtract(after, before, out=self.feedforward)
+        np.multiply(self.feedforward, a, out=self.target)
+        self.target += before
+        self.feedforward *= self.fps
+        if show_time >= self.duration:
+            self.feedforward[...] = 0.0   # Fin du spectacle: tenir la dernière formation
+        return self.target, self.feedforward
+
+    def update(self, poses, dt, age=None):
+        """
+        Un tick: vitesses (2, N) à envoyer pour des poses mesurées (2+, N).
+        age (N,): âge de la télémétrie de chaque robot (None: toute fraîche).
+        Le tableau renvoyé est réutilisé au tick suivant.
+        """
+        target, reference = self.sample(self.show_time)
+        error_xy = target - poses[:2]
+        np.hypot(error_xy[0], error_xy[1], out=self.error)
+        fresh = None if age is None else np.asarray(age) <= self.stale_after
+
+        # Anticipation à l'échelle de l'horloge + correction proportionnelle
+        velocities = np.multiply(reference, self.rate, out=self.velocities)
+        if fresh is None:
+            velocities += self.kp * error_xy
+        else:
+            velocities += self.kp * error_xy * fresh
+        speed = np.hypot(velocities[0], velocities[1])
+        velocities *= np.minimum(1.0, config.MAX_LINEAR_VELOCITY / np.maximum(speed, 1e-12))
+
+        self._record()
+        self._scale_clock(reference, dt, fresh)
+        self.show_time = min(self.duration, self.show_time + self.rate * dt)
+        return velocities
+
+    def _scale_clock(self, reference, dt, fresh):
+        """Rapproche rate de la cadence tenable (retard de l'essaim, vitesse de la référence)."""
+        peak = np.hypot(reference[0], reference[1]).max()
+        feasible = min(1.0, self.headroom * config.MAX_LINEAR_VELOCITY / max(peak, 1e-12))
+        errors = self.error if fresh is None or fresh.all() else self.error[fresh]
+        lag = np.percentile(errors, self.lag_percentile) if len(errors) else 0.0
+        span = max(self.stop_error - self.slow_error, 1e-12)
+        on_time = 1.0 - np.clip((lag - self.slow_error) / span, 0.0, 1.0)
+        wanted = max(self.min_rate, min(feasible, on_time))
+        step = (self.rate_up if wanted > self.rate else self.rate_down) * dt
+        self.rate = float(np.clip(wanted, self.rate - step, self.rate + step))
+
+    def _record(self):
+        self._error_sq_sum += self.error * self.error
+        np.maximum(self.error_max, self.error, out=self.error_max)
+        self.samples += 1
+
+    # ========== STATISTIQUES ==========
+
+    def robot_rms(self):
+        """Erreur quadratique moyenne (N,) de chaque robot depuis le début."""
+        return np.sqrt(self._error_sq_sum / max(self.samples, 1))
+
+    def report(self):
+        """Statistiques de suivi: tick courant et cumul sur le spectacle."""
+        return {
+            'show_time': self.show_time,
+            'rate': self.rate,
+            'mean': float(self.error.mean()),
+            'p95': float(np.percentile(self.error, 95)),
+            'max': float(self.error.max()),
+            'lagging': int((self.error > self.tolerance).sum()),
+            'rms_mean': float(self.robot_rms().mean()),
+            'worst_robot': int(np.argmax(self.robot_rms())),
+            'worst_max': float(self.error_max.max()),
+        }
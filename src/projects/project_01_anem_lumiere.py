@@ -8,16 +8,23 @@ import numpy as np
 from formations.letter_formations import LetterFormations
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.flow_field import FlowField
+from animations.cloth import FlagCloth
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project01AnemLumiere:
     """Implémentation du Tableau #1: Naissance d'une Nation avec illusion 3D."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.letters = LetterFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
+        # Ombrage (N,) du tissu accompagnant la dernière frame cédée (None hors drapeau):
+        # à passer avec la frame à get_phase_color(s)(..., shading=)
+        self.frame_shading = None
         
         # Structure en 6 phases (30s chacune = 3 minutes)
         self.phases = {
@@ -33,10 +40,11 @@ class Project01AnemLumiere:
         print(f"   Drones: {self.n}")
         print(f"   Durée totale: {sum(self.phases.values())}s")
 
-    def _get_z_positions(self, x, y, time_val, effect_type='flat'):
+    def _get_z_positions(self, x, y, time_val, effect_type='flat', rng=None):
         """Génère la composante Z pour l'illusion 3D."""
         if effect_type == 'storm':
-            return 0.5 + 0.3 * np.random.randn(self.n) # Particules en l'air
+            rng = rng or self.random.at_time('storm_z', time_val)
+            return 0.5 + 0.3 * rng.standard_normal(self.n) # Particules en l'air
         elif effect_type == 'wave':
             return 0.1 * np.sin(x * 2 + time_val * 3) # Ondulation drapeau
         return np.zeros(self.n)
@@ -44,14 +52,27 @@ class Project01AnemLumiere:
     def phase_1_tempête_sable(self, duration=30):
         """Phase 1: Tempête de sable orange (0:00-0:30)."""
         steps = int(duration * config.FPS)
+        bounds = (-1.6, 1.6, -1.0, 1.0)
+        rng = self.random.stream('1_tempête_sable', 0)
+        positions = np.array([rng.uniform(-1.6, 1.6, self.n), rng.uniform(-1.0, 1.0, self.n)])
+        z_base = self._get_z_positions(positions[0], positions[1], 0.0, 'storm', rng)
+        z_phase = rng.uniform(0, 2*np.pi, self.n)
+        
+        # Vent en rafales + turbulence + deux tourbillons: les grains sont
+        # transportés d'une frame à l'autre au lieu d'être re-tirés au hasard
+        storm = (FlowField()
+                 .add_wind((0.25, 0.03), gust=0.5, gust_frequency=0.2)
+                 .add_curl_noise(amplitude=0.35, scale=1.5, speed=0.15, rng=rng)
+                 .add_vortex((-0.6, 0.3), 0.6, 0.7)
+                 .add_vortex((0.7, -0.3), -0.5, 0.6))
+        dt = 1.0 / config.FPS
         for step in range(steps):
             time_val = step / config.FPS
-            # Mouvement chaotique dans l'espace
-            x = np.random.uniform(-1.6, 1.6, self.n)
-            y = np.random.uniform(-1.0, 1.0, self.n)
-            z = self._get_z_positions(x, y, time_val, 'storm')
+            if step > 0:
+                storm.advect(positions, time_val, dt, bounds, out=positions)
+            z = z_base + 0.08 * np.sin(2*np.pi*0.7*time_val + z_phase)
             
-            yield np.array([x, y, z]), time_val
+            yield np.array([positions[0], positions[1], z]), time_val
 
     def phase_2_émergence_vert(self, start_pos, duration=30):
         """Phase 2: Émergence bande verte (0:30-1:00)."""
@@ -90,23 +111,24 @@ class Project01AnemLumiere:
         start_time = sum(list(self.phases.values())[:3])
         for step, pos in enumerate(self.transitions.interpolate_positions(start_pos[:2], target[:2], duration)):
             time_val = start_time + step / config.FPS
-            z = 0.1 * np.cos(time_val * 4) # Pulsation en Z
+            z = np.full(self.n, 0.1 * np.cos(time_val * 4)) # Pulsation en Z
             yield np.array([pos[0], pos[1], z]), time_val
 
     def phase_5_drapeau_ondulant(self, start_pos, duration=30):
         """Phase 5: Drapeau complet qui ondule (2:00-2:30)."""
-        grid_width = int(np.sqrt(self.n * 1.5))
-        grid_height = self.n // grid_width
-        x = np.linspace(-1.3, 1.3, grid_width)
-        y = np.linspace(-0.6, 0.6, grid_height)
-        xx, yy = np.meshgrid(x, y)
-        target_2d = np.array([xx.flatten()[:self.n], yy.flatten()[:self.n]])
+        # Tissu simulé (grille 40x25), robots en rangées régulières sur le drapeau
+        cloth = FlagCloth(width=2.6, height=1.2)
+        cloth.bind(cloth.grid_uv(self.n))
+        flag, shade = cloth.sample()
+        target_2d = flag[:2].copy()
         
         start_time = sum(list(self.phases.values())[:4])
         for step, pos in enumerate(self.transitions.interpolate_positions(start_pos[:2], target_2d, duration)):
             time_val = start_time + step / config.FPS
-            z = self._get_z_positions(pos[0], pos[1], time_val, 'wave')
-            yield np.array([pos[0], pos[1], z]), time_val
+            cloth.frame(1.0 / config.FPS, flag, shade)
+            self.frame_shading = shade
+            yield np.array([pos[0], pos[1], flag[2]]), time_val
+        self.frame_shading = None
 
     def phase_6_niger_3d(self, start_pos, duration=30):
         """Phase 6: Transformation en NIGER 3D (2:30-3:00)."""
@@ -139,11 +161,9 @@ class Project01AnemLumiere:
             (self.phase_6_niger_3d, "NIGER 3D")
         ]
         
-        for method, label in phase_methods:
-            phase_duration = self.phases[f"{phase_methods.index((method, label))+2}_{label.lower().replace(' ', '_')}"] if f"{phase_methods.index((method, label))+2}_{label.lower().replace(' ', '_')}" in self.phases else 30
-            # Correction index pour les clés de phases
-            phase_key = [k for k in self.phases.keys() if label.lower().replace(' ', '_') in k][0]
-            for pos, t in method(current_pos, self.phases[phase_key]):
+        # Durées dans l'ordre des phases (les libellés ne correspondent pas tous aux clés)
+        for (method, label), phase_duration in zip(phase_methods, list(self.phases.values())[1:]):
+            for pos, t in method(current_pos, phase_duration):
                 current_pos = pos
                 yield pos, label, t, frame_count
                 frame_count += 1
\ No newline at end of file
@@ -7,18 +7,22 @@ Robotarium Swarm - ANEM 2025
 import numpy as np
 import matplotlib.pyplot as plt
 from formations.base_formations import BaseFormations
+from formations.svg_formations import SvgFormations
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project02Monuments:
     """Implémentation du projet Monuments Iconiques du Niger."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
+        self.silhouettes = SvgFormations(self.n)  # Silhouettes SVG (assets/silhouettes)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
         
         # Phases du projet (durées en secondes)
         self.phases = {
@@ -41,7 +45,7 @@ class Project02Monuments:
         steps = int(duration * config.FPS)
         
         # Transition depuis positions aléatoires
-        start_pos = self.base.random_positions()
+        start_pos = self.base.random_positions(self.random.stream('1_mosquee_agadez'))
         
         for step, intermediate_pos in enumerate(
             self.transitions.interpolate_positions(start_pos, target_mosquee, 20)  # 20s de transition
@@ -147,187 +151,16 @@ class Project02Monuments:
             yield rotated_pos, time_val
 
     def _create_mosquee_agadez(self):
-        """Crée la formation de la Mosquée d'Agadez."""
-        positions = np.zeros((2, self.n))
-        
-        # Répartition des robots
-        n_base = self.n // 3      # Base rectangulaire
-        n_minaret = self.n // 3   # Minaret
-        n_details = self.n - 2 * (self.n // 3)  # Détails
-        
-        robot_count = 0
-        
-        # BASE RECTANGULAIRE
-        if robot_count < self.n:
-            base_robots = min(n_base, self.n - robot_count)
-            # Rectangle pour la base
-            x_base = np.linspace(-0.6, 0.6, int(np.sqrt(base_robots)))
-            y_base = np.linspace(-0.3, -0.1, int(np.sqrt(base_robots)))
-            xx, yy = np.meshgrid(x_base, y_base)
-            
-            for i in range(min(base_robots, xx.size)):
-                if robot_count < self.n:
-                    positions[0, robot_count] = xx.flatten()[i]
-                    positions[1, robot_count] = yy.flatten()[i]
-                    robot_count += 1
-        
-        # MINARET PYRAMIDAL
-        if robot_count < self.n:
-            minaret_robots = min(n_minaret, self.n - robot_count)
-            # Pyramide pour le minaret
-            levels = 4
-            robots_per_level = minaret_robots // levels
-            
-            for level in range(levels):
-                level_robots = robots_per_level if level < levels - 1 else minaret_robots - level * robots_per_level
-                width = 0.4 * (1 - level/levels)  # Rétrécissement
-                height = 0.1 + level * 0.15
-                
-                x_minaret = np.linspace(-width/2, width/2, level_robots)
-                y_minaret = np.full(level_robots, height)
-                
-                for i in range(level_robots):
-                    if robot_count < self.n:
-                        positions[0, robot_count] = x_minaret[i]
-                        positions[1, robot_count] = y_minaret[i]
-                        robot_count += 1
-        
-        # DÉTAILS ARCHITECTURAUX
-        if robot_count < self.n:
-            detail_robots = min(n_details, self.n - robot_count)
-            # Ajouter des détails (torons, etc.)
-            x_details = np.random.uniform(-0.7, 0.7, detail_robots)
-            y_details = np.random.uniform(-0.2, 0.5, detail_robots)
-            
-            for i in range(detail_robots):
-                if robot_count < self.n:
-                    positions[0, robot_count] = x_details[i]
-                    positions[1, robot_count] = y_details[i]
-                    robot_count += 1
-        
-        return positions
+        """Crée la formation de la Mosquée d'Agadez (assets/silhouettes/mosquee_agadez.svg)."""
+        return self.silhouettes.silhouette('mosquee_agadez')
 
     def _create_girafe_silhouette(self):
-        """Crée la formation de la girafe du Niger."""
-        positions = np.zeros((2, self.n))
-        
-        # Répartition anatomique
-        n_tete = max(3, self.n // 15)        # Tête
-        n_cou = max(8, self.n // 6)          # Cou
-        n_corps = max(10, self.n // 5)       # Corps
-        n_pattes = 4 * max(2, self.n // 20)  # 4 pattes
-        n_queue = max(2, self.n // 25)       # Queue
-        n_rest = self.n - (n_tete + n_cou + n_corps + n_pattes + n_queue)
-        
-        robot_count = 0
-        
-        # TÊTE
-        if robot_count < self.n:
-            # Cercle pour la tête
-            angles = np.linspace(0, 2*np.pi, n_tete, endpoint=False)
-            positions[0, robot_count:robot_count+n_tete] = 0.3 + 0.08 * np.cos(angles)
-            positions[1, robot_count:robot_count+n_tete] = 0.6 + 0.08 * np.sin(angles)
-            robot_count += n_tete
-        
-        # COU (courbe en S)
-        if robot_count < self.n:
-            t_cou = np.linspace(0, 1, n_cou)
-            # Courbe en S pour le cou
-            x_cou = 0.15 * np.sin(2*np.pi*t_cou)  # Légère courbure
-            y_cou = 0.6 - t_cou * 0.8  # Du haut vers le bas
-            
-            positions[0, robot_count:robot_count+n_cou] = x_cou
-            positions[1, robot_count:robot_count+n_cou] = y_cou
-            robot_count += n_cou
-        
-        # CORPS (ellipse)
-        if robot_count < self.n:
-            angles_corps = np.linspace(0, 2*np.pi, n_corps, endpoint=False)
-            positions[0, robot_count:robot_count+n_corps] = -0.1 + 0.3 * np.cos(angles_corps)
-            positions[1, robot_count:robot_count+n_corps] = -0.2 + 0.2 * np.sin(angles_corps)
-            robot_count += n_corps
-        
-        # PATTES
-        if robot_count < self.n:
-            patte_positions = [
-                (-0.3, -0.2, -0.3, -0.6),   # Patte avant gauche
-                (-0.1, -0.2, -0.1, -0.6),   # Patte avant droite
-                (-0.4, -0.2, -0.4, -0.6),   # Patte arrière gauche  
-                (-0.0, -0.2, -0.0, -0.6)    # Patte arrière droite
-            ]
-            
-            robots_par_patte = n_pattes // 4
-            for patte in patte_positions:
-                if robot_count < self.n:
-                    patte_robots = min(robots_par_patte, self.n - robot_count)
-                    x_patte = np.linspace(patte[0], patte[2], patte_robots)
-                    y_patte = np.linspace(patte[1], patte[3], patte_robots)
-                    
-                    positions[0, robot_count:robot_count+patte_robots] = x_patte
-                    positions[1, robot_count:robot_count+patte_robots] = y_patte
-                    robot_count += patte_robots
-        
-        # QUEUE
-        if robot_count < self.n:
-            queue_robots = min(n_queue, self.n - robot_count)
-            x_queue = np.linspace(-0.5, -0.6, queue_robots)
-            y_queue = np.linspace(-0.1, -0.3, queue_robots)
-            
-            positions[0, robot_count:robot_count+queue_robots] = x_queue
-            positions[1, robot_count:robot_count+queue_robots] = y_queue
-            robot_count += queue_robots
-        
-        # RESTE (taches, etc.)
-        if robot_count < self.n:
-            rest_robots = self.n - robot_count
-            # Ajouter des points aléatoires pour les taches
-            x_rest = np.random.uniform(-0.4, 0.1, rest_robots)
-            y_rest = np.random.uniform(-0.3, 0.3, rest_robots)
-            
-            positions[0, robot_count:] = x_rest
-            positions[1, robot_count:] = y_rest
-        
-        return positions
+        """Crée la formation de la girafe du Niger (assets/silhouettes/girafe.svg)."""
+        return self.silhouettes.silhouette('girafe')
 
     def _create_croix_agadez(self):
-        """Crée la formation de la Croix d'Agadez (12 branches)."""
-        positions = np.zeros((2, self.n))
-        
-        n_branches = 12
-        robots_par_branche = self.n // (n_branches + 1)  # +1 pour le centre
-        
-        robot_count = 0
-        
-        # CENTRE DE LA CROIX
-        if robot_count < self.n:
-            centre_robots = min(8, self.n - robot_count)
-            # Cercle central
-            angles_centre = np.linspace(0, 2*np.pi, centre_robots, endpoint=False)
-            positions[0, robot_count:robot_count+centre_robots] = 0.1 * np.cos(angles_centre)
-            positions[1, robot_count:robot_count+centre_robots] = 0.1 * np.sin(angles_centre)
-            robot_count += centre_robots
-        
-        # 12 BRANCHES
-        for branche in range(n_branches):
-            if robot_count >= self.n:
-                break
-                
-            branche_robots = min(robots_par_branche, self.n - robot_count)
-            angle = branche * (2 * np.pi / n_branches)
-            
-            # Longueur de la branche
-            longueur = 0.7
-            
-            # Points le long de la branche
-            t = np.linspace(0.1, longueur, branche_robots)
-            x_branche = t * np.cos(angle)
-            y_branche = t * np.sin(angle)
-            
-            positions[0, robot_count:robot_count+branche_robots] = x_branche
-            positions[1, robot_count:robot_count+branche_robots] = y_branche
-            robot_count += branche_robots
-        
-        return positions
+        """Crée la formation de la Croix d'Agadez, 12 branches (assets/silhouettes/croix_agadez.svg)."""
+        return self.silhouettes.silhouette('croix_agadez')
 
     def run_complete_animation(self):
         """Exécute l'animation complète du projet."""
@@ -11,15 +11,17 @@ from formations.base_formations import BaseFormations
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project03Vagues:
     """Implémentation du projet Vagues Océaniques."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
         
         # Phases du projet (durées en secondes)
         self.phases = {
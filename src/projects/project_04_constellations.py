@@ -5,21 +5,28 @@ Robotarium Swarm - ANEM 2025
 Formation dynamique de constellations célèbres avec transitions fluides
 """
 
+import logging
 import numpy as np
 import matplotlib.pyplot as plt
 from formations.base_formations import BaseFormations
+from formations.star_catalog import StarCatalog, SPECTRAL_HEX, SPECTRAL_RGB, DEFAULT_SPECTRAL
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.kinematics import DifferentialRotation, pulsate
+from animations.time_scaling import TrapezoidalPlan
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project04Constellations:
     """Implémentation du projet Constellation Vivante."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
+        self.logger = logging.getLogger("Project04")
         
         # Phases du projet (durées en secondes)
         self.phases = {
@@ -29,43 +36,8 @@ class Project04Constellations:
             '4_spirale_galactique': 60 # 3:00-4:00
         }
         
-        # Données astronomiques réelles
-        self.constellations = {
-            'grande_ourse': [
-                {"nom": "Dubhe", "pos": (0.5, 0.8), "mag": 1.8, "type": "K"},
-                {"nom": "Merak", "pos": (0.7, 0.6), "mag": 2.4, "type": "A"},
-                {"nom": "Phecda", "pos": (0.9, 0.5), "mag": 2.4, "type": "A"},
-                {"nom": "Megrez", "pos": (1.0, 0.7), "mag": 3.3, "type": "A"},
-                {"nom": "Alioth", "pos": (1.2, 0.9), "mag": 1.8, "type": "A"},
-                {"nom": "Mizar", "pos": (1.4, 1.0), "mag": 2.2, "type": "A"},
-                {"nom": "Alkaid", "pos": (1.6, 0.8), "mag": 1.9, "type": "B"}
-            ],
-            'orion': [
-                {"nom": "Bételgeuse", "pos": (-0.8, 0.6), "mag": 0.5, "type": "M"},
-                {"nom": "Rigel", "pos": (0.9, -0.7), "mag": 0.1, "type": "B"},
-                {"nom": "Bellatrix", "pos": (-0.5, 0.4), "mag": 1.6, "type": "B"},
-                {"nom": "Mintaka", "pos": (0.0, 0.0), "mag": 2.2, "type": "O"},
-                {"nom": "Alnilam", "pos": (0.1, 0.1), "mag": 1.7, "type": "B"},
-                {"nom": "Alnitak", "pos": (0.2, 0.2), "mag": 1.9, "type": "O"}
-            ],
-            'croix_sud': [
-                {"nom": "Acrux", "pos": (0.0, 0.6), "mag": 0.8, "type": "B"},
-                {"nom": "Mimosa", "pos": (0.3, 0.3), "mag": 1.3, "type": "B"},
-                {"nom": "Gacrux", "pos": (0.0, -0.6), "mag": 1.6, "type": "M"},
-                {"nom": "Imai", "pos": (-0.3, 0.0), "mag": 2.8, "type": "B"}
-            ]
-        }
-        
-        # Couleurs stellaires selon la température
-        self.couleurs_etoiles = {
-            "O": "#9BB0FF",  # Très chaude (bleu)
-            "B": "#AABFFF",  # Chaude (bleu-blanc)
-            "A": "#CAD7FF",  # Blanc
-            "F": "#F8F7FF",  # Blanc jaunâtre
-            "G": "#FFF4EA",  # Jaune (Soleil)
-            "K": "#FFD2A1",  # Orange
-            "M": "#FFCC6F"   # Froide (rouge)
-        }
+        # Données astronomiques réelles (catalogue en colonnes)
+        self.catalog = StarCatalog.from_constellations()
         
         print(f"🚀 PROJET #4 INITIALISÉ: {self.n} robots")
         print(f"📊 Durée totale: {sum(self.phases.values())} secondes (4 minutes)")
@@ -80,22 +52,17 @@ class Project04Constellations:
         # Créer la formation de la Grande Ourse
         target_ourse = self._create_grande_ourse()
         
-        # Transition depuis positions aléatoires (20s)
-        start_pos = self.base.random_positions()
+        # Transition depuis positions aléatoires en temps minimal (vitesse et accélération bornées)
+        start_pos = self.base.random_positions(self.random.stream('1_grande_ourse'))
         
-        for step, intermediate_pos in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_ourse, 20)
-        ):
-            time_val = start_time + step / config.FPS
-            yield intermediate_pos, time_val
-            current_pos = intermediate_pos
+        transition_steps = yield from self._planned_transition(start_pos, target_ourse, start_time, steps)
         
-        # Animation de la constellation (40s)
-        maintain_steps = steps - int(20 * config.FPS)
+        # Animation de la constellation (reste de la phase)
+        maintain_steps = steps - transition_steps
         base_positions = target_ourse.copy()
         
         for step in range(maintain_steps):
-            time_val = start_time + 20 + step / config.FPS
+            time_val = start_time + (transition_steps + step) / config.FPS
             
             # Rotation lente autour de l'étoile polaire
             angle = 2 * np.pi * 0.05 * time_val  # Rotation très lente
@@ -132,20 +99,15 @@ class Project04Constellations:
         # Créer la formation d'Orion
         target_orion = self._create_orion()
         
-        # Transition depuis Grande Ourse (20s)
-        for step, intermediate_pos in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_orion, 20)
-        ):
-            time_val = start_time + step / config.FPS
-            yield intermediate_pos, time_val
-            current_pos = intermediate_pos
+        # Transition depuis Grande Ourse en temps minimal (vitesse et accélération bornées)
+        transition_steps = yield from self._planned_transition(start_pos, target_orion, start_time, steps)
         
-        # Animation d'Orion (40s)
-        maintain_steps = steps - int(20 * config.FPS)
+        # Animation d'Orion (reste de la phase)
+        maintain_steps = steps - transition_steps
         base_positions = target_orion.copy()
         
         for step in range(maintain_steps):
-            time_val = start_time + 20 + step / config.FPS
+            time_val = start_time + (transition_steps + step) / config.FPS
             
             # Animation de la nébuleuse (mouvement de nuage)
             nebula_movement = 0.05 * np.sin(2*np.pi*0.3*time_val + np.arange(self.n)*0.01)
@@ -175,20 +137,15 @@ class Project04Constellations:
         # Créer la formation de la Croix du Sud
         target_croix = self._create_croix_sud()
         
-        # Transition depuis Orion (20s)
-        for step, intermediate_pos in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_croix, 20)
-        ):
-            time_val = start_time + step / config.FPS
-            yield intermediate_pos, time_val
-            current_pos = intermediate_pos
+        # Transition depuis Orion en temps minimal (vitesse et accélération bornées)
+        transition_steps = yield from self._planned_transition(start_pos, target_croix, start_time, steps)
         
-        # Animation de la Croix du Sud (40s)
-        maintain_steps = steps - int(20 * config.FPS)
+        # Animation de la Croix du Sud (reste de la phase)
+        maintain_steps = steps - transition_steps
         base_positions = target_croix.copy()
         
         for step in range(maintain_steps):
-            time_val = start_time + 20 + step / config.FPS
+            time_val = start_time + (transition_steps + step) / config.FPS
             
             # Rotation complète de la croix
             angle = 2 * np.pi * 0.1 * time_val  # Rotation toutes les 10s
@@ -224,85 +181,67 @@ class Project04Constellations:
         # Créer la formation spirale galactique
         target_galaxie = self._create_spirale_galactique()
         
-        # Transition depuis Croix du Sud (20s)
-        for step, intermediate_pos in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_galaxie, 20)
-        ):
-            time_val = start_time + step / config.FPS
-            yield intermediate_pos, time_val
-            current_pos = intermediate_pos
+        # Transition depuis Croix du Sud en temps minimal (vitesse et accélération bornées)
+        transition_steps = yield from self._planned_transition(start_pos, target_galaxie, start_time, steps)
         
-        # Animation de la galaxie (40s)
-        maintain_steps = steps - int(20 * config.FPS)
-        base_positions = target_galaxie.copy()
+        # Animation de la galaxie (reste de la phase)
+        maintain_steps = steps - transition_steps
+        # Rayons et vitesses angulaires calculés une seule fois pour la phase
+        rotation = DifferentialRotation(target_galaxie, omega=0.5, k=2.0)  # Plus rapide au centre
         
         for step in range(maintain_steps):
-            time_val = start_time + 20 + step / config.FPS
+            time_val = start_time + (transition_steps + step) / config.FPS
             
             # Rotation différentielle (centre plus rapide)
-            animated_pos = base_positions.copy()
-            
-            for i in range(self.n):
-                x = base_positions[0, i]
-                y = base_positions[1, i]
-                
-                # Distance du centre
-                r = np.sqrt(x**2 + y**2)
-                
-                # Vitesse angulaire décroissante avec la distance
-                angular_speed = 0.5 / (1 + r*2)  # Plus rapide au centre
-                angle = angular_speed * time_val
-                
-                # Rotation
-                new_x = x * np.cos(angle) - y * np.sin(angle)
-                new_y = x * np.sin(angle) + y * np.cos(angle)
-                
-                animated_pos[0, i] = new_x
-                animated_pos[1, i] = new_y
+            animated_pos = rotation.evaluate(time_val)
             
             # Légère expansion/contraction
             pulse = 1.0 + 0.05 * np.sin(2*np.pi*0.2*time_val)
-            center = np.mean(animated_pos, axis=1, keepdims=True)
-            animated_pos = center + (animated_pos - center) * pulse
+            pulsate(animated_pos, pulse, out=animated_pos)
             
             yield animated_pos, time_val
 
+    def _planned_transition(self, start_pos, target, start_time, steps):
+        """
+        Transition synchronisée en temps minimal (TrapezoidalPlan) au lieu
+        d'une durée fixe; retourne le nombre de frames utilisées.
+
+        Un plan plus long que la phase est accéléré pour occuper toute la
+        phase (la cible est atteinte, sans saut vers la phase suivante) et
+        signalé: les vitesses dépassent alors MAX_LINEAR_VELOCITY.
+        """
+        plan = TrapezoidalPlan(start_pos, target)
+        transition_steps = plan.n_frames(config.FPS)
+        scale = 1.0
+        if transition_steps > steps:
+            scale = transition_steps / steps
+            self.logger.warning(
+                f"Transition de {plan.duration:.1f}s pour une phase de {steps / config.FPS:.1f}s: "
+                f"accélérée x{scale:.2f} (vitesse max dépassée)")
+            transition_steps = steps
+        for step in range(1, transition_steps + 1):
+            t = min(step * scale / config.FPS, plan.duration)
+            yield plan.evaluate(t), start_time + (step - 1) / config.FPS
+        return transition_steps
+
     def _create_grande_ourse(self):
         """Crée la formation de la Grande Ourse."""
         positions = np.zeros((2, self.n))
         
         # Étoiles principales (7 étoiles)
-        etoiles_principales = self.constellations['grande_ourse']
-        n_principales = min(len(etoiles_principales), self.n // 2)
-        
-        robot_count = 0
-        
-        # Placer les étoiles principales
-        for i in range(n_principales):
-            if robot_count < self.n:
-                etoile = etoiles_principales[i]
-                positions[0, robot_count] = etoile['pos'][0]
-                positions[1, robot_count] = etoile['pos'][1]
-                robot_count += 1
-        
-        # Environnement stellaire (étoiles secondaires)
-        n_secondaires = self.n - robot_count
-        if n_secondaires > 0:
-            # Répartir autour des étoiles principales
-            for i in range(n_secondaires):
-                if robot_count < self.n:
-                    # Choisir une étoile principale aléatoire comme centre
-                    centre_idx = np.random.randint(0, n_principales)
-                    centre_x = etoiles_principales[centre_idx]['pos'][0]
-                    centre_y = etoiles_principales[centre_idx]['pos'][1]
-                    
-                    # Position aléatoire autour du centre
-                    angle = np.random.uniform(0, 2*np.pi)
-                    distance = np.random.uniform(0.1, 0.3)
-                    
-                    positions[0, robot_count] = centre_x + distance * np.cos(angle)
-                    positions[1, robot_count] = centre_y + distance * np.sin(angle)
-                    robot_count += 1
+        etoiles = self.catalog.indices('grande_ourse')
+        n_principales = min(len(etoiles), self.n // 2)
+        positions[:, :n_principales] = self.catalog.positions[:, etoiles[:n_principales]]
+        
+        # Environnement stellaire: étoiles secondaires autour d'une étoile principale
+        n_secondaires = self.n - n_principales
+        rng = self.random.stream('grande_ourse')
+        if n_secondaires > 0 and n_principales > 0:
+            centres = self.catalog.positions[:, etoiles[rng.integers(0, n_principales, n_secondaires)]]
+            angle = rng.uniform(0, 2*np.pi, n_secondaires)
+            distance = rng.uniform(0.1, 0.3, n_secondaires)
+            positions[0, n_principales:] = centres[0] + distance * np.cos(angle)
+            positions[1, n_principales:] = centres[1] + distance * np.sin(angle)
         
         return positions
 
@@ -310,52 +249,35 @@ class Project04Constellations:
         """Crée la formation de la constellation d'Orion."""
         positions = np.zeros((2, self.n))
         
-        etoiles_orion = self.constellations['orion']
+        etoiles_orion = self.catalog.indices('orion')
         n_principales = min(len(etoiles_orion), self.n // 3)
         
-        robot_count = 0
-        
         # Étoiles principales
-        for i in range(n_principales):
-            if robot_count < self.n:
-                etoile = etoiles_orion[i]
-                positions[0, robot_count] = etoile['pos'][0]
-                positions[1, robot_count] = etoile['pos'][1]
-                robot_count += 1
+        positions[:, :n_principales] = self.catalog.positions[:, etoiles_orion[:n_principales]]
+        robot_count = n_principales
         
         # Ceinture d'Orion (3 étoiles alignées)
-        if robot_count < self.n:
-            ceinture_robots = min(15, self.n - robot_count)
-            for i in range(ceinture_robots):
-                if robot_count < self.n:
-                    x = -0.1 + i * (0.2 / (ceinture_robots - 1)) if ceinture_robots > 1 else 0
-                    y = 0.0
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = y
-                    robot_count += 1
+        ceinture_robots = min(15, self.n - robot_count)
+        if ceinture_robots > 0:
+            x = np.linspace(-0.1, 0.1, ceinture_robots) if ceinture_robots > 1 else 0.0
+            positions[0, robot_count:robot_count+ceinture_robots] = x
+            positions[1, robot_count:robot_count+ceinture_robots] = 0.0
+            robot_count += ceinture_robots
+        
+        rng = self.random.stream('orion')
         
         # Nébuleuse d'Orion (nuage autour de la ceinture)
-        if robot_count < self.n:
-            nebula_robots = min(20, self.n - robot_count)
-            for i in range(nebula_robots):
-                if robot_count < self.n:
-                    # Position aléatoire dans la zone de la nébuleuse
-                    x = np.random.uniform(-0.3, 0.4)
-                    y = np.random.uniform(-0.2, 0.3)
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = y
-                    robot_count += 1
+        nebula_robots = min(20, self.n - robot_count)
+        if nebula_robots > 0:
+            positions[0, robot_count:robot_count+nebula_robots] = rng.uniform(-0.3, 0.4, nebula_robots)
+            positions[1, robot_count:robot_count+nebula_robots] = rng.uniform(-0.2, 0.3, nebula_robots)
+            robot_count += nebula_robots
         
         # Étoiles environnantes
-        if robot_count < self.n:
-            rest_robots = self.n - robot_count
-            for i in range(rest_robots):
-                if robot_count < self.n:
-                    x = np.random.uniform(-1.0, 1.0)
-                    y = np.random.uniform(-0.8, 0.8)
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = y
-                    robot_count += 1
+        rest_robots = self.n - robot_count
+        if rest_robots > 0:
+            positions[0, robot_count:] = rng.uniform(-1.0, 1.0, rest_robots)
+            positions[1, robot_count:] = rng.uniform(-0.8, 0.8, rest_robots)
         
         return positions
 
@@ -363,51 +285,37 @@ class Project04Constellations:
         """Crée la formation de la Croix du Sud."""
         positions = np.zeros((2, self.n))
         
-        etoiles_croix = self.constellations['croix_sud']
+        etoiles_croix = self.catalog.indices('croix_sud')
         n_principales = min(len(etoiles_croix), self.n // 4)
-        
-        robot_count = 0
+        rng = self.random.stream('croix_sud')
         
         # Étoiles principales de la croix
-        for i in range(n_principales):
-            if robot_count < self.n:
-                etoile = etoiles_croix[i]
-                positions[0, robot_count] = etoile['pos'][0]
-                positions[1, robot_count] = etoile['pos'][1]
-                robot_count += 1
+        positions[:, :n_principales] = self.catalog.positions[:, etoiles_croix[:n_principales]]
+        robot_count = n_principales
         
         # Renforcer la forme de croix
-        if robot_count < self.n:
-            croix_robots = min(20, self.n - robot_count)
-            
+        croix_robots = min(20, self.n - robot_count)
+        if croix_robots > 0:
             # Bras vertical
             bras_v = min(8, croix_robots // 2)
-            for i in range(bras_v):
-                if robot_count < self.n:
-                    y = -0.6 + i * (1.2 / (bras_v - 1)) if bras_v > 1 else 0
-                    positions[0, robot_count] = 0.0
-                    positions[1, robot_count] = y
-                    robot_count += 1
+            if bras_v > 0:
+                positions[0, robot_count:robot_count+bras_v] = 0.0
+                positions[1, robot_count:robot_count+bras_v] = np.linspace(-0.6, 0.6, bras_v) if bras_v > 1 else 0.0
+                robot_count += bras_v
             
             # Bras horizontal
             bras_h = croix_robots - bras_v
-            for i in range(bras_h):
-                if robot_count < self.n:
-                    x = -0.3 + i * (0.6 / (bras_h - 1)) if bras_h > 1 else 0
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = 0.0
-                    robot_count += 1
+            positions[0, robot_count:robot_count+bras_h] = np.linspace(-0.3, 0.3, bras_h) if bras_h > 1 else 0.0
+            positions[1, robot_count:robot_count+bras_h] = 0.0
+            robot_count += bras_h
         
         # Étoiles environnantes
-        if robot_count < self.n:
-            rest_robots = self.n - robot_count
-            for i in range(rest_robots):
-                if robot_count < self.n:
-                    angle = np.random.uniform(0, 2*np.pi)
-                    distance = np.random.uniform(0.4, 0.8)
-                    positions[0, robot_count] = distance * np.cos(angle)
-                    positions[1, robot_count] = distance * np.sin(angle)
-                    robot_count += 1
+        rest_robots = self.n - robot_count
+        if rest_robots > 0:
+            angle = rng.uniform(0, 2*np.pi, rest_robots)
+            distance = rng.uniform(0.4, 0.8, rest_robots)
+            positions[0, robot_count:] = distance * np.cos(angle)
+            positions[1, robot_count:] = distance * np.sin(angle)
         
         return positions
 
@@ -461,12 +369,25 @@ class Project04Constellations:
         
         return positions
 
-    def get_star_color(self, robot_index, constellation_data):
+    def get_star_color(self, robot_index, constellation):
         """Retourne la couleur d'une étoile selon son type spectral."""
-        if robot_index < len(constellation_data):
-            star_type = constellation_data[robot_index]['type']
-            return self.couleurs_etoiles.get(star_type, self.couleurs_etoiles['G'])
-        return self.couleurs_etoiles['G']
+        etoiles = self.catalog.indices(constellation)
+        if robot_index < len(etoiles):
+            return SPECTRAL_HEX[self.catalog.spectral[etoiles[robot_index]]]
+        return SPECTRAL_HEX[DEFAULT_SPECTRAL]
+
+    def get_star_colors(self, constellation):
+        """Couleurs RGB (N, 3): étoiles principales pondérées par leur magnitude, les autres solaires."""
+        colors = np.tile(SPECTRAL_RGB[DEFAULT_SPECTRAL] / 255.0, (self.n, 1))
+        etoiles = self.catalog.indices(constellation)[:self.n]
+        colors[:len(etoiles)] = self.catalog.rgb(etoiles)
+        return colors
+
+    def create_ciel_nocturne(self, catalog_path, max_magnitude=None):
+        """Ciel réaliste: les N étoiles les plus brillantes d'un catalogue CSV."""
+        catalog = StarCatalog.from_csv(catalog_path, max_magnitude)
+        positions, colors, _ = catalog.night_sky(self.n)
+        return positions, colors
 
     def run_complete_animation(self):
         """Exécute l'animation complète du projet."""
@@ -10,16 +10,19 @@ import matplotlib.pyplot as plt
 from formations.base_formations import BaseFormations
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.particles import ParticlePool
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project05FeuxArtifice:
     """Implémentation du projet Feu d'Artifice Nigérien."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
         
         # Phases du projet (durées en secondes)
         self.phases = {
@@ -35,6 +38,12 @@ class Project05FeuxArtifice:
         self.v0_fusee = 2.0    # Vitesse initiale montée
         self.v0_explosion = 1.5 # Vitesse dispersion
         
+        # Étincelles décoratives semées par les drones (n'influencent pas les drones)
+        self.sparks_per_robot = 3
+        self.sparks = ParticlePool(50000, palette=[config.COLORS['or_soleil'], config.COLORS['orange_niger'],
+                                                   config.COLORS['blanc_pure'], config.COLORS['rouge_passion']],
+                                   rng=self.random.stream('etincelles'))
+        
         print(f"🚀 PROJET #5 INITIALISÉ: {self.n} robots")
         print(f"📊 Durée totale: {sum(self.phases.values())} secondes (2.5 minutes)")
 
@@ -286,6 +295,21 @@ class Project05FeuxArtifice:
             
             yield positions, time_val
 
+    def update_particles(self, time_val, positions):
+        """
+        Étincelles de la frame: chaque drone sème quelques étincelles qui
+        retombent (gravité, traînée) et s'éteignent en moins de 1.2s.
+        Renvoie le pool (positions, fade() et colors() pour le rendu).
+        """
+        rng = self.sparks.rng
+        count = self.sparks_per_robot * positions.shape[1]
+        origin = np.repeat(positions[:2], self.sparks_per_robot, axis=1)
+        self.sparks.emit(count, origin, velocity=0.0, velocity_spread=0.35,
+                         lifetime=rng.uniform(0.4, 1.2, count),
+                         color=rng.integers(0, len(self.sparks.palette), count))
+        self.sparks.step(1.0 / config.FPS, gravity=(0.0, -self.g), drag=1.5, time_val=time_val)
+        return self.sparks
+
     def _calculate_explosion_positions(self):
         """Calcule les positions optimales pour les explosions."""
         # Pour l'instant, retourne des positions par défaut
@@ -8,18 +8,23 @@ Formation d'une spirale logarithmique basée sur le nombre d'or φ = 1.618
 import numpy as np
 import matplotlib.pyplot as plt
 from formations.base_formations import BaseFormations
+from formations.golden_formations import GoldenFormations, fibonacci_numbers
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.kinematics import DifferentialRotation, pulsate
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project06SpiraleFibonacci:
     """Implémentation du projet Spirale d'Or de Fibonacci."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
+        self.golden = GoldenFormations(self.n)  # Formations dorées mémorisées par N
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
         
         # Phases du projet (durées en secondes)
         self.phases = {
@@ -75,31 +80,13 @@ class Project06SpiraleFibonacci:
         start_time = self.phases['1_construction']
         steps = int(duration * config.FPS)
         
-        base_positions = self._create_fibonacci_spiral()
+        # Vitesse angulaire décroissante avec la distance (comme dans les
+        # galaxies spirales), calculée une seule fois pour la phase
+        rotation = DifferentialRotation(self._create_fibonacci_spiral(), omega=0.5, k=3.0)
         
         for step in range(steps):
             time_val = start_time + step / config.FPS
-            positions = base_positions.copy()
-            
-            # Appliquer la rotation différentielle
-            for i in range(self.n):
-                x = base_positions[0, i]
-                y = base_positions[1, i]
-                
-                # Distance du centre
-                r = np.sqrt(x**2 + y**2)
-                
-                # Vitesse angulaire décroissante avec la distance
-                # (comme dans les galaxies spirales)
-                angular_speed = 0.5 / (1 + r*3)
-                angle = angular_speed * time_val
-                
-                # Rotation
-                new_x = x * np.cos(angle) - y * np.sin(angle)
-                new_y = x * np.sin(angle) + y * np.cos(angle)
-                
-                positions[0, i] = new_x
-                positions[1, i] = new_y
+            positions = rotation.evaluate(time_val)
             
             yield positions, time_val
 
@@ -111,17 +98,16 @@ class Project06SpiraleFibonacci:
         steps = int(duration * config.FPS)
         
         base_positions = self._create_fibonacci_spiral()
+        center = (0.0, 0.0)  # Centre à l'origine
         
         for step in range(steps):
             time_val = start_time + step / config.FPS
-            positions = base_positions.copy()
             
             # Effet de pulsation (respiration)
             pulse_factor = 1.0 + 0.2 * np.sin(2 * np.pi * 0.5 * time_val)
             
-            # Appliquer la pulsation
-            center = np.array([[0.0], [0.0]])  # Centre à l'origine
-            positions = center + (positions - center) * pulse_factor
+            # Appliquer la pulsation (seul le tampon de sortie est alloué)
+            positions = pulsate(base_positions, pulse_factor, center=center)
             
             yield positions, time_val
 
@@ -143,134 +129,20 @@ class Project06SpiraleFibonacci:
             yield intermediate_pos, time_val
 
     def _create_fibonacci_spiral(self):
-        """Crée une spirale de Fibonacci (spirale d'or)."""
-        positions = np.zeros((2, self.n))
-        
-        # Méthode de Vogel pour une distribution optimale
-        for i in range(self.n):
-            # Angle selon l'angle d'or
-            theta = i * self.angle_or
-            
-            # Rayon selon une spirale logarithmique
-            r = 0.1 * np.sqrt(i + 1)  # Spirale de Vogel
-            
-            # Coordonnées
-            positions[0, i] = r * np.cos(theta)
-            positions[1, i] = r * np.sin(theta)
-        
-        return positions
+        """Crée une spirale de Fibonacci (spirale d'or, méthode de Vogel)."""
+        return self.golden.vogel(scale=0.1, angle=self.angle_or)
 
     def _create_rectangles_dores(self):
         """Crée une formation de rectangles dorés imbriqués."""
-        positions = np.zeros((2, self.n))
-        
-        # Suite de Fibonacci
-        fibonacci = self._generate_fibonacci(10)  # Générer les 10 premiers termes
-        
-        robot_count = 0
-        current_x, current_y = 0.0, 0.0
-        direction = 0  # 0: droite, 1: haut, 2: gauche, 3: bas
-        
-        for i in range(len(fibonacci) - 1):
-            if robot_count >= self.n:
-                break
-                
-            a = fibonacci[i] * 0.1   # Petit côté
-            b = fibonacci[i+1] * 0.1 # Grand côté (suivant Fibonacci)
-            
-            # Nombre de robots pour ce rectangle
-            n_rect = min(int(self.n * 0.7 / len(fibonacci)), self.n - robot_count)
-            
-            if n_rect > 0:
-                # Créer les points du rectangle
-                if direction == 0:  # Vers la droite
-                    x_rect = np.linspace(current_x, current_x + b, int(np.sqrt(n_rect)))
-                    y_rect = np.linspace(current_y, current_y + a, int(np.sqrt(n_rect)))
-                    current_x += b
-                elif direction == 1:  # Vers le haut
-                    x_rect = np.linspace(current_x - a, current_x, int(np.sqrt(n_rect)))
-                    y_rect = np.linspace(current_y, current_y + b, int(np.sqrt(n_rect)))
-                    current_y += b
-                elif direction == 2:  # Vers la gauche
-                    x_rect = np.linspace(current_x - b, current_x, int(np.sqrt(n_rect)))
-                    y_rect = np.linspace(current_y - a, current_y, int(np.sqrt(n_rect)))
-                    current_x -= b
-                else:  # Vers le bas
-                    x_rect = np.linspace(current_x, current_x + a, int(np.sqrt(n_rect)))
-                    y_rect = np.linspace(current_y - b, current_y, int(np.sqrt(n_rect)))
-                    current_y -= b
-                
-                # Grille pour le rectangle
-                xx, yy = np.meshgrid(x_rect, y_rect)
-                
-                # Placer les robots
-                rect_positions = np.array([xx.flatten(), yy.flatten()])
-                n_place = min(n_rect, rect_positions.shape[1])
-                
-                positions[0, robot_count:robot_count+n_place] = rect_positions[0, :n_place]
-                positions[1, robot_count:robot_count+n_place] = rect_positions[1, :n_place]
-                robot_count += n_place
-                
-                # Changer de direction
-                direction = (direction + 1) % 4
-        
-        # Si des robots restent, les placer en spirale au centre
-        if robot_count < self.n:
-            remaining = self.n - robot_count
-            spiral_remaining = self._create_fibonacci_spiral()[:, :remaining]
-            positions[0, robot_count:] = spiral_remaining[0, :]
-            positions[1, robot_count:] = spiral_remaining[1, :]
-        
-        return positions
+        return self.golden.golden_rectangles(n_terms=10, unit=0.1)
 
     def _generate_fibonacci(self, n):
         """Génère les n premiers termes de la suite de Fibonacci."""
-        fib = [0, 1]
-        for i in range(2, n):
-            fib.append(fib[i-1] + fib[i-2])
-        return fib
+        return fibonacci_numbers(n)
 
     def _create_suite_carres(self):
         """Crée une formation basée sur la suite de carrés de Fibonacci."""
-        positions = np.zeros((2, self.n))
-        
-        # Suite de Fibonacci pour les tailles des carrés
-        fib = self._generate_fibonacci(8)  # 8 termes
-        fib = [f for f in fib if f > 0]  # Enlever le 0
-        
-        robot_count = 0
-        current_x, current_y = 0.0, 0.0
-        
-        for i, size in enumerate(fib):
-            if robot_count >= self.n:
-                break
-                
-            taille_carre = size * 0.08
-            n_carre = min(int(self.n / len(fib)), self.n - robot_count)
-            
-            if n_carre > 0:
-                # Créer un carré
-                cote = int(np.sqrt(n_carre))
-                if cote < 2: cote = 2
-                
-                x_carre = np.linspace(current_x, current_x + taille_carre, cote)
-                y_carre = np.linspace(current_y, current_y + taille_carre, cote)
-                
-                xx, yy = np.meshgrid(x_carre, y_carre)
-                carre_positions = np.array([xx.flatten(), yy.flatten()])
-                
-                n_place = min(n_carre, carre_positions.shape[1])
-                positions[0, robot_count:robot_count+n_place] = carre_positions[0, :n_place]
-                positions[1, robot_count:robot_count+n_place] = carre_positions[1, :n_place]
-                robot_count += n_place
-                
-                # Déplacer la position pour le prochain carré
-                if i % 2 == 0:
-                    current_x += taille_carre + 0.05
-                else:
-                    current_y += taille_carre + 0.05
-        
-        return positions
+        return self.golden.fibonacci_squares(n_terms=8, unit=0.08)
 
     def run_complete_animation(self):
         """Exécute l'animation complète du projet."""
@@ -10,16 +10,24 @@ import matplotlib.pyplot as plt
 from formations.base_formations import BaseFormations
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.particles import ParticlePool
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project08Calligraphie:
     """Implémentation du projet Calligraphie Arabe Animée."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
+        
+        # Gouttes d'encre décoratives qui perlent du tracé (indépendantes des drones)
+        self.ink = ParticlePool(20000, palette=[config.COLORS['or_soleil'], config.COLORS['terre_agadez'],
+                                                config.COLORS['blanc_pure']],
+                                rng=self.random.stream('gouttes_encre'))
         
         # Phases du projet (durées en secondes)
         self.phases = {
@@ -382,6 +390,21 @@ class Project08Calligraphie:
         
         return positions
 
+    def update_particles(self, time_val, positions, drops_per_frame=40):
+        """
+        Gouttes d'encre de la frame: des gouttes se détachent de drones tirés
+        au hasard, glissent puis tombent (gravité) et sèchent en 1 à 2.5s.
+        Renvoie le pool (positions, fade() et colors() pour le rendu).
+        """
+        rng = self.ink.rng
+        source = rng.integers(0, positions.shape[1], drops_per_frame)
+        self.ink.emit(drops_per_frame, positions[:2, source], velocity=(0.0, -0.05),
+                      position_spread=0.01, velocity_spread=0.03,
+                      lifetime=rng.uniform(1.0, 2.5, drops_per_frame),
+                      color=rng.integers(0, len(self.ink.palette), drops_per_frame))
+        self.ink.step(1.0 / config.FPS, gravity=(0.0, -0.4), drag=2.0, time_val=time_val)
+        return self.ink
+
     def run_complete_animation(self):
         """Exécute l'animation complète du projet."""
         print("🎬 Démarrage du PROJET #8: CALLIGRAPHIE ARABE ANIMÉE")
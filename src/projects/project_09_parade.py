@@ -7,19 +7,23 @@ Spectacle chorégraphié en 7 tableaux - Expérience visuelle complète
 
 import numpy as np
 import matplotlib.pyplot as plt
-from formations.base_formations import BaseFormations
+from formations.base_formations import BaseFormations, split_counts
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.flow_field import FlowField
 from utils.config import config
+from utils.frame_buffers import FrameBuffers
+from utils.random_streams import ShowRandom
 
 class Project09GrandeParade:
     """Implémentation du projet La Grande Parade."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
         
         # Phases du projet (durées en secondes)
         self.phases = {
@@ -35,26 +39,34 @@ class Project09GrandeParade:
         print(f"🎪 PROJET #9 INITIALISÉ: {self.n} robots")
         print(f"📊 Durée totale: {sum(self.phases.values())} secondes (7 minutes)")
 
-    def phase_1_entree_militaire(self, duration=60):
+    def _buffers(self, buffers):
+        """Tampons fournis par l'appelant, sinon un double tampon propre à l'appel."""
+        return buffers if buffers is not None else FrameBuffers(2, self.n)
+
+    def phase_1_entree_militaire(self, duration=60, buffers=None):
         """Tableau 1: Entrée Militaire - Défilé synchronisé."""
         print("🎖️  Tableau 1: Entrée Militaire")
         
         start_time = 0
         steps = int(duration * config.FPS)
         
-        # Formation militaire (5 rangées de 10 robots)
-        base_positions = self._create_military_formation()
+        # Formation militaire (rangées et colonnes déduites de N)
+        base_positions, row_of = self._create_military_formation(with_rows=True)
+        row_phase = row_of * 0.5
+        buffers = self._buffers(buffers)
+        row_offset = np.empty(self.n)
         
         for step in range(steps):
             time_val = start_time + step / config.FPS
-            positions = base_positions.copy()
+            positions = buffers.next()
+            np.copyto(positions, base_positions)
             
             # Animation de marche synchronisée
-            # Effet de vague entre les rangées
-            for row in range(5):
-                row_offset = 0.02 * np.sin(2*np.pi*1.0*time_val + row*0.5)
-                row_indices = list(range(row*10, (row+1)*10))
-                positions[1, row_indices] += row_offset
+            # Effet de vague entre les rangées (décalage de chaque rangée diffusé à ses robots)
+            np.add(row_phase, 2*np.pi*1.0*time_val, out=row_offset)
+            np.sin(row_offset, out=row_offset)
+            row_offset *= 0.02
+            positions[1] += row_offset
             
             # Avancée progressive depuis la gauche
             entrance_progress = min(1.0, time_val / 10.0)  # 10s pour entrer complètement
@@ -62,52 +74,38 @@ class Project09GrandeParade:
             
             yield positions, time_val
 
-    def phase_2_tempete_sable(self, start_pos, duration=60):
+    def phase_2_tempete_sable(self, start_pos, duration=60, buffers=None):
         """Tableau 2: Tempête de Sable - Chaos contrôlé."""
         print("🌪️  Tableau 2: Tempête de Sable")
         
         start_time = self.phases['1_entree_militaire']
         steps = int(duration * config.FPS)
         
+        # Tourbillons contrôlés: déplacement tangentiel évalué d'un bloc
+        vortices = FlowField().add_vortex((-0.8, 0.4), 0.1, 0.6).add_vortex((0.8, -0.4), 0.1, 0.6)
+        indices = np.arange(self.n)
+        buffers = self._buffers(buffers)
+        start_pos = buffers.snapshot(start_pos)
+        
         # Transition vers le chaos
         for step in range(steps):
             time_val = start_time + step / config.FPS
-            positions = start_pos.copy()
+            positions = buffers.next()
+            np.copyto(positions, start_pos)
             
             # Progression du chaos (0 à 1)
             chaos_factor = min(1.0, (time_val - start_time) / 20.0)
             
-            # Application du chaos contrôlé
-            for i in range(self.n):
-                # Mouvement brownien avec amplitude croissante
-                brownian_x = 0.3 * chaos_factor * np.sin(2*np.pi*0.8*time_val + i*0.7)
-                brownian_y = 0.2 * chaos_factor * np.cos(2*np.pi*0.6*time_val + i*0.9)
-                
-                positions[0, i] += brownian_x
-                positions[1, i] += brownian_y
+            # Mouvement brownien avec amplitude croissante (tous les robots à la fois)
+            positions[0] += 0.3 * chaos_factor * np.sin(2*np.pi*0.8*time_val + indices*0.7)
+            positions[1] += 0.2 * chaos_factor * np.cos(2*np.pi*0.6*time_val + indices*0.9)
             
-            # Tourbillons contrôlés
             if chaos_factor > 0.5:
-                vortex_centers = [(-0.8, 0.4), (0.8, -0.4)]
-                for vx, vy in vortex_centers:
-                    for i in range(self.n):
-                        dx = positions[0, i] - vx
-                        dy = positions[1, i] - vy
-                        distance = np.sqrt(dx**2 + dy**2)
-                        
-                        if distance < 0.6:
-                            # Force vortex
-                            vortex_strength = 0.1 * (0.6 - distance) / 0.6
-                            angle = np.arctan2(dy, dx)
-                            vortex_x = -vortex_strength * np.sin(angle)
-                            vortex_y = vortex_strength * np.cos(angle)
-                            
-                            positions[0, i] += vortex_x
-                            positions[1, i] += vortex_y
+                positions += vortices.velocity(positions, time_val)
             
             yield positions, time_val
 
-    def phase_3_vagues_ocean(self, start_pos, duration=60):
+    def phase_3_vagues_ocean(self, start_pos, duration=60, buffers=None):
         """Tableau 3: Vagues Océaniques - Onde propagée."""
         print("🌊 Tableau 3: Vagues Océaniques")
         
@@ -118,7 +116,8 @@ class Project09GrandeParade:
         wave_positions = self._create_wave_formation()
         
         for step, positions in enumerate(
-            self.transitions.interpolate_positions(start_pos, wave_positions, 5, 'ease_in_out')
+            self.transitions.interpolate_positions(start_pos, wave_positions, 5, 'ease_in_out',
+                                                   buffers=self._buffers(buffers))
         ):
             if step >= steps:
                 break
@@ -129,15 +128,12 @@ class Project09GrandeParade:
             wave_frequency = 2.0
             wave_amplitude = 0.2
             
-            for i in range(positions.shape[1]):
-                x = positions[0, i]
-                # Vague sinusoïdale se propageant de droite à gauche
-                wave_offset = wave_amplitude * np.sin(wave_frequency * x - wave_speed * time_val)
-                positions[1, i] += wave_offset
+            # Vague sinusoïdale se propageant de droite à gauche
+            positions[1] += wave_amplitude * np.sin(wave_frequency * positions[0] - wave_speed * time_val)
             
             yield positions, time_val
 
-    def phase_4_spirale_hypnotique(self, start_pos, duration=60):
+    def phase_4_spirale_hypnotique(self, start_pos, duration=60, buffers=None):
         """Tableau 4: Spirale Hypnotique - Rotation galactique."""
         print("🌀 Tableau 4: Spirale Hypnotique")
         
@@ -148,44 +144,38 @@ class Project09GrandeParade:
         spiral_positions = self._create_spiral_formation()
         
         for step, positions in enumerate(
-            self.transitions.interpolate_positions(start_pos, spiral_positions, 5, 'ease_in_out')
+            self.transitions.interpolate_positions(start_pos, spiral_positions, 5, 'ease_in_out',
+                                                   buffers=self._buffers(buffers))
         ):
             if step >= steps:
                 break
             time_val = start_time + step / config.FPS
             
             # Rotation différentielle (comme une galaxie)
-            center_x, center_y = 0.0, 0.0
+            x, y = positions[0].copy(), positions[1].copy()
+            distance = np.sqrt(x**2 + y**2)
             
-            for i in range(positions.shape[1]):
-                x = positions[0, i] - center_x
-                y = positions[1, i] - center_y
-                distance = np.sqrt(x**2 + y**2)
-                
-                # Vitesse angulaire décroissante avec la distance
-                angular_speed = 0.8 / (1 + distance * 2)
-                angle = angular_speed * time_val
-                
-                # Rotation
-                new_x = x * np.cos(angle) - y * np.sin(angle)
-                new_y = x * np.sin(angle) + y * np.cos(angle)
-                
-                positions[0, i] = center_x + new_x
-                positions[1, i] = center_y + new_y
+            # Vitesse angulaire décroissante avec la distance
+            angle = 0.8 / (1 + distance * 2) * time_val
+            cos_a, sin_a = np.cos(angle), np.sin(angle)
+            positions[0] = x * cos_a - y * sin_a
+            positions[1] = x * sin_a + y * cos_a
             
             yield positions, time_val
 
-    def phase_5_feu_artifice(self, start_pos, duration=60):
+    def phase_5_feu_artifice(self, start_pos, duration=60, buffers=None):
         """Tableau 5: Feu d'Artifice - Explosions multiples."""
         print("🎆 Tableau 5: Feu d'Artifice")
         
         start_time = self.phases['1_entree_militaire'] + self.phases['2_tempete_sable'] + self.phases['3_vagues_ocean'] + self.phases['4_spirale_hypnotique']
         steps = int(duration * config.FPS)
         
-        # Simulation de feux d'artifice
+        buffers = self._buffers(buffers)
+        
+        # Simulation de feux d'artifice (chaque robot est réécrit à chaque frame)
         for step in range(steps):
             time_val = start_time + step / config.FPS
-            positions = np.zeros((2, self.n))
+            positions = buffers.next()
             
             # Gestion des explosions
             explosion_times = [5, 15, 25, 35, 45]  # Temps des explosions
@@ -229,14 +219,14 @@ class Project09GrandeParade:
             # Robots restants en position aléatoire basse
             if robot_count < self.n:
                 remaining = self.n - robot_count
-                ground_x = np.random.uniform(-1.2, 1.2, remaining)
+                ground_x = self.random.stream('5_feu_artifice', step).uniform(-1.2, 1.2, remaining)
                 ground_y = np.full(remaining, -0.8)
                 positions[0, robot_count:] = ground_x
                 positions[1, robot_count:] = ground_y
             
             yield positions, time_val
 
-    def phase_6_formations_geo(self, start_pos, duration=60):
+    def phase_6_formations_geo(self, start_pos, duration=60, buffers=None):
         """Tableau 6: Formation Géométrique - Transitions fluides."""
         print("🔷 Tableau 6: Formations Géométriques")
         
@@ -253,6 +243,8 @@ class Project09GrandeParade:
         ]
         
         shape_duration = duration / len(shapes)
+        buffers = self._buffers(buffers)
+        morph = np.empty((2, self.n))
         
         current_shape_idx = 0
         shape_start_time = start_time
@@ -271,18 +263,19 @@ class Project09GrandeParade:
             next_shape = shapes[min(current_shape_idx + 1, len(shapes) - 1)]
             
             # Interpolation entre formes
-            positions = current_shape + (next_shape - current_shape) * min(shape_progress, 1.0)
+            np.subtract(next_shape, current_shape, out=morph)
+            morph *= min(shape_progress, 1.0)
+            morph += current_shape
             
             # Rotation lente
             angle = 0.1 * np.sin(2*np.pi*0.2*time_val)
-            for i in range(positions.shape[1]):
-                x, y = positions[0, i], positions[1, i]
-                positions[0, i] = x * np.cos(angle) - y * np.sin(angle)
-                positions[1, i] = x * np.sin(angle) + y * np.cos(angle)
+            rotation = np.array([[np.cos(angle), -np.sin(angle)],
+                                 [np.sin(angle), np.cos(angle)]])
+            positions = np.matmul(rotation, morph, out=buffers.next())
             
             yield positions, time_val
 
-    def phase_7_coeur_final(self, start_pos, duration=60):
+    def phase_7_coeur_final(self, start_pos, duration=60, buffers=None):
         """Tableau 7: Cœur Final - Pulsation émotionnelle."""
         print("❤️  Tableau 7: Cœur Final")
         
@@ -293,7 +286,8 @@ class Project09GrandeParade:
         heart_positions = self._create_heart_formation()
         
         for step, positions in enumerate(
-            self.transitions.interpolate_positions(start_pos, heart_positions, 5, 'ease_in_out')
+            self.transitions.interpolate_positions(start_pos, heart_positions, 5, 'ease_in_out',
+                                                   buffers=self._buffers(buffers))
         ):
             if step >= steps:
                 break
@@ -306,83 +300,47 @@ class Project09GrandeParade:
             pulse_factor = 1.0 + pulse_strength * np.sin(2*np.pi*pulse_rate*time_val)
             
             # Appliquer la pulsation depuis le centre
-            center_x, center_y = 0.0, 0.0
-            for i in range(positions.shape[1]):
-                dx = positions[0, i] - center_x
-                dy = positions[1, i] - center_y
-                
-                positions[0, i] = center_x + dx * pulse_factor
-                positions[1, i] = center_y + dy * pulse_factor
+            positions *= pulse_factor
             
             yield positions, time_val
 
-    def _create_military_formation(self):
-        """Crée une formation militaire (5x10)."""
-        positions = np.zeros((2, self.n))
-        
-        rows = 5
-        cols = self.n // rows
-        remaining = self.n % rows
-        
-        robot_count = 0
-        
-        for row in range(rows):
-            n_cols = cols + (1 if row < remaining else 0)
-            if robot_count >= self.n:
-                break
-                
-            for col in range(n_cols):
-                if robot_count < self.n:
-                    x = -1.2 + col * (2.4 / max(1, n_cols-1))
-                    y = -0.6 + row * (1.2 / max(1, rows-1))
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = y
-                    robot_count += 1
-        
-        return positions
+    def _grid_shape(self, width, height):
+        """Nombre de rangées et de colonnes pour N robots sur un rectangle width x height."""
+        cols = max(1, int(round(np.sqrt(self.n * width / height))))
+        return int(np.ceil(self.n / cols)), cols
+
+    def _rows_layout(self, n_rows, x_range, y_range):
+        """
+        Rangées horizontales réparties sur y_range, robots de chaque rangée
+        étalés sur x_range. Retourne les positions et l'indice de rangée de
+        chaque robot (précalculé une fois pour les animations par rangée).
+        """
+        counts = split_counts(self.n, n_rows)
+        row_of = np.repeat(np.arange(n_rows), counts)
+        col = np.arange(self.n) - (np.cumsum(counts) - counts)[row_of]
+        x = x_range[0] + col * (x_range[1] - x_range[0]) / np.maximum(1, counts[row_of] - 1)
+        y = y_range[0] + row_of * (y_range[1] - y_range[0]) / max(1, n_rows - 1)
+        return np.array([x, y]), row_of
+
+    def _create_military_formation(self, with_rows=False):
+        """Crée une formation militaire (5x10 pour 50 robots, proportions conservées au-delà)."""
+        rows, _ = self._grid_shape(2.4, 1.2)
+        positions, row_of = self._rows_layout(rows, (-1.2, 1.2), (-0.6, 0.6))
+        return (positions, row_of) if with_rows else positions
 
     def _create_wave_formation(self):
-        """Crée une formation pour les vagues océaniques."""
-        positions = np.zeros((2, self.n))
-        
-        # 10 colonnes de robots
-        cols = 10
-        rows = self.n // cols
-        remaining = self.n % cols
-        
-        robot_count = 0
-        
-        for col in range(cols):
-            n_rows = rows + (1 if col < remaining else 0)
-            if robot_count >= self.n:
-                break
-                
-            for row in range(n_rows):
-                if robot_count < self.n:
-                    x = -1.5 + col * (3.0 / max(1, cols-1))
-                    y = -0.6 + row * (1.2 / max(1, n_rows-1))
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = y
-                    robot_count += 1
-        
-        return positions
+        """Crée une formation pour les vagues océaniques (colonnes verticales)."""
+        _, cols = self._grid_shape(3.0, 1.2)
+        transposed, _ = self._rows_layout(cols, (-0.6, 0.6), (-1.5, 1.5))
+        return transposed[::-1].copy()
 
     def _create_spiral_formation(self):
-        """Crée une formation spirale."""
-        positions = np.zeros((2, self.n))
-        
+        """Crée une formation spirale (rayon extérieur fixe quel que soit N)."""
         # Spirale de Vogel
         phi = (1 + np.sqrt(5)) / 2  # Nombre d'or
-        angle_step = 2 * np.pi / phi**2
-        
-        for i in range(self.n):
-            angle = i * angle_step
-            radius = 0.1 * np.sqrt(i + 1)
-            
-            positions[0, i] = radius * np.cos(angle)
-            positions[1, i] = radius * np.sin(angle)
-        
-        return positions
+        angle = np.arange(self.n) * 2 * np.pi / phi**2
+        radius = 0.1 * np.sqrt(50 * (np.arange(self.n) + 1) / self.n)
+        return np.array([radius * np.cos(angle), radius * np.sin(angle)])
 
     def _create_circle_formation(self):
         """Crée une formation circulaire."""
@@ -390,145 +348,43 @@ class Project09GrandeParade:
 
     def _create_square_formation(self):
         """Crée une formation carrée."""
-        positions = np.zeros((2, self.n))
-        
-        side_length = 1.2
-        robots_per_side = self.n // 4
-        remaining = self.n % 4
-        
-        robot_count = 0
-        
-        # Côtés du carré
-        sides = [
-            np.linspace(-side_length/2, side_length/2, robots_per_side),  # Bas
-            np.linspace(-side_length/2, side_length/2, robots_per_side),  # Droite
-            np.linspace(side_length/2, -side_length/2, robots_per_side),  # Haut
-            np.linspace(side_length/2, -side_length/2, robots_per_side)   # Gauche
-        ]
-        
-        for i, side in enumerate(sides):
-            n_side = robots_per_side + (1 if i < remaining else 0)
-            if robot_count >= self.n:
-                break
-                
-            for j in range(n_side):
-                if robot_count < self.n:
-                    if i == 0:  # Bas
-                        positions[0, robot_count] = side[j]
-                        positions[1, robot_count] = -side_length/2
-                    elif i == 1:  # Droite
-                        positions[0, robot_count] = side_length/2
-                        positions[1, robot_count] = side[j]
-                    elif i == 2:  # Haut
-                        positions[0, robot_count] = side[j]
-                        positions[1, robot_count] = side_length/2
-                    else:  # Gauche
-                        positions[0, robot_count] = -side_length/2
-                        positions[1, robot_count] = side[j]
-                    
-                    robot_count += 1
-        
-        return positions
+        half = 1.2 / 2
+        return self.base.polygon([(-half, -half), (half, -half), (half, half), (-half, half)])
 
     def _create_triangle_formation(self):
         """Crée une formation triangulaire."""
-        positions = np.zeros((2, self.n))
-        
         # Triangle équilatéral
         height = 1.4
         side = height * 2 / np.sqrt(3)
-        
-        robots_per_side = self.n // 3
-        remaining = self.n % 3
-        
-        robot_count = 0
-        
-        # Sommets du triangle
-        vertices = [
-            (0, height/2),                    # Haut
-            (-side/2, -height/2),             # Bas gauche
-            (side/2, -height/2)               # Bas droit
-        ]
-        
-        for i in range(3):
-            n_side = robots_per_side + (1 if i < remaining else 0)
-            if robot_count >= self.n:
-                break
-                
-            start_vertex = vertices[i]
-            end_vertex = vertices[(i + 1) % 3]
-            
-            for j in range(n_side):
-                if robot_count < self.n:
-                    t = j / max(1, n_side - 1)
-                    x = start_vertex[0] + t * (end_vertex[0] - start_vertex[0])
-                    y = start_vertex[1] + t * (end_vertex[1] - start_vertex[1])
-                    
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = y
-                    robot_count += 1
-        
-        return positions
+        return self.base.polygon([(0, height/2), (-side/2, -height/2), (side/2, -height/2)])
 
     def _create_hexagon_formation(self):
         """Crée une formation hexagonale."""
-        positions = np.zeros((2, self.n))
-        
-        radius = 0.8
-        vertices = 6
-        
-        robots_per_side = self.n // vertices
-        remaining = self.n % vertices
-        
-        robot_count = 0
-        
-        for i in range(vertices):
-            n_side = robots_per_side + (1 if i < remaining else 0)
-            if robot_count >= self.n:
-                break
-                
-            angle1 = 2 * np.pi * i / vertices
-            angle2 = 2 * np.pi * (i + 1) / vertices
-            
-            for j in range(n_side):
-                if robot_count < self.n:
-                    t = j / max(1, n_side - 1)
-                    angle = angle1 + t * (angle2 - angle1)
-                    
-                    # Légère réduction pour les côtés
-                    side_radius = radius * 0.95
-                    
-                    x = side_radius * np.cos(angle)
-                    y = side_radius * np.sin(angle)
-                    
-                    positions[0, robot_count] = x
-                    positions[1, robot_count] = y
-                    robot_count += 1
-        
-        return positions
+        angles = 2 * np.pi * np.arange(6) / 6
+        return self.base.polygon(0.8 * np.array([np.cos(angles), np.sin(angles)]).T)
 
     def _create_star_formation(self):
-        """Crée une formation en étoile."""
-        return self.base.star_improved(n_points=8, outer_radius=0.8, inner_radius=0.4)
+        """Crée une formation en étoile (8 branches)."""
+        angles = np.pi / 2 + np.pi * np.arange(16) / 8
+        radii = np.where(np.arange(16) % 2 == 0, 0.8, 0.4)
+        return self.base.polygon((radii * np.array([np.cos(angles), np.sin(angles)])).T)
 
     def _create_heart_formation(self):
         """Crée une formation en cœur."""
-        positions = np.zeros((2, self.n))
-        
         scale = 0.6
-        
-        for i in range(self.n):
-            t = 2 * np.pi * i / self.n
-            x = scale * 16 * np.sin(t)**3 / 16
-            y = scale * (13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)) / 16
-            
-            positions[0, i] = x
-            positions[1, i] = y
-        
-        return positions
+        t = 2 * np.pi * np.arange(self.n) / self.n
+        x = scale * 16 * np.sin(t)**3 / 16
+        y = scale * (13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)) / 16
+        return np.array([x, y])
+
+    def run_complete_animation(self, buffers=None):
+        """
+        Exécute l'animation complète du projet.
 
-    def run_complete_animation(self):
-        """Exécute l'animation complète du projet."""
+        Les positions cédées sont des tampons réutilisés (double tampon par
+        défaut): les copier pour les conserver au-delà de la frame suivante.
+        """
+        buffers = self._buffers(buffers)
         print("🎬 Démarrage du PROJET #9: LA GRANDE PARADE")
         print("=" * 60)
         
@@ -547,7 +403,7 @@ class Project09GrandeParade:
             
             if current_pos is None:
                 # Première phase
-                for pos, time_val in phase_method(duration):
+                for pos, time_val in phase_method(duration, buffers=buffers):
                     current_pos = pos
                     yield pos, display_name, time_val, frame_count
                     frame_count += 1
@@ -556,7 +412,7 @@ class Project09GrandeParade:
                         print(f"   📊 Frame {frame_count:04d} | {time_val:05.1f}s")
             else:
                 # Phases suivantes
-                for pos, time_val in phase_method(current_pos, duration):
+                for pos, time_val in phase_method(current_pos, duration, buffers=buffers):
                     current_pos = pos
                     yield pos, display_name, time_val, frame_count
                     frame_count += 1
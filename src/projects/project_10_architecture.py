@@ -10,16 +10,20 @@ import matplotlib.pyplot as plt
 from formations.base_formations import BaseFormations
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.kinematics import affine, rotation_matrix
+from formations.instancing import InstancedFormation
 from utils.config import config
+from utils.random_streams import ShowRandom
 
 class Project10PatrimoineArchitectural:
     """Implémentation du projet Patrimoine Architectural."""
     
-    def __init__(self, n_robots=None):
+    def __init__(self, n_robots=None, seed=None):
         self.n = n_robots or config.N_ROBOTS
         self.base = BaseFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
         
         # Phases du projet (durées en secondes)
         self.phases = {
@@ -153,17 +157,7 @@ class Project10PatrimoineArchitectural:
             
             # Animation de rotation (vue aérienne)
             rotation_angle = 0.05 * time_val
-            center_x, center_y = 0.0, 0.0
-            
-            for i in range(positions.shape[1]):
-                x = positions[0, i] - center_x
-                y = positions[1, i] - center_y
-                
-                new_x = x * np.cos(rotation_angle) - y * np.sin(rotation_angle)
-                new_y = x * np.sin(rotation_angle) + y * np.cos(rotation_angle)
-                
-                positions[0, i] = center_x + new_x
-                positions[1, i] = center_y + new_y
+            affine(positions, rotation_matrix(rotation_angle), out=positions)
             
             yield positions, time_val
 
@@ -370,8 +364,9 @@ class Project10PatrimoineArchitectural:
         if robot_count < self.n:
             remaining = self.n - robot_count
             # Points aléatoires pour compléter
-            random_x = np.random.uniform(-0.8, 0.8, remaining)
-            random_y = np.random.uniform(-0.6, 0.6, remaining)
+            rng = self.random.stream('sultanat_complement')
+            random_x = rng.uniform(-0.8, 0.8, remaining)
+            random_y = rng.uniform(-0.6, 0.6, remaining)
             positions[0, robot_count:] = random_x
             positions[1, robot_count:] = random_y
         
@@ -387,88 +382,53 @@ class Project10PatrimoineArchitectural:
         n_enceinte = int(self.n * 0.3)
         if n_enceinte > 0:
             t_enceinte = np.linspace(0, 2*np.pi, n_enceinte)
-            enceinte_x = 0.0 + 0.7 * np.cos(t_enceinte)
-            enceinte_y = 0.0 + 0.7 * np.sin(t_enceinte)
-            positions[0, robot_count:robot_count+n_enceinte] = enceinte_x
-            positions[1, robot_count:robot_count+n_enceinte] = enceinte_y
+            positions[0, :n_enceinte] = 0.7 * np.cos(t_enceinte)
+            positions[1, :n_enceinte] = 0.7 * np.sin(t_enceinte)
             robot_count += n_enceinte
         
-        # Tours de guet
-        n_towers = 4
-        tower_angles = [0, np.pi/2, np.pi, 3*np.pi/2]
-        
-        for angle in tower_angles:
-            n_tower = int(self.n * 0.1)
-            if n_tower > 0 and robot_count < self.n:
-                # Position de la tour
-                tower_x = 0.7 * np.cos(angle)
-                tower_y = 0.7 * np.sin(angle)
-                
-                # Formation carrée pour la tour
-                tower_size = 0.15
-                t_tower = np.linspace(0, 2*np.pi, n_tower)
-                tower_points_x = tower_x + tower_size * np.cos(t_tower)
-                tower_points_y = tower_y + tower_size * np.sin(t_tower)
-                
-                n_place = min(n_tower, self.n - robot_count)
-                positions[0, robot_count:robot_count+n_place] = tower_points_x[:n_place]
-                positions[1, robot_count:robot_count+n_place] = tower_points_y[:n_place]
-                robot_count += n_place
-        
-        # Habitations à l'intérieur
-        n_houses = int(self.n * 0.4)
+        # Tours de guet: un cercle de base, 4 instances aux points cardinaux
+        n_tower = min(int(self.n * 0.1), (self.n - robot_count) // 4)
+        if n_tower > 0:
+            t_tower = np.linspace(0, 2*np.pi, n_tower)
+            tower_angles = np.array([0, np.pi/2, np.pi, 3*np.pi/2])
+            tours = InstancedFormation(0.15 * np.array([np.cos(t_tower), np.sin(t_tower)]), 4)
+            tours.set_transforms(translate=0.7 * np.column_stack([np.cos(tower_angles), np.sin(tower_angles)]))
+            tours.evaluate(out=positions[:, robot_count:robot_count + 4*n_tower])
+            robot_count += 4 * n_tower
+        
+        # Habitations à l'intérieur: une case de base (3 robots), instanciée
+        # à des positions et orientations aléatoires dans l'enceinte
+        n_house_points = 3
+        n_houses = min(int(self.n * 0.4), self.n - robot_count) // n_house_points
+        rng = self.random.stream('village_habitations')
         if n_houses > 0:
-            # Cases circulaires réparties aléatoirement à l'intérieur
-            for i in range(n_houses):
-                if robot_count < self.n:
-                    # Position aléatoire à l'intérieur de l'enceinte
-                    angle = np.random.uniform(0, 2*np.pi)
-                    radius = np.random.uniform(0.1, 0.5)
-                    
-                    house_x = radius * np.cos(angle)
-                    house_y = radius * np.sin(angle)
-                    
-                    # Petite formation circulaire pour chaque case
-                    n_house_points = min(3, self.n - robot_count)
-                    if n_house_points > 0:
-                        t_house = np.linspace(0, 2*np.pi, n_house_points)
-                        house_circle_x = house_x + 0.08 * np.cos(t_house)
-                        house_circle_y = house_y + 0.08 * np.sin(t_house)
-                        
-                        positions[0, robot_count:robot_count+n_house_points] = house_circle_x
-                        positions[1, robot_count:robot_count+n_house_points] = house_circle_y
-                        robot_count += n_house_points
-        
-        # Portes monumentales
-        n_gates = int(self.n * 0.1)
-        if n_gates > 0 and robot_count < self.n:
-            # Portes aux points cardinaux
-            gate_positions = [(0.7, 0.0), (0.0, 0.7), (-0.7, 0.0), (0.0, -0.7)]
-            
-            for gate_x, gate_y in gate_positions:
-                n_gate = n_gates // 4
-                if n_gate > 0 and robot_count < self.n:
-                    # Formation linéaire pour la porte
-                    gate_line_x = np.linspace(gate_x - 0.1, gate_x + 0.1, n_gate)
-                    gate_line_y = np.full(n_gate, gate_y)
-                    
-                    n_place = min(n_gate, self.n - robot_count)
-                    positions[0, robot_count:robot_count+n_place] = gate_line_x[:n_place]
-                    positions[1, robot_count:robot_count+n_place] = gate_line_y[:n_place]
-                    robot_count += n_place
-        
-        # Éléments restants
+            t_house = np.linspace(0, 2*np.pi, n_house_points, endpoint=False)
+            cases = InstancedFormation(0.08 * np.array([np.cos(t_house), np.sin(t_house)]), n_houses)
+            angle = rng.uniform(0, 2*np.pi, n_houses)
+            radius = rng.uniform(0.1, 0.5, n_houses)
+            cases.set_transforms(translate=np.column_stack([radius * np.cos(angle), radius * np.sin(angle)]),
+                                 scale=rng.uniform(0.8, 1.2, n_houses),
+                                 rotate=rng.uniform(0, 2*np.pi, n_houses))
+            cases.evaluate(out=positions[:, robot_count:robot_count + n_houses*n_house_points])
+            robot_count += n_houses * n_house_points
+        
+        # Portes monumentales aux points cardinaux (segment de base tourné)
+        n_gate = min(int(self.n * 0.1) // 4, (self.n - robot_count) // 4)
+        if n_gate > 0:
+            gate_angles = np.array([0, np.pi/2, np.pi, 3*np.pi/2])
+            portes = InstancedFormation(np.array([np.zeros(n_gate), np.linspace(-0.1, 0.1, n_gate)]), 4)
+            portes.set_transforms(translate=0.7 * np.column_stack([np.cos(gate_angles), np.sin(gate_angles)]),
+                                  rotate=gate_angles)
+            portes.evaluate(out=positions[:, robot_count:robot_count + 4*n_gate])
+            robot_count += 4 * n_gate
+        
+        # Éléments restants: rues et chemins en spirale
         if robot_count < self.n:
             remaining = self.n - robot_count
-            # Rues et chemins
             street_angles = np.linspace(0, 2*np.pi, remaining)
             street_radius = np.linspace(0.2, 0.6, remaining)
-            
-            street_x = street_radius * np.cos(street_angles)
-            street_y = street_radius * np.sin(street_angles)
-            
-            positions[0, robot_count:] = street_x
-            positions[1, robot_count:] = street_y
+            positions[0, robot_count:] = street_radius * np.cos(street_angles)
+            positions[1, robot_count:] = street_radius * np.sin(street_angles)
         
         return positions
 
@@ -11,17 +11,23 @@ from formations.base_formations import BaseFormations
 from formations.letter_formations import LetterFormations
 from animations.transition_manager import TransitionManager
 from animations.color_animations import ColorAnimator
+from animations.flow_field import FlowField
+from animations.cloth import FlagCloth
+from animations.particles import ParticlePool
 from utils.config import config
+from utils.frame_buffers import FrameBuffers
+from utils.random_streams import ShowRandom
 
 class Project11NaissanceNation:
     """Show d'ouverture premium: Naissance d'une Nation."""
     
-    def __init__(self, n_robots=100):
+    def __init__(self, n_robots=100, seed=None, n_particles=300):
         self.n = n_robots
         self.base = BaseFormations(self.n)
         self.letters = LetterFormations(self.n)
         self.transitions = TransitionManager()
-        self.colors = ColorAnimator()
+        self.colors = ColorAnimator(seed)
+        self.random = ShowRandom(seed)  # Flux aléatoires reproductibles
         
         # Phases (30 seconds each = 180s total)
         self.phases = {
@@ -34,36 +40,66 @@ class Project11NaissanceNation:
         }
         
         # Paramètres pour les effets
-        self.n_particles = 300  # Particules de sable
-        self.particles_pos = self._init_particles()
+        self.n_particles = n_particles  # Particules de sable (décor, indépendantes des drones)
+        self.particles = ParticlePool(n_particles, dims=3, palette=[config.COLORS['sable_sahara']],
+                                      rng=self.random.stream('particles_sable'))
+        self._init_particles()
+        self.sand_wind = (FlowField()
+                          .add_wind((0.6, 0.0), gust=2.5, gust_frequency=0.5 / (2*np.pi))
+                          .add_curl_noise(amplitude=0.3, scale=2.0, speed=0.05,
+                                          rng=self.random.stream('particles_wind')))
         
         print(f"🎬 PROJET #11 'NAISSANCE D'UNE NATION' INITIALISÉ: {self.n} drones")
 
     def _init_particles(self):
         """Initialise les particules de sable au sol."""
-        x = np.random.uniform(-config.ARENA_WIDTH/2, config.ARENA_WIDTH/2, self.n_particles)
-        y = np.random.uniform(-config.ARENA_HEIGHT/2, config.ARENA_HEIGHT/2, self.n_particles)
-        z = np.random.uniform(0, 0.05, self.n_particles)
-        return np.array([x, y, z])
+        rng = self.random.stream('particles')
+        x = rng.uniform(-config.ARENA_WIDTH/2, config.ARENA_WIDTH/2, self.n_particles)
+        y = rng.uniform(-config.ARENA_HEIGHT/2, config.ARENA_HEIGHT/2, self.n_particles)
+        z = rng.uniform(0, 0.05, self.n_particles)
+        self.particles.clear()
+        self.particles.emit(self.n_particles, np.array([x, y, z]))
+        return self.particles.positions
 
-    def update_particles(self, time_val):
-        """Anime les particules de sable avec le vent."""
-        # Vent souffle principalement selon X
-        self.particles_pos[0] += 0.05 * np.sin(time_val * 0.5) + 0.02
-        self.particles_pos[1] += 0.01 * np.cos(time_val * 0.3)
-        
-        # Reset les particules qui sortent
-        mask = self.particles_pos[0] > config.ARENA_WIDTH/2
-        self.particles_pos[0][mask] = -config.ARENA_WIDTH/2
-        return self.particles_pos
+    @property
+    def particles_pos(self):
+        """Positions (3, n) des particules de sable."""
+        return self.particles.positions
+
+    def update_particles(self, time_val, positions=None):
+        """Anime les particules de sable avec le vent (positions des drones ignorées)."""
+        # Vent souffle principalement selon X (rafales), turbulence légère en Y;
+        # les particules sorties réapparaissent du côté opposé
+        bounds = (-config.ARENA_WIDTH/2, config.ARENA_WIDTH/2,
+                  -config.ARENA_HEIGHT/2, config.ARENA_HEIGHT/2)
+        self.particles.step(1.0 / config.FPS, field=self.sand_wind, bounds=bounds, time_val=time_val)
+        return self.particles.positions
+
+    def _buffers(self, buffers):
+        """Tampons fournis par l'appelant, sinon un double tampon propre à l'appel."""
+        return buffers if buffers is not None else FrameBuffers(3, self.n)
 
-    def phase_1_desert(self, duration=30):
+    def _bands_target(self, bands):
+        """Cible 3D (3, N) assemblée à partir de segments (x, y, z) par bande."""
+        target_pos = np.empty((3, self.n))
+        start = 0
+        for x, y, z in bands:
+            count = len(x)
+            target_pos[0, start:start + count] = x
+            target_pos[1, start:start + count] = y
+            target_pos[2, start:start + count] = z
+            start += count
+        return target_pos
+
+    def phase_1_desert(self, duration=30, buffers=None):
         """0:00-0:30 - Désert vide s'animant, 100 points au sol."""
         steps = int(duration * config.FPS)
+        buffers = self._buffers(buffers)
         
         # Points au sol (éparpillés)
-        target_x = np.random.uniform(-0.8, 0.8, self.n)
-        target_y = np.random.uniform(-0.4, 0.4, self.n)
+        rng = self.random.stream('1_desert')
+        target_x = rng.uniform(-0.8, 0.8, self.n)
+        target_y = rng.uniform(-0.4, 0.4, self.n)
         target_z = np.zeros(self.n)
         target_pos = np.array([target_x, target_y, target_z])
         
@@ -72,14 +108,14 @@ class Project11NaissanceNation:
             # Apparition progressive (0 à 100 drones)
             n_visible = int(self.n * (step / steps))
             
-            positions = np.zeros((3, self.n))
+            positions = buffers.next()
             # Les drones "visibles" sont au sol
-            if n_visible > 0:
-                positions[:, :n_visible] = target_pos[:, :n_visible]
+            positions[:, :n_visible] = target_pos[:, :n_visible]
+            positions[:, n_visible:] = 0.0
                 
             yield positions, time_val, "Le Désert S'Éveille"
 
-    def phase_2_orange(self, start_pos, duration=30):
+    def phase_2_orange(self, start_pos, duration=30, buffers=None):
         """0:30-1:00 - Émergence Orange: élévation et couleur."""
         steps = int(duration * config.FPS)
         start_time = 30
@@ -91,13 +127,14 @@ class Project11NaissanceNation:
         target_pos = np.array([target_x, target_y, target_z])
         
         for step, positions in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_pos, 5, 'ease_in_out')
+            self.transitions.interpolate_positions(start_pos, target_pos, 5, 'ease_in_out',
+                                                   buffers=self._buffers(buffers))
         ):
             if step >= steps: break
             time_val = start_time + step / config.FPS
             yield positions, time_val, "Émergence Orange"
 
-    def phase_3_blanc(self, start_pos, duration=30):
+    def phase_3_blanc(self, start_pos, duration=30, buffers=None):
         """1:00-1:30 - Naissance du Blanc et Soleil d'Or."""
         steps = int(duration * config.FPS)
         start_time = 60
@@ -109,41 +146,27 @@ class Project11NaissanceNation:
         n_rest = self.n - n_orange - n_blanc - n_soleil
         
         # Target: Drapeau partiel
-        tx = []
-        ty = []
-        tz = []
-        
-        # Orange reste en haut
-        tx.extend(np.linspace(-1.2, 1.2, n_orange))
-        ty.extend(np.full(n_orange, 0.6))
-        tz.extend(np.full(n_orange, 0.8))
-        
-        # Blanc au centre
-        tx.extend(np.linspace(-1.2, 1.2, n_blanc))
-        ty.extend(np.full(n_blanc, 0.0))
-        tz.extend(np.full(n_blanc, 0.8))
-        
-        # Soleil au centre
         angles = np.linspace(0, 2*np.pi, n_soleil)
-        tx.extend(0.15 * np.cos(angles))
-        ty.extend(0.15 * np.sin(angles))
-        tz.extend(np.full(n_soleil, 0.81)) # Légèrement devant
-        
-        # Le reste attend au sol ou rejoint le blanc
-        tx.extend(np.linspace(-1.2, 1.2, n_rest))
-        ty.extend(np.full(n_rest, 0.0))
-        tz.extend(np.full(n_rest, 0.8))
-        
-        target_pos = np.array([tx, ty, tz])
+        target_pos = self._bands_target([
+            # Orange reste en haut
+            (np.linspace(-1.2, 1.2, n_orange), 0.6, 0.8),
+            # Blanc au centre
+            (np.linspace(-1.2, 1.2, n_blanc), 0.0, 0.8),
+            # Soleil au centre, légèrement devant
+            (0.15 * np.cos(angles), 0.15 * np.sin(angles), 0.81),
+            # Le reste attend au sol ou rejoint le blanc
+            (np.linspace(-1.2, 1.2, n_rest), 0.0, 0.8),
+        ])
         
         for step, positions in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_pos, 5, 'ease_in_out')
+            self.transitions.interpolate_positions(start_pos, target_pos, 5, 'ease_in_out',
+                                                   buffers=self._buffers(buffers))
         ):
             if step >= steps: break
             time_val = start_time + step / config.FPS
             yield positions, time_val, "Paix Blanche & Soleil d'Or"
 
-    def phase_4_vert(self, start_pos, duration=30):
+    def phase_4_vert(self, start_pos, duration=30, buffers=None):
         """1:30-2:00 - Verdure de l'Espoir: Drapeau Complet."""
         steps = int(duration * config.FPS)
         start_time = 90
@@ -152,63 +175,56 @@ class Project11NaissanceNation:
         n_soleil = 12
         n_side = (self.n - n_soleil) // 3
         
-        tx, ty, tz = [], [], []
-        
-        # Bande Orange
-        tx.extend(np.linspace(-1.2, 1.2, n_side))
-        ty.extend(np.full(n_side, 0.6))
-        tz.extend(np.full(n_side, 0.8))
-        
-        # Bande Blanche
-        tx.extend(np.linspace(-1.2, 1.2, n_side))
-        ty.extend(np.full(n_side, 0.0))
-        tz.extend(np.full(n_side, 0.8))
-        
-        # Bande Verte
-        tx.extend(np.linspace(-1.2, 1.2, n_side))
-        ty.extend(np.full(n_side, -0.6))
-        tz.extend(np.full(n_side, 0.8))
-        
-        # Soleil (précis)
         angles = np.linspace(0, 2*np.pi, n_soleil)
-        tx.extend(0.2 * np.cos(angles))
-        ty.extend(0.2 * np.sin(angles))
-        tz.extend(np.full(n_soleil, 0.82))
-        
-        # Ajuster pour arriver à N
-        while len(tx) < self.n:
-            tx.append(0); ty.append(-0.6); tz.append(0.8)
-            
-        target_pos = np.array([tx[:self.n], ty[:self.n], tz[:self.n]])
+        target_pos = self._bands_target([
+            # Bandes Orange, Blanche, Verte
+            (np.linspace(-1.2, 1.2, n_side), 0.6, 0.8),
+            (np.linspace(-1.2, 1.2, n_side), 0.0, 0.8),
+            (np.linspace(-1.2, 1.2, n_side), -0.6, 0.8),
+            # Soleil (précis)
+            (0.2 * np.cos(angles), 0.2 * np.sin(angles), 0.82),
+            # Ajuster pour arriver à N
+            (np.zeros(self.n - 3 * n_side - n_soleil), -0.6, 0.8),
+        ])
         
         for step, positions in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_pos, 5, 'ease_in_out')
+            self.transitions.interpolate_positions(start_pos, target_pos, 5, 'ease_in_out',
+                                                   buffers=self._buffers(buffers))
         ):
             if step >= steps: break
             time_val = start_time + step / config.FPS
             yield positions, time_val, "Espoir Vert - Drapeau National"
 
-    def phase_5_vibration(self, start_pos, duration=30):
+    def phase_5_vibration(self, start_pos, duration=30, buffers=None):
         """2:00-2:30 - Drapeau qui vit (ondulations)."""
         steps = int(duration * config.FPS)
         start_time = 120
+        buffers = self._buffers(buffers)
+        start_pos = buffers.snapshot(start_pos)
+        
+        # Ondulation: tissu simulé sous le drapeau, chaque drone suit son point du tissu
+        cloth = FlagCloth(width=2.4, height=1.2, wind=0.3)
+        cloth.bind(cloth.uv_from_xy(start_pos[:2]))
+        drift_phase = np.arange(self.n) * 0.1
+        scratch = np.empty(self.n)
         
         for step in range(steps):
             time_val = start_time + step / config.FPS
-            positions = start_pos.copy()
+            positions = buffers.next()
+            np.copyto(positions, start_pos)
             
-            # Effet d'ondulation (Wave)
-            wave_amp = 0.05
-            wave_freq = 2.0
-            for i in range(self.n):
-                # Ondulation selon Z basée sur X et le temps
-                positions[2, i] += wave_amp * np.sin(wave_freq * positions[0, i] + time_val * 3)
-                # Légère dérive Y
-                positions[1, i] += 0.01 * np.cos(time_val * 2 + i * 0.1)
+            # Ondulation selon Z (hauteur du tissu)
+            cloth.step(1.0 / config.FPS)
+            positions[2] += cloth.heights(scratch)
+            # Légère dérive Y
+            np.add(drift_phase, time_val * 2, out=scratch)
+            np.cos(scratch, out=scratch)
+            scratch *= 0.01
+            positions[1] += scratch
                 
             yield positions, time_val, "Le Souffle de la Nation"
 
-    def phase_6_niger(self, start_pos, duration=30):
+    def phase_6_niger(self, start_pos, duration=30, buffers=None):
         """2:30-3:00 - Transformation en 'NIGER'."""
         steps = int(duration * config.FPS)
         start_time = 150
@@ -221,7 +237,8 @@ class Project11NaissanceNation:
         target_pos[2, :] = 1.0
         
         for step, positions in enumerate(
-            self.transitions.interpolate_positions(start_pos, target_pos, 8, 'ease_in_out')
+            self.transitions.interpolate_positions(start_pos, target_pos, 8, 'ease_in_out',
+                                                   buffers=self._buffers(buffers))
         ):
             if step >= steps: break
             time_val = start_time + step / config.FPS
@@ -263,43 +280,28 @@ class Project11NaissanceNation:
         # Par défaut (Désert / Phase 1)
         return config.COLORS['sable_sahara']
 
-    def run_complete_animation(self):
-        """Générateur principal pour l'animation complète."""
+    def run_complete_animation(self, buffers=None):
+        """
+        Générateur principal pour l'animation complète.
+
+        Les positions cédées sont des tampons réutilisés (buffers, double
+        tampon par défaut): les copier pour les conserver au-delà de la
+        frame suivante.
+        """
+        buffers = self._buffers(buffers)
         current_pos = None
         frame = 0
         
         # Phase 1
-        for pos, t, name in self.phase_1_desert():
-            current_pos = pos
-            yield pos, name, t, frame
-            frame += 1
-            
-        # Phase 2
-        for pos, t, name in self.phase_2_orange(current_pos):
-            current_pos = pos
-            yield pos, name, t, frame
-            frame += 1
-            
-        # Phase 3
-        for pos, t, name in self.phase_3_blanc(current_pos):
-            current_pos = pos
-            yield pos, name, t, frame
-            frame += 1
-            
-        # Phase 4
-        for pos, t, name in self.phase_4_vert(current_pos):
+        for pos, t, name in self.phase_1_desert(buffers=buffers):
             current_pos = pos
             yield pos, name, t, frame
             frame += 1
             
-        # Phase 5
-        for pos, t, name in self.phase_5_vibration(current_pos):
-            current_pos = pos
-            yield pos, name, t, frame
-            frame += 1
-            
-        # Phase 6
-        for pos, t, name in self.phase_6_niger(current_pos):
-            current_pos = pos
-            yield pos, name, t, frame
-            frame += 1
+        # Phases 2 à 6
+        for phase_method in (self.phase_2_orange, self.phase_3_blanc, self.phase_4_vert,
+                             self.phase_5_vibration, self.phase_6_niger):
+            for pos, t, name in phase_method(current_pos, buffers=buffers):
+                current_pos = pos
+                yield pos, name, t, frame
+                frame += 1
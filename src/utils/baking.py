@@ -0,0 +1,183 @@
+# src/utils/baking.py
+"""
+PRÉ-CALCUL (BAKING) DES SPECTACLES
+Transforme les générateurs des projets en tenseurs de trajectoires et de
+couleurs, éventuellement écrits en flux dans des fichiers de spectacle.
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import numpy as np
+from utils.config import config
+from utils.show_codec import ShowCodec, ShowWriter, ShowReader
+
+# Registre des onze tableaux: clé -> (module, classe)
+PROJECTS = {
+    '01': ('projects.project_01_anem_lumiere', 'Project01AnemLumiere'),
+    '02': ('projects.project_02_monuments', 'Project02Monuments'),
+    '03': ('projects.project_03_vagues', 'Project03Vagues'),
+    '04': ('projects.project_04_constellations', 'Project04Constellations'),
+    '05': ('projects.project_05_feux_artifice', 'Project05FeuxArtifice'),
+    '06': ('projects.project_06_spirale_fibonacci', 'Project06SpiraleFibonacci'),
+    '07': ('projects.project_07_faune', 'Project07FauneNiger'),
+    '08': ('projects.project_08_calligraphie', 'Project08Calligraphie'),
+    '09': ('projects.project_09_parade', 'Project09GrandeParade'),
+    '10': ('projects.project_10_architecture', 'Project10PatrimoineArchitectural'),
+    '11': ('projects.project_11_naissance_nation', 'Project11NaissanceNation'),
+}
+
+
+def load_project(key, n_robots=None, seed=None, quiet=True):
+    """Instancie un projet du registre (sans les impressions console si quiet)."""
+    module_name, class_name = PROJECTS[key]
+    project_class = getattr(importlib.import_module(module_name), class_name)
+    with _silenced(quiet):
+        return project_class(n_robots=n_robots or config.N_ROBOTS, seed=seed)
+
+
+def iter_project_frames(project, max_frames=None, quiet=True, allow_partial=False):
+    """
+    Parcourt run_complete_animation() et renvoie (positions, phase, temps, ombrage).
+
+    ombrage: copie de project.frame_shading (N,) prise avec la frame (tissu
+    simulé), None sinon; à passer tel quel aux couleurs (shading=).
+
+    Une exception d'un générateur de phase est relancée (RuntimeError) avec
+    l'indice de la frame fautive: un spectacle tronqué ne passe pas pour
+    complet. allow_partial=True garde les frames déjà produites et s'arrête
+    là (avertissement si not quiet).
+    """
+    generator = project.run_complete_animation()
+    count = 0
+    while max_frames is None or count < max_frames:
+        try:
+            with _silenced(quiet):
+                positions, phase_name, time_val, _ = next(generator)
+        except StopIteration:
+            return
+        except Exception as e:
+            if not allow_partial:
+                raise RuntimeError(f"Génération interrompue à la frame {count}: {e!r}") from e
+            if not quiet:
+                print(f"⚠️ Baking interrompu à la frame {count}: {e}")
+            return
+        shading = getattr(project, 'frame_shading', None)
+        yield positions, phase_name, time_val, None if shading is None else np.array(shading)
+        count += 1
+
+
+def bake_frames(project, max_frames=None, quiet=True, dtype=np.float32, allow_partial=False):
+    """
+    Pré-calcule un projet: (positions (frames, dims, N), phases, temps (frames,),
+    ombrages), tout ce qu'il faut à bake_colors pour retrouver les couleurs en direct.
+    """
+    frames, phase_names, times, shadings = [], [], [], []
+    for positions, phase_name, time_val, shading in iter_project_frames(
+            project, max_frames, quiet, allow_partial):
+        frames.append(np.array(positions, dtype=dtype))
+        phase_names.append(phase_name)
+        times.append(time_val)
+        shadings.append(shading)
+    if not frames:
+        return np.zeros((0, 2, project.n), dtype=dtype), [], np.zeros(0), []
+    return np.stack(frames), phase_names, np.array(times), shadings
+
+
+def bake_positions(project, max_frames=None, quiet=True, dtype=np.float32, allow_partial=False):
+    """Pré-calcule toutes les positions d'un projet en un tenseur (frames, dims, N)."""
+    return bake_frames(project, max_frames, quiet, dtype, allow_partial)[0]
+
+
+def bake_colors(project, positions, phase_names, times, out=None, shadings=None):
+    """
+    Pré-calcule les couleurs (frames, N, 3) uint8 de positions déjà
+    pré-calculées (frames, dims, N), frame par frame (chemin de couleurs vectorisé).
+    shadings: ombrage de chaque frame (voir bake_frames), None hors tissu.
+    """
+    n_frames, _, n = positions.shape
+    out = np.empty((n_frames, n, 3), dtype=np.uint8) if out is None else out
+    for k in range(n_frames):
+        shading = shadings[k] if shadings is not None else None
+        project.colors.get_phase_colors(positions[k], phase_names[k], times[k], out=out[k],
+                                        shading=shading)
+    return out
+
+
+def iter_baked_chunks(project, chunk_frames=None, max_frames=None, quiet=True, dtype=np.float32,
+                      allow_partial=False):
+    """
+    Parcourt le spectacle par paquets de chunk_frames frames:
+    (positions (f, dims, N), couleurs (f, N, 3) uint8, phases, temps (f,)).
+
+    Les couleurs sont calculées sur les positions exactes du générateur. Les
+    deux tableaux du paquet sont réutilisés d'un paquet à l'autre: mémoire
+    bornée quelle que soit la durée, à copier pour les conserver.
+    """
+    chunk_frames = chunk_frames or config.FPS
+    positions = colors = None
+    phase_names, times = [], []
+    for frame_pos, phase_name, time_val, shading in iter_project_frames(project, max_frames, quiet,
+                                                                        allow_partial):
+        if positions is None:
+            positions = np.empty((chunk_frames,) + frame_pos.shape, dtype=dtype)
+            colors = np.empty((chunk_frames, frame_pos.shape[1], 3), dtype=np.uint8)
+        k = len(phase_names)
+        positions[k] = frame_pos
+        project.colors.get_phase_colors(frame_pos, phase_name, time_val, out=colors[k],
+                                        shading=shading)
+        phase_names.append(phase_name)
+        times.append(time_val)
+        if k + 1 == chunk_frames:
+            yield positions, colors, phase_names, np.array(times)
+            phase_names, times = [], []
+    if phase_names:
+        k = len(phase_names)
+        yield positions[:k], colors[:k], phase_names, np.array(times)
+
+
+def colors_path(path):
+    """Fichier de la piste couleurs associé au fichier de positions: show.amsf -> show.rgb.amsf."""
+    root, ext = os.path.splitext(path)
+    return root + '.rgb' + ext
+
+
+def bake_show(project, path, codec=None, chunk_frames=None, max_frames=None, quiet=True,
+              allow_partial=False):
+    """
+    Pré-calcule positions et couleurs d'un projet et les écrit en flux:
+    positions dans path, couleurs (plans R, G, B entiers) dans colors_path(path).
+    Retourne le nombre de frames.
+    """
+    codec = codec or ShowCodec()
+    with ShowWriter(path, codec) as positions_file, \
+            ShowWriter(colors_path(path), ShowCodec(method=codec.method)) as colors_file:
+        for positions, colors, _, _ in iter_baked_chunks(project, chunk_frames, max_frames, quiet,
+                                                         allow_partial=allow_partial):
+            positions_file.append(positions)
+            colors_file.append(colors.transpose(0, 2, 1))
+    return positions_file.n_frames
+
+
+def iter_baked_colors(path, start=0):
+    """
+    Relit une piste couleurs frame par frame, (N, 3) uint8 prêts à envoyer:
+    aucun calcul de couleur au moment du spectacle, un bloc décodé à la fois.
+    """
+    with ShowReader(path) as reader:
+        first_block, offset = divmod(start, reader.block_frames)
+        for block_idx in range(first_block, len(reader.index)):
+            planes = reader.read_block(block_idx)
+            block = np.ascontiguousarray(planes.transpose(0, 2, 1), dtype=np.uint8)
+            yield from block[offset if block_idx == first_block else 0:]
+
+
+@contextlib.contextmanager
+def _silenced(quiet):
+    """Coupe stdout pendant le baking (les projets impriment beaucoup)."""
+    if quiet:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    else:
+        yield
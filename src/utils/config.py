@@ -8,7 +8,13 @@ class GlobalConfig:
     N_ROBOTS = 200  # Optimized for visual quality and performance
     ROBOT_RADIUS = 0.08
     MAX_LINEAR_VELOCITY = 0.15
+    MAX_LINEAR_ACCELERATION = 0.3  # m/s², profils trapézoïdaux des transitions
     MAX_ANGULAR_VELOCITY = 2.0
+    LOD_THRESHOLD = 2000  # Au-delà: rendu par densité (une image) au lieu de scatter
+    
+    # ========== PARAMÈTRES RÉSEAU ==========
+    COMMAND_PORT = 9750  # UDP: vitesses + LEDs vers les robots
+    LED_KEYFRAME_INTERVAL = 30  # Ticks entre deux trames LED complètes (resynchronisation)
     
     # ========== PARAMÈTRES ARÈNE 3D ==========
     ARENA_WIDTH = 3.2
@@ -64,6 +70,7 @@ class GlobalConfig:
     # ========== PARAMÈTRES ANIMATION ==========
     FPS = 30
     DEFAULT_DURATION = 180  # 3 minutes
+    SHOW_SEED = 2025  # Graine des flux aléatoires (rendus reproductibles)
     
     # ## Phase 2: Core Updates
     # - [x] Update config to support 1000 robots
@@ -0,0 +1,50 @@
+# src/utils/frame_buffers.py
+"""
+TAMPONS DE FRAMES RÉUTILISÉS (ÉCRITURE EN PLACE)
+Les générateurs de phases écrivent chaque frame dans un petit jeu de
+tableaux préalloués au lieu d'allouer un tableau neuf par frame.
+
+Contrat de propriété et de durée de vie:
+- le générateur écrit dans le tableau renvoyé par next() et le cède tel
+  quel (ou une vue) au consommateur;
+- avec depth tampons, une frame cédée reste intacte pendant les depth-1
+  frames suivantes: avec depth=2 (double tampon), le consommateur peut lire
+  la frame courante et la précédente (vitesses, deltas);
+- au-delà, le tableau est réécrit: un consommateur qui conserve des frames
+  (baking, enregistrement) doit les copier; il ne doit jamais y écrire;
+- une phase qui reçoit la dernière frame de la phase précédente comme
+  position de départ la copie avant sa deuxième frame (snapshot()).
+"""
+
+import numpy as np
+
+
+class FrameBuffers:
+    """Anneau de depth tableaux (dims, N) réutilisés à tour de rôle."""
+
+    def __init__(self, dims, n_robots, depth=2, dtype=np.float64):
+        if depth < 2:
+            raise ValueError("Il faut au moins deux tampons (frame courante + précédente)")
+        self.buffers = np.zeros((depth, dims, n_robots), dtype=dtype)
+        self.depth = depth
+        self._index = -1
+
+    @property
+    def shape(self):
+        return self.buffers.shape[1:]
+
+    def next(self):
+        """Tampon de la prochaine frame (contenu de la frame d'il y a depth frames)."""
+        self._index = (self._index + 1) % self.depth
+        return self.buffers[self._index]
+
+    def current(self):
+        """Dernier tampon remis par next()."""
+        return self.buffers[self._index]
+
+    def snapshot(self, positions, out=None):
+        """Copie de positions hors de l'anneau (position de départ d'une phase)."""
+        if out is None:
+            return np.array(positions, dtype=self.buffers.dtype)
+        np.copyto(out, positions)
+        return out
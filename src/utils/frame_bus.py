@@ -0,0 +1,222 @@
+# src/utils/frame_bus.py
+"""
+BUS DE FRAMES EN MÉMOIRE PARTAGÉE
+Anneau producteur/consommateur (un producteur, un consommateur) entre le
+générateur de positions/couleurs et le rendu ou le RealTimeController.
+
+Sans verrou: le producteur n'écrit que write_seq, le consommateur que
+read_seq (entiers 64 bits alignés). Un slot est rempli avant la publication
+de write_seq et n'est réutilisé qu'après l'avancée de read_seq.
+"""
+
+import time
+from multiprocessing import shared_memory
+import numpy as np
+
+# Index des compteurs dans l'en-tête int64
+_WRITE, _READ, _DROP_PRODUCER, _DROP_CONSUMER, _CLOSED, _SLOTS, _DIMS, _N = range(8)
+_HEADER_WORDS = 8
+COLOR_DIMS = 3
+LABEL_BYTES = 64  # Nom de phase (UTF-8 tronqué) associé à chaque slot
+
+
+class FrameBus:
+    """Anneau de slots préalloués (dims, N) float32 + couleurs (3, N) float32 + label."""
+
+    def __init__(self, n_slots=8, dims=2, n_robots=None, name=None, _attach=False):
+        if _attach:
+            self.shm = shared_memory.SharedMemory(name=name)
+            header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=self.shm.buf)
+            n_slots, dims, n_robots = int(header[_SLOTS]), int(header[_DIMS]), int(header[_N])
+            del header
+        else:
+            if n_robots is None:
+                raise ValueError("n_robots requis pour créer un bus")
+            self.shm = shared_memory.SharedMemory(
+                create=True, name=name, size=self._size(n_slots, dims, n_robots))
+        self.owner = not _attach
+        self.n_slots, self.dims, self.n = n_slots, dims, n_robots
+
+        buf = self.shm.buf
+        offset = 8 * _HEADER_WORDS
+        self.header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=buf)
+        self.meta = np.ndarray((n_slots, 2), dtype=np.float64, buffer=buf, offset=offset)
+        offset += self.meta.nbytes
+        self.labels = np.ndarray((n_slots, LABEL_BYTES), dtype=np.uint8, buffer=buf, offset=offset)
+        offset += self.labels.nbytes
+        self.positions = np.ndarray((n_slots, dims, n_robots), dtype=np.float32,
+                                    buffer=buf, offset=offset)
+        offset += self.positions.nbytes
+        self.colors = np.ndarray((n_slots, COLOR_DIMS, n_robots), dtype=np.float32,
+                                 buffer=buf, offset=offset)
+        if self.owner:
+            self.header[:] = 0
+            self.header[_SLOTS], self.header[_DIMS], self.header[_N] = n_slots, dims, n_robots
+        self._claimed = False
+
+    @classmethod
+    def attach(cls, name):
+        """S'attache à un bus existant (depuis un autre processus)."""
+        return cls(name=name, _attach=True)
+
+    @staticmethod
+    def _size(n_slots, dims, n_robots):
+        return (8 * _HEADER_WORDS + (16 + LABEL_BYTES) * n_slots +
+                4 * n_slots * (dims + COLOR_DIMS) * n_robots)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    # ========== PRODUCTEUR ==========
+
+    def claim(self, block=True, timeout=None):
+        """
+        Réserve le prochain slot libre et renvoie ses vues (positions, couleurs).
+
+        Si l'anneau est plein: attend (block=True, contre-pression) ou
+        renvoie None et compte une frame perdue côté producteur.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.header[_WRITE] - self.header[_READ] >= self.n_slots:
+            if not block or (deadline is not None and time.perf_counter() > deadline):
+                self.header[_DROP_PRODUCER] += 1
+                return None
+            time.sleep(0.0002)
+        slot = int(self.header[_WRITE] % self.n_slots)
+        self._claimed = True
+        return self.positions[slot], self.colors[slot]
+
+    def commit(self, time_val=0.0, frame=0, label=''):
+        """Publie le slot réservé par claim()."""
+        if not self._claimed:
+            raise RuntimeError("commit() sans claim() préalable")
+        slot = int(self.header[_WRITE] % self.n_slots)
+        self.meta[slot] = (time_val, frame)
+        encoded = label.encode('utf-8')[:LABEL_BYTES]
+        self.labels[slot, :len(encoded)] = np.frombuffer(encoded, dtype=np.uint8)
+        self.labels[slot, len(encoded):] = 0
+        self._claimed = False
+        self.header[_WRITE] += 1  # Publication: le slot devient lisible
+
+    def publish(self, positions, colors=None, time_val=0.0, frame=0, label='',
+                block=True, timeout=None):
+        """Copie une frame dans l'anneau. Retourne False si elle a été perdue."""
+        views = self.claim(block, timeout)
+        if views is None:
+            return False
+        pos_slot, color_slot = views
+        dims = min(self.dims, positions.shape[0])
+        pos_slot[:dims] = positions[:dims]
+        pos_slot[dims:] = 0.0
+        if colors is not None:
+            color_slot[:] = colors
+        self.commit(time_val, frame, label)
+        return True
+
+    def close_stream(self):
+        """Signale la fin du flux au consommateur."""
+        self.header[_CLOSED] = 1
+
+    # ========== CONSOMMATEUR ==========
+
+    def acquire(self, timeout=None, latest=False):
+        """
+        Attend une frame et renvoie (positions, couleurs, temps, frame, label);
+        positions et couleurs sont des vues sur le slot.
+
+        latest=True saute les frames en retard (rendu lent) et les compte
+        comme perdues côté consommateur. Renvoie None en fin de flux ou au
+        timeout. Les vues restent valides jusqu'à release().
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.header[_READ] >= self.header[_WRITE]:
+            if self.header[_CLOSED]:
+                # Dernière frame publiée juste avant la fermeture: relire WRITE
+                if self.header[_READ] < self.header[_WRITE]:
+                    break
+                return None
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            time.sleep(0.0002)
+        if latest:
+            backlog = int(self.header[_WRITE] - self.header[_READ]) - 1
+            if backlog > 0:
+                self.header[_DROP_CONSUMER] += backlog
+                self.header[_READ] += backlog
+        slot = int(self.header[_READ] % self.n_slots)
+        time_val, frame = self.meta[slot]
+        label = self.labels[slot].tobytes().rstrip(b'\0').decode('utf-8', errors='ignore')
+        return self.positions[slot], self.colors[slot], float(time_val), int(frame), label
+
+    def release(self):
+        """Rend le slot lu au producteur."""
+        self.header[_READ] += 1
+
+    def __iter__(self):
+        """Parcourt les frames (copies) jusqu'à la fin du flux."""
+        while True:
+            item = self.acquire()
+            if item is None:
+                return
+            positions, colors, time_val, frame, label = item
+            result = (positions.copy(), colors.copy(), time_val, frame, label)
+            self.release()
+            yield result
+
+    # ========== STATISTIQUES / CYCLE DE VIE ==========
+
+    def stats(self):
+        """Compteurs de frames publiées, consommées et perdues."""
+        return {
+            'published': int(self.header[_WRITE]),
+            'consumed': int(self.header[_READ]),
+            'dropped_producer': int(self.header[_DROP_PRODUCER]),
+            'dropped_consumer': int(self.header[_DROP_CONSUMER]),
+            'backlog': int(self.header[_WRITE] - self.header[_READ]),
+        }
+
+    def close(self):
+        """Détache le bus (et le détruit côté créateur)."""
+        del self.header, self.meta, self.labels, self.positions, self.colors
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # Une vue est encore tenue par l'appelant: fermée au ramasse-miettes
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def project_producer(key, bus_name, n_robots=None, seed=None, max_frames=None, block=True):
+    """
+    Processus producteur: génère positions + couleurs d'un projet dans le bus.
+
+    À lancer avec multiprocessing.Process; le rendu lit le bus dans l'autre processus.
+    """
+    from utils.baking import load_project, iter_project_frames
+
+    bus = FrameBus.attach(bus_name)
+    try:
+        project = load_project(key, n_robots or bus.n, seed)
+        for frame, (positions, phase_name, time_val, shading) in enumerate(
+                iter_project_frames(project, max_frames)):
+            views = bus.claim(block=block)
+            if views is None:
+                continue
+            pos_slot, color_slot = views
+            dims = min(bus.dims, positions.shape[0])
+            pos_slot[:dims] = positions[:dims]
+            pos_slot[dims:] = 0.0
+            rgb = project.colors.get_phase_colors(positions, phase_name, time_val, shading=shading)
+            np.divide(rgb.T, 255.0, out=color_slot)
+            bus.commit(time_val, frame, phase_name)
+            del views, pos_slot, color_slot
+    finally:
+        bus.close_stream()
+        bus.close()
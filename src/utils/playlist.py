@@ -0,0 +1,159 @@
+# src/utils/playlist.py
+"""
+PLAYLIST DE SOIRÉE
+Enchaîne plusieurs tableaux: pendant qu'un show est joué, le suivant est
+pré-calculé dans un processus de fond vers une mémoire partagée, puis une
+transition relie la dernière frame d'un show à la première du suivant.
+"""
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from animations.transition_manager import TransitionManager
+from utils.baking import PROJECTS, load_project, iter_project_frames
+from utils.config import config
+
+# Tous les shows sont normalisés en 3D (z = 0 pour les tableaux 2D)
+DIMS = 3
+
+
+def _prebake_worker(key, n_robots, seed, n_frames, shm_name, results):
+    """Processus de fond: écrit les frames du show dans la mémoire partagée."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffer = np.ndarray((n_frames, DIMS, n_robots), dtype=np.float32, buffer=shm.buf)
+    try:
+        project = load_project(key, n_robots, seed)
+        phases = []
+        written = 0
+        for positions, phase_name, _, _ in iter_project_frames(project, n_frames):
+            if not phases or phases[-1][1] != phase_name:
+                phases.append((written, phase_name))
+            dims = min(positions.shape[0], DIMS)
+            buffer[written, :dims] = positions[:dims]
+            buffer[written, dims:] = 0.0
+            written += 1
+        # Show plus court que la durée demandée: on tient la dernière frame
+        if 0 < written < n_frames:
+            buffer[written:] = buffer[written - 1]
+        results.put({'written': written, 'phases': phases})
+    except Exception as e:
+        results.put({'written': 0, 'phases': [], 'error': repr(e)})
+    finally:
+        del buffer  # La vue doit disparaître avant de fermer le segment
+        shm.close()
+
+
+class _PrebakeJob:
+    """Un show en cours de pré-calcul (processus + mémoire partagée)."""
+
+    def __init__(self, ctx, key, duration, n_robots, seed, fps):
+        self.key = key
+        self.n_frames = max(1, int(duration * fps))
+        self.shape = (self.n_frames, DIMS, n_robots)
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=int(np.prod(self.shape)) * np.dtype(np.float32).itemsize)
+        self.results = ctx.Queue()
+        self.process = ctx.Process(
+            target=_prebake_worker, daemon=True,
+            args=(key, n_robots, seed, self.n_frames, self.shm.name, self.results))
+        self.process.start()
+        self.frames = None
+        self.phases = None
+
+    def wait(self):
+        """Attend la fin du pré-calcul; retourne (frames, segments de phases)."""
+        if self.frames is None:
+            report = self.results.get()
+            self.process.join()
+            if 'error' in report or report['written'] == 0:
+                raise RuntimeError(f"Pré-calcul du projet {self.key} impossible: "
+                                   f"{report.get('error', 'aucune frame')}")
+            self.frames = np.ndarray(self.shape, dtype=np.float32, buffer=self.shm.buf)
+            self.phases = report['phases']
+        return self.frames, self.phases
+
+    @property
+    def ready(self):
+        return self.frames is not None or not self.results.empty()
+
+    def release(self):
+        """Libère la mémoire partagée (les vues frames deviennent invalides)."""
+        self.frames = None
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # Une vue est encore tenue par l'appelant: fermée au ramasse-miettes
+        self.shm.unlink()
+        self.shm = None
+
+
+class PlaylistRunner:
+    """Lecteur de playlist: [(projet, durée en s), ...] joués à la suite."""
+
+    def __init__(self, playlist, n_robots=None, seed=None, transition_duration=3.0,
+                 transition_type='ease_in_out', fps=None):
+        for key, duration in playlist:
+            if key not in PROJECTS:
+                raise ValueError(f"Projet inconnu dans la playlist: {key}")
+            if duration <= 0:
+                raise ValueError(f"Durée invalide pour le projet {key}: {duration}")
+        self.playlist = list(playlist)
+        self.n = n_robots or config.N_ROBOTS
+        self.seed = seed
+        self.fps = fps or config.FPS
+        self.transition_duration = transition_duration
+        self.transition_type = transition_type
+        self.transitions = TransitionManager()
+        self._ctx = mp.get_context()
+        self.stalls = []  # Shows pas encore prêts au moment de les jouer
+
+    def _start(self, index):
+        if index >= len(self.playlist):
+            return None
+        key, duration = self.playlist[index]
+        return _PrebakeJob(self._ctx, key, duration, self.n, self.seed, self.fps)
+
+    def run(self):
+        """
+        Générateur (positions (3, N), label, temps, frame) pour toute la soirée.
+
+        Les positions sont des vues sur la mémoire partagée du show courant:
+        les copier si elles doivent survivre au show.
+        """
+        frame = 0
+        current = self._start(0)
+        upcoming = None
+        previous_last = None
+        try:
+            for index in range(len(self.playlist)):
+                if not current.ready:
+                    self.stalls.append(index)
+                frames, phases = current.wait()
+                # Le show suivant se prépare pendant que celui-ci est joué
+                upcoming = self._start(index + 1)
+
+                if previous_last is not None and self.transition_duration > 0:
+                    for pos in self.transitions.interpolate_positions(
+                            previous_last, frames[0], self.transition_duration,
+                            self.transition_type, self.fps):
+                        yield pos, "Transition", frame / self.fps, frame
+                        frame += 1
+
+                label_idx = 0
+                for local in range(len(frames)):
+                    while label_idx + 1 < len(phases) and phases[label_idx + 1][0] <= local:
+                        label_idx += 1
+                    yield frames[local], phases[label_idx][1], frame / self.fps, frame
+                    frame += 1
+
+                previous_last = frames[-1].copy()
+                del frames
+                current.release()
+                current = upcoming
+        finally:
+            for job in {id(current): current, id(upcoming): upcoming}.values():
+                if job is not None and job.shm is not None:
+                    job.release()
@@ -0,0 +1,47 @@
+# src/utils/random_streams.py
+"""
+ALÉA DÉTERMINISTE ET REPRODUCTIBLE
+Flux Philox (basés sur compteur) dérivés de (graine du show, phase, frame):
+l'aléa de n'importe quelle frame peut être régénéré seul, dans n'importe
+quel ordre et dans n'importe quel processus.
+"""
+
+import zlib
+import numpy as np
+from utils.config import config
+
+_MASK_64 = (1 << 64) - 1
+
+
+def stream(seed=None, phase='', frame=0):
+    """
+    Générateur numpy indépendant pour (seed, phase, frame).
+
+    La clé Philox (128 bits) encode la graine et un hachage CRC32 du nom de
+    phase; la frame occupe le 3e mot du compteur, ce qui laisse 2^128 tirages
+    par frame avant tout recouvrement avec la frame suivante.
+    """
+    seed = config.SHOW_SEED if seed is None else seed
+    key = (int(seed) & _MASK_64) | (zlib.crc32(str(phase).encode('utf-8')) << 64)
+    counter = (int(frame) & _MASK_64) << 128
+    return np.random.Generator(np.random.Philox(key=key, counter=counter))
+
+
+def frame_index(time_val, fps=None):
+    """Index de frame correspondant à un temps de spectacle."""
+    return int(round(time_val * (fps or config.FPS)))
+
+
+class ShowRandom:
+    """Fabrique de flux aléatoires liés à la graine d'un spectacle."""
+
+    def __init__(self, seed=None):
+        self.seed = config.SHOW_SEED if seed is None else seed
+
+    def stream(self, phase, frame=0):
+        """Flux pour une phase (et une frame si l'aléa change à chaque frame)."""
+        return stream(self.seed, phase, frame)
+
+    def at_time(self, phase, time_val):
+        """Flux de la frame correspondant à time_val."""
+        return stream(self.seed, phase, frame_index(time_val))
@@ -0,0 +1,266 @@
+# src/utils/show_codec.py
+"""
+COMPRESSION DES FICHIERS DE SPECTACLE
+Quantification en virgule fixe + codage delta inter-frames + zlib/lzma.
+Chaque bloc est décodable indépendamment (recherche rapide dans le show).
+"""
+
+import lzma
+import shutil
+import struct
+import tempfile
+import zlib
+import numpy as np
+from utils.config import config
+
+BLOCK_MAGIC = b'AMBK'
+FILE_MAGIC = b'AMSF'
+FORMAT_VERSION = 1
+
+# magic, version, méthode, type delta, quantifié, dims, N, frames, résolution
+_BLOCK_HEADER = struct.Struct('<4sBBBBHIId')
+# magic, version, dims, N, frames, frames/bloc, nb blocs, résolution
+_FILE_HEADER = struct.Struct('<4sBHIIIId')
+_INDEX_ENTRY = struct.Struct('<QQ')
+
+_METHODS = {'zlib': 0, 'lzma': 1, 'none': 2}
+_METHOD_NAMES = {v: k for k, v in _METHODS.items()}
+_DELTA_DTYPES = {0: np.int8, 1: np.int16, 2: np.int32, 3: np.int64}
+
+
+class ShowCodec:
+    """Codec de blocs de frames (positions float ou couleurs entières)."""
+
+    def __init__(self, resolution=0.001, method='zlib', level=6):
+        """
+        resolution: pas de quantification en mètres (1 mm par défaut).
+        method: 'zlib' (rapide), 'lzma' (plus compact) ou 'none'.
+        """
+        if method not in _METHODS:
+            raise ValueError(f"Méthode de compression inconnue: {method}")
+        self.resolution = float(resolution)
+        self.method = method
+        self.level = level
+
+    def encode_block(self, frames):
+        """Encode un tableau (frames, dims, N) en un bloc autonome."""
+        frames = np.asarray(frames)
+        if frames.ndim != 3:
+            raise ValueError(f"Bloc attendu (frames, dims, N), reçu {frames.shape}")
+        n_frames, dims, n = frames.shape
+
+        quantized = not np.issubdtype(frames.dtype, np.integer)
+        if quantized:
+            q = np.rint(frames / self.resolution).astype(np.int64)
+        else:
+            q = frames.astype(np.int64)
+
+        # Première frame en clair, puis différences frame à frame
+        deltas = np.empty_like(q)
+        if n_frames:
+            deltas[0] = q[0]
+            np.subtract(q[1:], q[:-1], out=deltas[1:])
+
+        dtype_code = _smallest_int_code(deltas)
+        payload = _shuffle_bytes(deltas.astype(_DELTA_DTYPES[dtype_code]))
+        payload = self._compress(payload)
+
+        header = _BLOCK_HEADER.pack(
+            BLOCK_MAGIC, FORMAT_VERSION, _METHODS[self.method], dtype_code,
+            int(quantized), dims, n, n_frames, self.resolution
+        )
+        return header + payload
+
+    def decode_block(self, data, out=None):
+        """Décode un bloc en tableau (frames, dims, N) float32 (ou int32 si non quantifié)."""
+        magic, version, method, dtype_code, quantized, dims, n, n_frames, resolution = \
+            _BLOCK_HEADER.unpack_from(data)
+        if magic != BLOCK_MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Bloc de spectacle invalide")
+
+        raw = _decompress(_METHOD_NAMES[method], memoryview(data)[_BLOCK_HEADER.size:])
+        delta_dtype = np.dtype(_DELTA_DTYPES[dtype_code])
+        deltas = _unshuffle_bytes(raw, delta_dtype).reshape(n_frames, dims, n)
+
+        # Reconstruction par somme cumulée (entiers exacts, pas de dérive)
+        q = np.cumsum(deltas, axis=0, dtype=np.int64)
+        if not quantized:
+            return q.astype(np.int32)
+        if out is None:
+            out = np.empty((n_frames, dims, n), dtype=np.float32)
+        np.multiply(q, resolution, out=out, casting='unsafe')
+        return out
+
+    def _compress(self, payload):
+        if self.method == 'zlib':
+            return zlib.compress(payload, self.level)
+        if self.method == 'lzma':
+            return lzma.compress(payload, preset=min(self.level, 9))
+        return payload
+
+
+class ShowWriter:
+    """
+    Écrit un fichier de spectacle découpé en blocs indexés.
+
+    Deux usages: write(frames) pour un tenseur complet, ou append(chunk)
+    répété puis close() (ou bloc with) pour un flux de frames: seuls moins
+    d'un bloc de frames brutes sont gardés en mémoire, les blocs encodés
+    attendent dans un fichier temporaire que l'en-tête et l'index soient connus.
+    """
+
+    def __init__(self, path, codec=None, block_frames=None):
+        self.path = path
+        self.codec = codec or ShowCodec()
+        self.block_frames = block_frames or config.FPS  # une seconde par bloc
+        self._spool = None
+        self._pending = None
+        self._blocks = []
+        self._shape = None
+        self.n_frames = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        elif self._spool is not None:
+            self._spool.close()
+
+    def write(self, frames):
+        """Écrit le tenseur (frames, dims, N) complet. Retourne la taille en octets."""
+        self.append(frames)
+        return self.close()
+
+    def append(self, frames):
+        """Ajoute des frames (frames, dims, N) à la suite du flux."""
+        frames = np.asarray(frames)
+        if self._shape is None:
+            self._shape = frames.shape[1:]
+            self._spool = tempfile.TemporaryFile()
+        elif frames.shape[1:] != self._shape:
+            raise ValueError(f"Frames {frames.shape[1:]} incompatibles avec {self._shape}")
+        if self._pending is not None:
+            frames = np.concatenate([self._pending, frames])
+        full = len(frames) - len(frames) % self.block_frames
+        for start in range(0, full, self.block_frames):
+            self._spool_block(frames[start:start + self.block_frames])
+        # Reliquat (< un bloc) copié: l'appelant peut réutiliser son tableau
+        self._pending = frames[full:].copy() if full < len(frames) else None
+
+    def close(self):
+        """Termine le fichier (dernier bloc partiel, en-tête, index). Retourne la taille en octets."""
+        if self._shape is None:
+            raise ValueError("Aucune frame à écrire")
+        if self._pending is not None:
+            self._spool_block(self._pending)
+            self._pending = None
+        dims, n = self._shape
+
+        header = _FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION, dims, n, self.n_frames,
+                                   self.block_frames, len(self._blocks), self.codec.resolution)
+        offset = len(header) + _INDEX_ENTRY.size * len(self._blocks)
+        index = bytearray()
+        for length in self._blocks:
+            index += _INDEX_ENTRY.pack(offset, length)
+            offset += length
+
+        self._spool.seek(0)
+        with open(self.path, 'wb') as f:
+            f.write(header)
+            f.write(index)
+            shutil.copyfileobj(self._spool, f)
+        self._spool.close()
+        return offset
+
+    def _spool_block(self, frames):
+        block = self.codec.encode_block(frames)
+        self._spool.write(block)
+        self._blocks.append(len(block))
+        self.n_frames += len(frames)
+
+
+class ShowReader:
+    """Lecture à accès aléatoire d'un fichier de spectacle (un bloc en cache)."""
+
+    def __init__(self, path, codec=None):
+        self.path = path
+        self.codec = codec or ShowCodec()
+        self._file = open(path, 'rb')
+        header = self._file.read(_FILE_HEADER.size)
+        magic, version, self.dims, self.n, self.n_frames, self.block_frames, \
+            n_blocks, self.resolution = _FILE_HEADER.unpack(header)
+        if magic != FILE_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Fichier de spectacle invalide: {path}")
+        index = self._file.read(_INDEX_ENTRY.size * n_blocks)
+        self.index = [_INDEX_ENTRY.unpack_from(index, i * _INDEX_ENTRY.size)
+                      for i in range(n_blocks)]
+        self._cached_block = None
+        self._cached_frames = None
+
+    def __len__(self):
+        return self.n_frames
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def read_block(self, block_idx):
+        """Décode un bloc complet (frames, dims, N)."""
+        if block_idx != self._cached_block:
+            offset, length = self.index[block_idx]
+            self._file.seek(offset)
+            self._cached_frames = self.codec.decode_block(self._file.read(length))
+            self._cached_block = block_idx
+        return self._cached_frames
+
+    def frame(self, frame_idx):
+        """Retourne la frame demandée (dims, N) en ne décodant que son bloc."""
+        if not 0 <= frame_idx < self.n_frames:
+            raise IndexError(f"Frame {frame_idx} hors du spectacle ({self.n_frames} frames)")
+        block_idx, local = divmod(frame_idx, self.block_frames)
+        return self.read_block(block_idx)[local]
+
+    def iter_frames(self, start=0):
+        """Parcourt les frames à partir de start."""
+        for frame_idx in range(start, self.n_frames):
+            yield self.frame(frame_idx)
+
+
+def _smallest_int_code(values):
+    """Plus petit type entier signé contenant toutes les valeurs."""
+    if values.size == 0:
+        return 0
+    lo, hi = values.min(), values.max()
+    for code, dtype in _DELTA_DTYPES.items():
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return code
+    return 3
+
+
+def _shuffle_bytes(values):
+    """Regroupe les octets de même poids (améliore nettement l'entropie)."""
+    itemsize = values.dtype.itemsize
+    as_bytes = np.ascontiguousarray(values).view(np.uint8).reshape(-1, itemsize)
+    return np.ascontiguousarray(as_bytes.T).tobytes()
+
+
+def _unshuffle_bytes(raw, dtype):
+    itemsize = dtype.itemsize
+    planes = np.frombuffer(raw, dtype=np.uint8).reshape(itemsize, -1)
+    return np.ascontiguousarray(planes.T).view(dtype).ravel()
+
+
+def _decompress(method, payload):
+    if method == 'zlib':
+        return zlib.decompress(payload)
+    if method == 'lzma':
+        return lzma.decompress(payload)
+    return bytes(payload)
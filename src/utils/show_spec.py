@@ -0,0 +1,309 @@
+# src/utils/show_spec.py
+"""
+DESCRIPTION DÉCLARATIVE D'UN SPECTACLE
+Un tableau est décrit par une liste d'images clés (formation, instant,
+courbe de transition, couleur, effet lumineux, modificateurs de mouvement)
+au lieu de générateurs écrits à la main. Le compilateur produit directement
+les tenseurs du show: positions (frames, 2, N) et couleurs (frames, N, 3)
+uint8, par interpolation vectorisée sur toutes les frames à la fois.
+
+Format JSON:
+    {"duration": 60, "keyframes": [
+        {"time": 0, "formation": "base.circle", "params": {"radius": 0.8},
+         "color": "orange_niger"},
+        {"time": 10, "formation": "letters.get_ANEM_formation",
+         "easing": "ease_in_out", "transition": 5, "color": "#FFFFFF",
+         "effect": {"type": "pulsation", "frequency": 0.5},
+         "modifiers": [{"type": "wave", "amplitude": 0.05}]}]}
+"""
+
+import importlib
+import json
+import numpy as np
+from animations.splines import SplineTrajectory
+from animations.time_scaling import TrapezoidalPlan
+from utils.config import config
+
+# Familles de formations: préfixe -> (module, classe)
+FORMATION_FAMILIES = {
+    'base': ('formations.base_formations', 'BaseFormations'),
+    'letters': ('formations.letter_formations', 'LetterFormations'),
+    'golden': ('formations.golden_formations', 'GoldenFormations'),
+    'svg': ('formations.svg_formations', 'SvgFormations'),
+    'cultural': ('formations.cultural_formations', 'CulturalFormations'),
+    'advanced': ('formations.advanced_formations', 'AdvancedFormations'),
+}
+
+
+def _elastic(t):
+    """Oscillation amortie autour de la cible, continue en t=0 et t=1."""
+    return 1 - np.cos(13 * np.pi / 2 * t) * np.power(2.0, -10 * t)
+
+
+# Courbes de TransitionManager en version vectorisée ('elastic' y finit sur la
+# cible sans saut; 'step' tient la formation précédente jusqu'à la fin)
+EASINGS = {
+    'linear': lambda t: t,
+    'ease_in_out': lambda t: t * t * (3 - 2 * t),
+    'bounce': lambda t: np.where(t < 0.5, 4 * t * t, 1 - 4 * (t - 1) * (t - 1)),
+    'elastic': _elastic,
+    'step': lambda t: (t >= 1).astype(float),
+}
+
+
+def hex_to_rgb(color):
+    """Nom de config.COLORS ou '#RRGGBB' -> tableau RGB (3,) float."""
+    hex_color = config.COLORS.get(color, color).lstrip('#')
+    if len(hex_color) != 6:
+        raise ValueError(f"Couleur inconnue: {color}")
+    return np.array([int(hex_color[i:i+2], 16) for i in (0, 2, 4)], dtype=float)
+
+
+class Keyframe:
+    """
+    Image clé: à time, les robots partent vers formation et l'atteignent
+    en transition secondes (None: à l'image clé suivante; 'auto': temps
+    minimal à vitesse et accélération bornées, profils trapézoïdaux), selon easing.
+    La couleur suit la même courbe; effect et modifiers s'appliquent
+    jusqu'à l'image clé suivante.
+    """
+
+    def __init__(self, time, formation, params=None, easing='ease_in_out', transition=None,
+                 color='blanc_pure', effect=None, modifiers=None, name=None):
+        if easing not in EASINGS:
+            raise ValueError(f"Courbe inconnue: {easing}")
+        self.time = float(time)
+        self.formation = formation
+        self.params = dict(params or {})
+        self.easing = easing
+        self.transition = transition
+        self.color = color
+        self.effect = dict(effect) if effect else None
+        self.modifiers = [dict(m) for m in modifiers or []]
+        self.name = name or (formation if isinstance(formation, str) else f"keyframe_{time:g}")
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+def resolve_formation(reference, n_robots, params=None):
+    """
+    'famille.méthode' -> positions (2, N), ou tableau (2, N) déjà construit.
+
+    Exemples: 'base.circle', 'golden.sunflower', 'svg.silhouette' avec
+    params {'asset': 'girafe'}.
+    """
+    if not isinstance(reference, str):
+        positions = np.asarray(reference, dtype=float)
+    else:
+        family, _, method = reference.partition('.')
+        if family not in FORMATION_FAMILIES or not method:
+            raise ValueError(f"Formation inconnue: {reference}")
+        module_name, class_name = FORMATION_FAMILIES[family]
+        builder = getattr(importlib.import_module(module_name), class_name)(n_robots)
+        positions = np.asarray(getattr(builder, method)(**(params or {})), dtype=float)
+    if positions.shape != (2, n_robots):
+        raise ValueError(f"{reference}: formation {positions.shape}, attendu (2, {n_robots})")
+    return positions
+
+
+# ========== MODIFICATEURS (vectorisés sur (frames, 2, N)) ==========
+
+def _wave(pos, t, amplitude=0.1, frequency=1.0, direction='x'):
+    """Ondulation (MotionAnimator.wave) sur toutes les frames."""
+    axis, other = (1, 0) if direction == 'x' else (0, 1)
+    pos[:, axis] += amplitude * np.sin(2 * np.pi * frequency * t[:, None] + pos[:, other])
+
+
+def _rotate(pos, t, speed=0.2, center=(0.0, 0.0)):
+    """Rotation à vitesse angulaire constante (rad/s) autour de center."""
+    angle = speed * t[:, None]
+    c, s = np.cos(angle), np.sin(angle)
+    rx, ry = pos[:, 0] - center[0], pos[:, 1] - center[1]
+    pos[:, 0] = rx * c - ry * s + center[0]
+    pos[:, 1] = rx * s + ry * c + center[1]
+
+
+def _pulsate(pos, t, amplitude=0.1, frequency=0.5, center=(0.0, 0.0)):
+    """Respiration de la formation (facteur 1 + A·sin) autour de center."""
+    factor = 1 + amplitude * np.sin(2 * np.pi * frequency * t)[:, None, None]
+    center = np.asarray(center, dtype=float).reshape(1, 2, 1)
+    pos[:] = center + (pos - center) * factor
+
+
+MODIFIERS = {'wave': _wave, 'rotate': _rotate, 'pulsate': _pulsate}
+
+
+# ========== EFFETS LUMINEUX (intensité (frames, N)) ==========
+
+def _pulsation(t, local, n, frequency=0.5):
+    return np.broadcast_to((0.7 + 0.3 * np.sin(2 * np.pi * frequency * t))[:, None], (len(t), n))
+
+
+def _breathing(t, local, n, frequency=0.3):
+    return np.broadcast_to((0.85 + 0.15 * np.sin(2 * np.pi * frequency * t))[:, None], (len(t), n))
+
+
+def _sweep(t, local, n, period=4.0, width=0.2):
+    """Balayage horizontal (ColorAnimator.sweep_effect) de période donnée."""
+    progress = (local % period) / period
+    ratio = np.arange(n) / max(1, n - 1)
+    return np.where(np.abs(ratio[None, :] - progress[:, None]) < width, 1.2, 0.7)
+
+
+def _fade(direction):
+    def effect(t, local, n, duration=2.0):
+        progress = np.clip(local / duration, 0.0, 1.0)
+        level = progress if direction == 'in' else 1.0 - progress
+        return np.broadcast_to(level[:, None], (len(t), n))
+    return effect
+
+
+EFFECTS = {'pulsation': _pulsation, 'breathing': _breathing, 'sweep': _sweep,
+           'fade_in': _fade('in'), 'fade_out': _fade('out')}
+
+
+class ShowSpec:
+    """Spectacle décrit par images clés, compilé en tenseurs positions/couleurs."""
+
+    def __init__(self, keyframes, duration=None, n_robots=None, fps=None, interpolation='segments'):
+        """
+        interpolation: 'segments' (une courbe d'easing par transition) ou
+        'cubic' / 'catmull_rom' (une spline passe par chaque formation à son
+        instant d'arrivée: vitesse continue d'une image clé à l'autre).
+        """
+        if not keyframes:
+            raise ValueError("Un spectacle demande au moins une image clé")
+        if interpolation not in ('segments', 'cubic', 'catmull_rom'):
+            raise ValueError(f"Interpolation inconnue: {interpolation}")
+        self.interpolation = interpolation
+        self.keyframes = sorted(keyframes, key=lambda k: k.time)
+        self.n = n_robots or config.N_ROBOTS
+        self.fps = fps or config.FPS
+        self.duration = duration if duration is not None else self.keyframes[-1].time
+        for key in self.keyframes:
+            for modifier in key.modifiers:
+                if modifier.get('type') not in MODIFIERS:
+                    raise ValueError(f"Modificateur inconnu: {modifier.get('type')}")
+            if key.effect and key.effect.get('type') not in EFFECTS:
+                raise ValueError(f"Effet inconnu: {key.effect.get('type')}")
+
+    @classmethod
+    def from_dict(cls, data, n_robots=None):
+        return cls([Keyframe.from_dict(k) for k in data['keyframes']], data.get('duration'),
+                   n_robots or data.get('n_robots'), data.get('fps'),
+                   data.get('interpolation', 'segments'))
+
+    @classmethod
+    def load(cls, path, n_robots=None):
+        """Charge une description JSON."""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), n_robots)
+
+    @property
+    def n_frames(self):
+        return int(round(self.duration * self.fps))
+
+    def segments(self):
+        """(frame de début, nom) de chaque image clé, comme les phases du playlist."""
+        starts = np.ceil(np.array([k.time for k in self.keyframes]) * self.fps - 1e-9).astype(int)
+        return [(int(s), k.name) for s, k in zip(starts, self.keyframes) if s < self.n_frames]
+
+    def arrival_times(self, targets):
+        """
+        Instant où chaque formation est atteinte (fin de sa transition),
+        strictement croissant: une transition plus longue que l'écart à
+        l'image clé suivante est écourtée à cette image clé (comme en
+        interpolation par segments), au moins une frame après la précédente.
+        """
+        starts = [k.time for k in self.keyframes] + [self.duration]
+        arrivals = [starts[0]]
+        for i, key in enumerate(self.keyframes[1:], start=1):
+            if key.transition == 'auto':
+                arrival = key.time + TrapezoidalPlan(targets[i - 1], targets[i]).duration
+            else:
+                arrival = key.time + key.transition if key.transition is not None else starts[i + 1]
+            if i + 1 < len(self.keyframes):
+                arrival = min(arrival, starts[i + 1])
+            arrivals.append(max(arrival, arrivals[-1] + 1.0 / self.fps))
+        return np.array(arrivals)
+
+    def compile(self, dtype=np.float32):
+        """
+        Compile le spectacle: (positions (frames, 2, N), couleurs (frames, N, 3) uint8).
+
+        Chaque segment entre deux images clés est interpolé en une seule
+        opération sur toutes ses frames. En interpolation spline, le décalage
+        des modificateurs d'une image clé est fondu depuis celui de la
+        précédente pendant sa transition: pas de saut aux images clés.
+        """
+        n_frames = self.n_frames
+        positions = np.empty((n_frames, 2, self.n), dtype=dtype)
+        colors = np.empty((n_frames, self.n, 3), dtype=np.uint8)
+        times = np.arange(n_frames) / self.fps
+        starts = np.array([k.time for k in self.keyframes])
+        frame_starts = np.searchsorted(times, starts - 1e-9)
+        frame_ends = np.append(frame_starts[1:], n_frames)
+
+        targets = [resolve_formation(k.formation, self.n, k.params) for k in self.keyframes]
+        spline = None
+        if self.interpolation != 'segments' and len(targets) > 1:
+            arrivals = self.arrival_times(targets)
+            spline = SplineTrajectory(arrivals, targets, self.interpolation)
+            offset = np.zeros((2, self.n))   # Décalage des modificateurs en fin de segment
+
+        # Avant la première image clé: sa formation et sa couleur sont tenues depuis t=0
+        head = frame_starts[0]
+        positions[:head] = targets[0]
+        colors[:head] = hex_to_rgb(self.keyframes[0].color).astype(np.uint8)
+
+        # Chaque transition part de la dernière frame compilée (modificateurs compris)
+        previous_pos = previous_rgb = None
+        for i, (key, target) in enumerate(zip(self.keyframes, targets)):
+            rgb = np.broadcast_to(hex_to_rgb(key.color), (self.n, 3))
+            lo, hi = frame_starts[i], frame_ends[i]
+            if hi <= lo:
+                previous_pos, previous_rgb = target, rgb
+                continue
+            t = times[lo:hi]
+            local = t - key.time
+
+            if previous_pos is None:
+                previous_pos, previous_rgb = target, rgb
+            if key.transition == 'auto':
+                plan = TrapezoidalPlan(previous_pos, target)
+                progress = np.clip(local / max(plan.duration, 1e-9), 0.0, 1.0)
+            else:
+                end = starts[i + 1] if i + 1 < len(starts) else self.duration
+                span = key.transition if key.transition is not None else end - key.time
+                progress = EASINGS[key.easing](np.clip(local / max(span, 1e-9), 0.0, 1.0))
+
+            if spline is not None:
+                block = spline.evaluate(t)
+                path = block.copy()
+            elif key.transition == 'auto':
+                block = plan.evaluate(local)
+            else:
+                block = previous_pos[None] + (target - previous_pos)[None] * progress[:, None, None]
+            for modifier in key.modifiers:
+                params = {k: v for k, v in modifier.items() if k != 'type'}
+                MODIFIERS[modifier['type']](block, local, **params)
+            if spline is not None:
+                # Fondu du décalage précédent vers celui de cette image clé
+                span = max(arrivals[i] - key.time, 1e-9)
+                fade = EASINGS['ease_in_out'](np.clip(local / span, 0.0, 1.0))[:, None, None]
+                block = path + (block - path) * fade + offset[None] * (1 - fade)
+                offset = block[-1] - path[-1]
+            positions[lo:hi] = block
+
+            shade = previous_rgb[None] + (rgb - previous_rgb)[None] * progress[:, None, None]
+            # La transition suivante part de la couleur avant effet (un fade_out ne la noircit pas)
+            previous_rgb = shade[-1]
+            if key.effect:
+                params = {k: v for k, v in key.effect.items() if k != 'type'}
+                shade = shade * EFFECTS[key.effect['type']](t, local, self.n, **params)[:, :, None]
+            colors[lo:hi] = np.clip(shade, 0, 255).astype(np.uint8)
+
+            previous_pos = block[-1]
+        return positions, colors
@@ -0,0 +1,166 @@
+# src/utils/swarm_renderer.py
+"""
+RENDU DE L'ESSAIM AVEC NIVEAUX DE DÉTAIL
+Jusqu'à LOD_THRESHOLD robots: deux couches scatter (halo + cœur lumineux).
+Au-delà, un scatter par robot coûte trop cher sur les axes 3D: les robots
+sont projetés à l'écran puis « splattés » dans une image RGBA (histogramme
+pondéré par couleur + flou gaussien séparable) affichée par imshow. Le coût
+d'une frame dépend alors de la résolution de l'image, plus de N.
+"""
+
+import numpy as np
+from matplotlib.colors import to_rgba_array
+from utils.config import config
+
+
+def gaussian_kernel(sigma):
+    """Noyau gaussien 1D normalisé (rayon 3σ)."""
+    radius = max(int(np.ceil(3 * sigma)), 1)
+    x = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (x / sigma) ** 2)
+    return (kernel / kernel.sum()).astype(np.float32)
+
+
+def _blur(image, kernel):
+    """Flou séparable sur les deux premiers axes (somme de tranches décalées, sans boucle par pixel)."""
+    radius = len(kernel) // 2
+    height, width = image.shape[:2]
+    padded = np.pad(image, [(radius, radius), (0, 0)] + [(0, 0)] * (image.ndim - 2))
+    rows = kernel[0] * padded[:height]
+    for k in range(1, len(kernel)):
+        rows += kernel[k] * padded[k:k + height]
+    padded = np.pad(rows, [(0, 0), (radius, radius)] + [(0, 0)] * (image.ndim - 2))
+    out = kernel[0] * padded[:, :width]
+    for k in range(1, len(kernel)):
+        out += kernel[k] * padded[:, k:k + width]
+    return out
+
+
+def splat_density(x, y, rgb, extent, resolution=(320, 200), sigma=1.5, gain=1.5):
+    """
+    Image RGBA (H, W, 4) des robots: couleur moyenne pondérée et opacité
+    croissante avec la densité locale (1 - exp(-gain·densité)).
+
+    extent: (x_min, x_max, y_min, y_max) couvert par l'image.
+    """
+    width, height = resolution
+    x_min, x_max, y_min, y_max = extent
+    col = ((x - x_min) / (x_max - x_min) * width).astype(int)
+    row = ((y - y_min) / (y_max - y_min) * height).astype(int)
+    inside = (col >= 0) & (col < width) & (row >= 0) & (row < height)
+    flat = row[inside] * width + col[inside]
+
+    # Histogramme de densité et somme des couleurs par pixel (bincount par canal)
+    accum = np.empty((height * width, 4), dtype=np.float32)
+    accum[:, 3] = np.bincount(flat, minlength=height * width)
+    for channel in range(3):
+        accum[:, channel] = np.bincount(flat, weights=rgb[inside, channel], minlength=height * width)
+    accum = _blur(accum.reshape(height, width, 4), gaussian_kernel(sigma))
+
+    density = accum[..., 3]
+    image = np.zeros((height, width, 4), dtype=np.float32)
+    np.divide(accum[..., :3], density[..., None], out=image[..., :3], where=density[..., None] > 1e-6)
+    image[..., 3] = 1.0 - np.exp(-gain * density)
+    return image
+
+
+class SwarmRenderer:
+    """
+    Dessine l'essaim sur des axes matplotlib (2D ou 3D) en choisissant le
+    niveau de détail selon N.
+
+    glow_fraction < 1: seuls les robots les plus proches de la caméra
+    (fraction donnée) gardent leur halo, les plans éloignés en sont privés.
+    """
+
+    def __init__(self, ax, lod_threshold=None, glow_fraction=1.0, resolution=(320, 200), sigma=1.5):
+        self.ax = ax
+        self.lod_threshold = lod_threshold if lod_threshold is not None else config.LOD_THRESHOLD
+        self.glow_fraction = glow_fraction
+        self.resolution = resolution
+        self.sigma = sigma
+        self._overlay = None   # Axes 2D superposés (mode densité sur axes 3D)
+        self._image = None
+        self.last_mode = None
+
+    @property
+    def is_3d(self):
+        return hasattr(self.ax, 'get_proj')
+
+    def draw(self, positions, z=None, colors=None):
+        """Dessine une frame; colors: liste hex, noms ou tableau RGB(A) (N, 3|4)."""
+        n = positions.shape[1]
+        rgb = to_rgba_array(colors if colors is not None else 'white')[:, :3]
+        if len(rgb) == 1 and n > 1:
+            rgb = np.repeat(rgb, n, axis=0)
+        if z is None:
+            z = positions[2] if positions.shape[0] > 2 else np.zeros(n)
+
+        if n > self.lod_threshold:
+            self.last_mode = 'density'
+            self._draw_density(positions[0], positions[1], z, rgb)
+        else:
+            self.last_mode = 'scatter'
+            self._hide_density()
+            self._draw_scatter(positions[0], positions[1], z, rgb)
+
+    def _draw_scatter(self, x, y, z, rgb):
+        coords = (x, y, z) if self.is_3d else (x, y)
+        glow = self._near_camera(x, y, z) if self.glow_fraction < 1.0 else slice(None)
+        glow_coords = tuple(c[glow] for c in coords)
+        # Couche halo puis cœur lumineux (rendu historique du show)
+        self.ax.scatter(*glow_coords, c=rgb[glow], s=150, alpha=0.2, marker='o')
+        self.ax.scatter(*coords, c=rgb, s=40, alpha=1.0,
+                        edgecolors='white', linewidth=0.5, marker='o')
+
+    def _near_camera(self, x, y, z):
+        """Masque des robots dans la fraction la plus proche de la caméra."""
+        if self.is_3d:
+            elev, azim = np.radians(self.ax.elev), np.radians(self.ax.azim)
+            view = np.array([np.cos(elev) * np.cos(azim), np.cos(elev) * np.sin(azim), np.sin(elev)])
+            depth = -(view[0] * x + view[1] * y + view[2] * z)  # Petit = proche de l'œil
+        else:
+            depth = -z
+        cutoff = np.quantile(depth, self.glow_fraction)
+        return depth <= cutoff
+
+    def _draw_density(self, x, y, z, rgb):
+        if self.is_3d:
+            from mpl_toolkits.mplot3d import proj3d
+            proj = self.ax.get_proj()
+            sx, sy, _ = proj3d.proj_transform(x, y, z, proj)
+            # Cadre écran: projection des coins de l'arène
+            corners = np.array(np.meshgrid([-config.ARENA_WIDTH/2, config.ARENA_WIDTH/2],
+                                           [-config.ARENA_HEIGHT/2, config.ARENA_HEIGHT/2],
+                                           [0, config.ARENA_DEPTH])).reshape(3, -1)
+            cx, cy, _ = proj3d.proj_transform(*corners, proj)
+            extent = (cx.min(), cx.max(), cy.min(), cy.max())
+            target = self._overlay_axes()
+        else:
+            sx, sy = x, y
+            extent = (*self.ax.get_xlim(), *self.ax.get_ylim())
+            target = self.ax
+
+        image = splat_density(np.asarray(sx), np.asarray(sy), rgb, extent, self.resolution, self.sigma)
+        if self._image is None or self._image.axes is not target or self._image not in target.images:
+            self._image = target.imshow(image, origin='lower', extent=extent,
+                                        interpolation='bilinear', aspect='auto', zorder=3)
+        else:
+            self._image.set_data(image)
+            self._image.set_extent(extent)
+        if self.is_3d:
+            target.set_xlim(extent[:2])
+            target.set_ylim(extent[2:])
+        self._image.set_visible(True)
+
+    def _overlay_axes(self):
+        if self._overlay is None:
+            fig = self.ax.figure
+            self._overlay = fig.add_axes(self.ax.get_position(), zorder=self.ax.get_zorder() + 1)
+            self._overlay.set_axis_off()
+            self._overlay.patch.set_alpha(0.0)
+        return self._overlay
+
+    def _hide_density(self):
+        if self._image is not None:
+            self._image.set_visible(False)
@@ -8,6 +8,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
 
 from animations.color_animations import ColorAnimator
+from animations.flow_field import FlowField
+from animations.cloth import FlagCloth
+from animations.particles import ParticlePool
+from animations.kinematics import DifferentialRotation, pulsate, affine, rotation_matrix
+from animations.splines import SplineTrajectory, solve_tridiagonal
+from animations.transition_manager import TransitionManager
+from animations.time_scaling import TrapezoidalPlan, minimum_time
+from animations.motion_animations import MotionAnimator
 
 class TestColorAnimator(unittest.TestCase):
     def setUp(self):
@@ -24,5 +32,237 @@ class TestColorAnimator(unittest.TestCase):
         # Implement specific test if gradient logic exists
         pass
 
+    def test_batch_colors_match_dispatcher(self):
+        positions = np.random.default_rng(0).uniform(-1.2, 1.2, (3, 60))
+        for phase in ("Tempête de sable", "Soleil", "Drapeau ondulant", "Pluie drapeau",
+                      "Carte", "Finale", "default"):
+            for t in (0.0, 3.7, 41.2):
+                expected = [self.colors.hex_to_rgb(self.colors.get_phase_color(positions, phase, t, i))
+                            for i in range(60)]
+                batch = self.colors.get_phase_colors(positions, phase, t)
+                self.assertEqual(batch.dtype, np.uint8)
+                self.assertTrue(np.array_equal(batch, expected), phase)
+
+class TestKinematics(unittest.TestCase):
+    def setUp(self):
+        self.base = np.random.default_rng(0).uniform(-1, 1, (2, 30))
+
+    def test_rotation_matches_scalar_loop(self):
+        rotation = DifferentialRotation(self.base, omega=0.5, k=2.0)
+        result = rotation.evaluate(3.7)
+        for i in range(30):
+            x, y = self.base[:, i]
+            angle = 0.5 / (1 + np.hypot(x, y) * 2) * 3.7
+            self.assertAlmostEqual(result[0, i], x * np.cos(angle) - y * np.sin(angle))
+            self.assertAlmostEqual(result[1, i], x * np.sin(angle) + y * np.cos(angle))
+
+    def test_evaluate_writes_in_place(self):
+        rotation = DifferentialRotation(self.base, center=(0.2, -0.1))
+        out = np.empty((2, 30))
+        self.assertIs(rotation.evaluate(1.0, out=out), out)
+        # Le rayon autour du centre est conservé
+        center = np.array([[0.2], [-0.1]])
+        self.assertTrue(np.allclose(np.hypot(*(out - center)), rotation.radius))
+
+    def test_pulsate_and_affine(self):
+        out = pulsate(self.base, 2.0, center=(0, 0))
+        self.assertTrue(np.allclose(out, 2 * self.base))
+        pulsate(out, 0.5, center=(0, 0), out=out)
+        self.assertTrue(np.allclose(out, self.base))
+        turned = affine(self.base, rotation_matrix(np.pi / 2), offset=(1, 0))
+        self.assertTrue(np.allclose(turned[0], 1 - self.base[1]))
+        self.assertTrue(np.allclose(turned[1], self.base[0]))
+
+class TestSplines(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.times = np.array([0.0, 3.0, 5.0, 9.0, 12.0])
+        self.formations = rng.uniform(-1, 1, (5, 2, 40))
+
+    def test_tridiagonal_solve(self):
+        lower, diag, upper = np.array([0, 1.0, 1.0]), np.array([4.0, 4.0, 4.0]), np.array([1.0, 1.0, 0])
+        rhs = np.random.default_rng(1).normal(size=(3, 5))
+        matrix = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+        self.assertTrue(np.allclose(matrix @ solve_tridiagonal(lower, diag, upper, rhs), rhs))
+
+    def test_splines_interpolate_with_continuous_velocity(self):
+        for method in ('cubic', 'catmull_rom'):
+            spline = SplineTrajectory(self.times, self.formations, method)
+            self.assertTrue(np.allclose(spline.evaluate(self.times), self.formations))
+            self.assertEqual(spline.evaluate(4.0).shape, (2, 40))
+            inner = self.times[1:-1]
+            self.assertTrue(np.allclose(spline.evaluate(inner - 1e-7, 1), spline.evaluate(inner + 1e-7, 1), atol=1e-5))
+            self.assertTrue(np.allclose(spline.evaluate(self.times[[0, -1]], 1), 0.0))
+        cubic = SplineTrajectory(self.times, self.formations)
+        self.assertTrue(np.allclose(cubic.evaluate(inner - 1e-7, 2), cubic.evaluate(inner + 1e-7, 2), atol=1e-4))
+
+    def test_spline_lowers_peak_acceleration(self):
+        transitions = TransitionManager()
+        durations = np.diff(self.times)
+        chained = np.array([pos for k, d in enumerate(durations) for pos in
+                            transitions.interpolate_positions(self.formations[k], self.formations[k + 1], d)])
+        spline = np.array(list(transitions.interpolate_keyframes(list(self.formations), durations)))
+        self.assertEqual(spline.shape, chained.shape)
+        peak = lambda frames: np.abs(np.diff(frames, 2, axis=0)).max()
+        self.assertLess(peak(spline), peak(chained))
+
+class TestTimeScaling(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.start = rng.uniform(-1.4, 1.4, (2, 100))
+        self.end = rng.uniform(-1.4, 1.4, (2, 100))
+
+    def test_minimum_time_profiles(self):
+        # Trapézoïde: d/v + v/a ; triangle: 2·sqrt(d/a)
+        self.assertAlmostEqual(float(minimum_time(1.5, 0.15, 0.3)), 10.5)
+        self.assertAlmostEqual(float(minimum_time(0.03, 0.15, 0.3)), 2 * np.sqrt(0.1))
+
+    def test_synchronized_arrival_within_limits(self):
+        plan = TrapezoidalPlan(self.start, self.end, max_speed=0.15, max_accel=0.3)
+        slowest = minimum_time(plan.distance, 0.15, 0.3).max()
+        self.assertAlmostEqual(plan.duration, slowest)
+        t = np.linspace(0, plan.duration, 2001)
+        frames = plan.evaluate(t)
+        self.assertTrue(np.allclose(frames[0], self.start))
+        self.assertTrue(np.allclose(frames[-1], self.end))
+        dt = t[1] - t[0]
+        speed = np.sqrt((np.diff(frames, axis=0)**2).sum(axis=1)) / dt
+        self.assertLessEqual(speed.max(), 0.15 + 1e-6)
+        self.assertLessEqual(np.abs(np.diff(plan.speed(t), axis=0)).max() / dt, 0.3 + 1e-6)
+        self.assertTrue(np.allclose(plan.speed(plan.duration), 0.0))
+
+    def test_requested_duration(self):
+        with self.assertRaises(ValueError):
+            TrapezoidalPlan(self.start, self.end, duration=1.0)
+        slow = TrapezoidalPlan(self.start, self.end, duration=60.0)
+        self.assertLess(slow.cruise_speed.max(), 0.15)
+        frames = list(TransitionManager().interpolate_timed(self.start, self.end, fps=30))
+        self.assertTrue(np.allclose(frames[-1], self.end))
+
+class TestMotionAnimator(unittest.TestCase):
+    def test_jitter_changes_over_time(self):
+        motion = MotionAnimator()
+        pos = np.zeros((2, 20))
+        a = motion.jitter(pos, time_val=1.0)
+        self.assertFalse(np.array_equal(a, motion.jitter(pos, time_val=1.5)))
+        self.assertTrue(np.array_equal(a, MotionAnimator().jitter(pos, time_val=1.0)))
+        # Sans temps: un tremblement neuf à chaque appel
+        self.assertFalse(np.array_equal(motion.jitter(pos), motion.jitter(pos)))
+        # La graine de l'animateur (celle du spectacle) change le tremblement
+        self.assertFalse(np.array_equal(a, MotionAnimator(seed=7).jitter(pos, time_val=1.0)))
+
+class TestFlowField(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.positions = rng.uniform(-1.5, 1.5, (2, 400))
+
+    def test_vortex_matches_scalar_formula(self):
+        field = FlowField().add_vortex((0.2, -0.1), 0.1, 0.6)
+        velocity = field.velocity(self.positions)
+        for i in range(0, 400, 37):
+            dx, dy = self.positions[0, i] - 0.2, self.positions[1, i] + 0.1
+            distance = np.hypot(dx, dy)
+            strength = 0.1 * (0.6 - distance) / 0.6 if distance < 0.6 else 0.0
+            angle = np.arctan2(dy, dx)
+            self.assertTrue(np.allclose(velocity[:, i], [-strength * np.sin(angle), strength * np.cos(angle)]))
+
+    def test_curl_noise_is_divergence_free(self):
+        field = FlowField().add_curl_noise(amplitude=0.3, scale=1.5, rng=np.random.default_rng(1))
+        eps = 1e-5
+        ex, ey = np.array([[eps], [0.0]]), np.array([[0.0], [eps]])
+        div = ((field.velocity(self.positions + ex, 2.0)[0] - field.velocity(self.positions - ex, 2.0)[0])
+               + (field.velocity(self.positions + ey, 2.0)[1] - field.velocity(self.positions - ey, 2.0)[1])) / (2 * eps)
+        self.assertLess(np.abs(div).max(), 1e-6)
+        self.assertGreater(np.abs(field.velocity(self.positions, 2.0)).max(), 0.01)
+
+    def test_advect_wraps_and_grid_sampling(self):
+        bounds = (-1.6, 1.6, -1.0, 1.0)
+        field = FlowField().add_wind((0.5, 0.0)).add_sink((0.0, 0.0), 0.2, 1.0)
+        moved = field.advect(np.clip(self.positions, [[-1.6], [-1.0]], [[1.6], [1.0]]), 0.0, 1.0, bounds)
+        self.assertTrue(np.all((moved[0] >= -1.6) & (moved[0] <= 1.6)))
+        # Champ lisse hors du centre du puits: l'interpolation bilinéaire reste proche
+        grid = field.bake(bounds, resolution=(161, 101))
+        inside = (np.abs(self.positions[1]) < 1.0) & (np.hypot(*self.positions) > 0.1)
+        error = grid.sample(self.positions[:, inside]) - field.velocity(self.positions[:, inside])
+        self.assertLess(np.abs(error).max(), 0.01)
+        wind = FlowField().add_wind((0.3, -0.1)).bake(bounds, (8, 5))
+        self.assertTrue(np.allclose(wind.sample(self.positions), [[0.3], [-0.1]]))
+
+class TestFlagCloth(unittest.TestCase):
+    def test_stable_bounded_and_pinned(self):
+        cloth = FlagCloth(cols=40, rows=25)
+        self.assertGreaterEqual(cloth.substeps(1 / 30), 1)
+        peak = 0.0
+        for frame in range(30 * 120):
+            cloth.step(1 / 30)
+            peak = max(peak, np.abs(cloth.z).max())
+        self.assertTrue(np.all(np.isfinite(cloth.z)))
+        self.assertLess(peak, 0.3)
+        self.assertGreater(peak, 0.02)
+        self.assertTrue(np.all(cloth.z[:, 0] == 0.0))
+        # Le bord libre bat plus que la zone proche de la hampe
+        self.assertGreater(np.abs(cloth.z[:, -1]).max(), np.abs(cloth.z[:, 1]).max())
+
+    def test_sampling_and_shading(self):
+        cloth = FlagCloth(cols=10, rows=6, width=2.0, height=1.0)
+        flat_shade = cloth.ambient + (1 - cloth.ambient) * cloth.light[2]
+        for _ in range(20):
+            cloth.step(1 / 30)
+        # Robots posés sur les nœuds: valeurs exactes de la grille
+        uv = np.array([[0.0, 1/9, 1.0, 5/9], [0.0, 0.2, 1.0, 0.6]])
+        positions, shade = cloth.bind(uv).sample()
+        nodes = (np.array([0, 1, 5, 3]), np.array([0, 1, 9, 5]))
+        self.assertTrue(np.allclose(positions[2], cloth.z[nodes]))
+        self.assertTrue(np.allclose(shade, cloth.shade[nodes]))
+        self.assertTrue(np.allclose(positions[:2, 2], [1.0, 0.5]))
+        self.assertTrue(np.all((cloth.shade >= cloth.ambient) & (cloth.shade <= 1.0)))
+        still = FlagCloth(cols=10, rows=6)
+        still._update_shading()
+        self.assertTrue(np.allclose(still.shade, flat_shade))
+
+    def test_grid_uv_any_n(self):
+        cloth = FlagCloth()
+        for n in (37, 200, 1000):
+            uv = cloth.grid_uv(n)
+            self.assertEqual(uv.shape, (2, n))
+            self.assertTrue(np.all((uv >= 0) & (uv <= 1)))
+
+class TestParticlePool(unittest.TestCase):
+    def test_emit_overflow_and_kill_compaction(self):
+        pool = ParticlePool(5, np.random.default_rng(0), palette=['#000000', '#ffffff'])
+        pool.emit(3, [0.0, 0.0], color=0)
+        pool.emit(4, np.array([[1.0, 2.0, 3.0, 4.0], [0.0, 0.0, 0.0, 0.0]]), color=1)
+        self.assertEqual(pool.count, 5)
+        self.assertEqual(pool.dropped, 2)
+        self.assertTrue(np.allclose(pool.positions[0], [0, 0, 0, 1, 2]))
+        # Les survivantes gardent leurs données, le préfixe reste compact
+        dead = np.array([True, False, True, False, False])
+        self.assertEqual(pool.kill(dead), 2)
+        self.assertEqual(pool.count, 3)
+        self.assertEqual(sorted(pool.positions[0]), [0.0, 1.0, 2.0])
+        self.assertEqual(sorted(pool.colors()), ['#000000', '#ffffff', '#ffffff'])
+
+    def test_step_lifetime_gravity_and_wrap(self):
+        pool = ParticlePool(100, np.random.default_rng(0))
+        pool.emit(10, [0.0, 0.0], velocity=[1.0, 0.0], lifetime=0.5)
+        pool.emit(10, [0.0, 0.0], velocity=[0.0, 0.0])
+        pool.step(0.25, gravity=(0.0, -1.0))
+        self.assertEqual(pool.count, 20)
+        self.assertTrue(np.allclose(pool.velocities[1], -0.25))
+        self.assertTrue(np.all((pool.fade() > 0) & (pool.fade() <= 1)))
+        pool.step(0.25)
+        self.assertEqual(pool.count, 10)
+        self.assertTrue(np.all(np.isinf(pool.lifetime[:pool.count])))
+        pool.vel[0, :pool.count] = 10.0
+        pool.step(0.25, bounds=(-1.0, 1.0, -1.0, 1.0))
+        self.assertTrue(np.all(np.abs(pool.positions) <= 1.0))
+
+    def test_project_particles(self):
+        from projects.project_11_naissance_nation import Project11NaissanceNation
+        project = Project11NaissanceNation(n_robots=40)
+        self.assertEqual(project.particles_pos.shape, (3, 300))
+        project.update_particles(1.0)
+        self.assertEqual(project.particles_pos.shape, (3, 300))
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,12 +3,18 @@ import unittest
 import numpy as np
 import sys
 import os
+import tempfile
 
 # Ajouter src au path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
 
 from formations.base_formations import BaseFormations
+from formations.golden_formations import GoldenFormations
+from formations.svg_formations import SvgFormations, parse_path, resample_polylines, sample_svg
+from formations.instancing import InstancedFormation, instance_matrices
+from formations.scene_graph import SceneGraph, SceneNode, apportion
+from formations.star_catalog import StarCatalog, SPECTRAL_TYPES, spectral_index
 from utils.config import config
 
 class TestBaseFormations(unittest.TestCase):
@@ -33,6 +39,175 @@ class TestBaseFormations(unittest.TestCase):
         # Vérifier les bornes
         self.assertTrue(np.all(pos[0] >= config.safe_zone['x_min']))
         self.assertTrue(np.all(pos[0] <= config.safe_zone['x_max']))
+        # Appels successifs sans rng: nouvelles positions, reproductibles
+        self.assertFalse(np.array_equal(pos, self.base.random_positions()))
+        self.assertTrue(np.array_equal(pos, BaseFormations(n_robots=self.n).random_positions()))
+        self.assertFalse(np.array_equal(pos, BaseFormations(n_robots=self.n, seed=7).random_positions()))
+
+    def test_polygon_outline(self):
+        square = BaseFormations(n_robots=10).polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        self.assertEqual(square.shape, (2, 10))
+        self.assertTrue(np.allclose(square[:, :3].T, [(0, 0), (1/3, 0), (2/3, 0)]))
+        on_edge = np.isclose(square, 0) | np.isclose(square, 1)
+        self.assertTrue(np.all(on_edge.any(axis=0)))
+
+class TestGoldenFormations(unittest.TestCase):
+    def test_shapes_for_any_n(self):
+        for n in (1, 7, 50, 333):
+            golden = GoldenFormations(n)
+            for pos in (golden.vogel(), golden.sunflower(), golden.golden_rectangles(),
+                        golden.fibonacci_squares()):
+                self.assertEqual(pos.shape, (2, n))
+                self.assertTrue(np.all(np.isfinite(pos)))
+
+    def test_memoized_per_n(self):
+        a = GoldenFormations(40).vogel()
+        self.assertIs(GoldenFormations(40).vogel(), a)
+        self.assertIsNot(GoldenFormations(41).vogel(), a)
+        self.assertFalse(a.flags.writeable)
+
+    def test_sunflower_fills_disk(self):
+        pos = GoldenFormations(200).sunflower(radius=0.8)
+        radii = np.hypot(pos[0], pos[1])
+        self.assertAlmostEqual(radii.max(), 0.8)
+        # Le bord est garni: plusieurs graines exactement sur le cercle
+        self.assertGreater(np.sum(np.isclose(radii, 0.8)), 10)
+
+class TestStarCatalog(unittest.TestCase):
+    def test_columns_from_constellations(self):
+        catalog = StarCatalog.from_constellations()
+        self.assertEqual(len(catalog), 17)
+        orion = catalog.indices('orion')
+        self.assertEqual(catalog.names[orion[0]], "Bételgeuse")
+        self.assertEqual(SPECTRAL_TYPES[catalog.spectral[orion[0]]], "M")
+
+    def test_brightness_follows_magnitude(self):
+        catalog = StarCatalog.from_constellations()
+        brightness = catalog.brightness()
+        order = np.argsort(catalog.magnitudes)
+        self.assertTrue(np.all(np.diff(brightness[order]) <= 0))
+        self.assertAlmostEqual(brightness.max(), 1.0)
+        self.assertEqual(catalog.rgb().shape, (17, 3))
+
+    def test_spectral_parsing(self):
+        self.assertEqual(list(spectral_index(['B2V', 'k0', '', 'X'])), [1, 5, 4, 4])
+
+    def test_csv_night_sky(self):
+        rng = np.random.default_rng(0)
+        n_stars = 3000
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bright_stars.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("name,ra,dec,mag,spectral\n")
+                for k in range(n_stars):
+                    f.write(f"HR{k},{rng.uniform(60, 120):.4f},{rng.uniform(-30, 30):.4f},"
+                            f"{rng.uniform(-1, 6.5):.2f},{'OBAFGKM'[k % 7]}5V\n")
+            catalog = StarCatalog.from_csv(path)
+        self.assertEqual(len(catalog), n_stars)
+        positions, colors, idx = catalog.night_sky(2000)
+        zone = config.safe_zone
+        self.assertEqual(positions.shape, (2, 2000))
+        self.assertTrue(np.all(positions[0] >= zone['x_min'] - 1e-9))
+        self.assertTrue(np.all(positions[0] <= zone['x_max'] + 1e-9))
+        self.assertTrue(np.all(positions[1] >= zone['y_min'] - 1e-9))
+        self.assertTrue(np.all(positions[1] <= zone['y_max'] + 1e-9))
+        self.assertTrue(np.all(catalog.magnitudes[idx] <= np.sort(catalog.magnitudes)[1999]))
+        self.assertEqual(colors.shape, (2000, 3))
+
+class TestSvgFormations(unittest.TestCase):
+    def test_path_commands_flattened(self):
+        square = parse_path("m0 0 h10 v10 h-10 z")[0]
+        self.assertTrue(np.allclose(square, [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]))
+        # Arc demi-cercle de rayon 10: tous les points à distance 10 du centre
+        arc = parse_path("M-10 0 A10 10 0 0 1 10 0")[0]
+        self.assertTrue(np.allclose(np.hypot(arc[:, 0], arc[:, 1]), 10))
+        self.assertLess(arc[:, 1].min(), -9.9)  # Passe par le haut de l'écran (y négatif)
+        curve = parse_path("M0 0 C0 10 10 10 10 0")[0]
+        self.assertTrue(np.allclose(curve[-1], [10, 0]))
+        self.assertAlmostEqual(curve[:, 1].max(), 7.5, places=1)
+
+    def test_resample_proportional_to_length(self):
+        long_stroke = np.array([[0.0, 3.0], [0.0, 0.0]])
+        short_stroke = np.array([[0.0, 1.0], [1.0, 1.0]])
+        positions, groups = resample_polylines([long_stroke, short_stroke], 40, ['long', 'court'])
+        self.assertEqual(positions.shape, (2, 40))
+        self.assertEqual(groups['long'], slice(0, 30))
+        self.assertEqual(groups['court'], slice(30, 40))
+        # Pas constant le long du trait
+        self.assertTrue(np.allclose(np.diff(positions[0, :30]), 0.1))
+
+    def test_assets_any_n_and_cached(self):
+        for asset in ('girafe', 'elephant', 'addax', 'dromadaire', 'mosquee_agadez', 'croix_agadez'):
+            for n in (3, 50, 777):
+                positions, _ = sample_svg(asset, n)
+                self.assertEqual(positions.shape, (2, n))
+                self.assertTrue(np.all(np.abs(positions) < 1.5))
+        self.assertIs(sample_svg('girafe', 50)[0], sample_svg('girafe', 50)[0])
+
+    def test_herd_shares_robots(self):
+        herd = SvgFormations(101).herd('addax', [(0, 0), (0.6, 0), (1.2, 0)])
+        self.assertEqual(herd.shape, (2, 101))
+        self.assertGreater(herd[0, 70:].min(), 0.8)  # Le troisième addax est décalé
+
+class TestInstancing(unittest.TestCase):
+    def setUp(self):
+        self.base = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
+
+    def test_batched_transforms_match_per_instance(self):
+        translate = np.array([[0.0, 0.0], [1.0, -1.0], [5.0, 5.0]])
+        rotate = np.array([0.0, np.pi / 2, 0.3])
+        scale = np.array([1.0, 2.0, 0.5])
+        mirror = np.array([False, False, True])
+        herd = InstancedFormation(self.base, 3).set_transforms(translate, scale, rotate, mirror)
+        result = herd.evaluate()
+        for k, part in enumerate(herd.instance_slices()):
+            c, s = np.cos(rotate[k]), np.sin(rotate[k])
+            shape = self.base * [[-1.0 if mirror[k] else 1.0], [1.0]] * scale[k]
+            expected = np.array([[c, -s], [s, c]]) @ shape + translate[k][:, None]
+            self.assertTrue(np.allclose(result[:, part], expected))
+
+    def test_uneven_counts_and_out_buffer(self):
+        herd = InstancedFormation(self.base, 2, counts=[3, 2])
+        herd.set_transforms(translate=[[0, 0], [10, 0]])
+        out = np.empty((2, 5))
+        self.assertIs(herd.evaluate(out=out), out)
+        self.assertTrue(np.allclose(out[:, 3:], self.base[:, :2] + [[10], [0]]))
+
+    def test_common_transform_broadcast(self):
+        self.assertEqual(instance_matrices(translate=(1, 2), count=4).shape, (4, 2, 3))
+        self.assertEqual(instance_matrices(rotate=np.zeros(5)).shape, (5, 2, 3))
+
+class TestSceneGraph(unittest.TestCase):
+    def setUp(self):
+        line = lambda n: np.array([np.linspace(0, 1, n), np.zeros(n)])
+        self.tete = SceneNode('tete', shape=line, translate=(1.0, 0.0))
+        self.cou = SceneNode('cou', shape=line, children=[self.tete])
+        self.root = SceneNode('root', children=[SceneNode('corps', shape=line, budget=4), self.cou])
+        self.scene = SceneGraph(self.root, 10)
+
+    def test_budgets_and_contiguous_subtrees(self):
+        self.assertEqual(apportion(7, [1, 1, 1]).tolist(), [3, 2, 2])
+        self.assertEqual(self.scene.slice('corps'), slice(0, 4))
+        self.assertEqual(self.scene.slice('cou'), slice(4, 10))
+        self.assertEqual(self.scene.slice('tete'), slice(7, 10))
+
+    def test_only_dirty_subtree_is_recomputed(self):
+        first = self.scene.compile().copy()
+        self.assertEqual(self.scene.last_updated, 10)
+        self.scene.compile()
+        self.assertEqual(self.scene.last_updated, 0)
+        self.cou.set_transform(rotate=np.pi / 2)
+        result = self.scene.compile()
+        self.assertEqual(self.scene.last_updated, 6)
+        self.assertTrue(np.array_equal(result[:, :4], first[:, :4]))
+        # La tête hérite de la rotation du cou: (1 + x, 0) -> (0, 1 + x)
+        self.assertTrue(np.allclose(result[1, 7:], first[0, 7:]))
+        self.assertTrue(np.allclose(result[0, 7:], 0.0))
+
+    def test_pivot_and_3d_output(self):
+        node = SceneNode('bras', shape=np.array([[2.0], [0.0]]), pivot=(1.0, 0.0), rotate=np.pi)
+        result = SceneGraph(SceneNode(children=[node]), 1, dims=3).compile()
+        self.assertTrue(np.allclose(result[:, 0], [0.0, 0.0, 0.0]))
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,296 @@
+import unittest
+import numpy as np
+import sys
+import os
+import time
+import multiprocessing as mp
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+
+from low_level.safety_filter import SafetyFilter, neighbor_pairs
+from low_level.real_time_control import RealTimeController, positions_to_velocities
+from low_level.protocol import CommandEncoder, CommandDecoder, LoopbackReceiver, encode_telemetry, decode_telemetry
+from low_level.tracking import TrackingController
+from low_level.fleet_simulator import FleetSimulator, FleetProcess
+from low_level.telemetry import TelemetryStore, TelemetryListener, telemetry_records, fleet_telemetry_process
+from utils.config import config
+
+class TestSafetyFilter(unittest.TestCase):
+    def test_neighbor_pairs_matches_brute_force(self):
+        pos = np.random.default_rng(0).uniform(-1, 1, (2, 300))
+        i, j = neighbor_pairs(pos, 0.2)
+        found = {tuple(sorted(p)) for p in zip(i.tolist(), j.tolist())}
+        d = np.sqrt(((pos[:, :, None] - pos[:, None, :]) ** 2).sum(axis=0))
+        expected = {(a, b) for a, b in zip(*np.nonzero(np.triu(d < 0.2, k=1)))}
+        self.assertEqual(found, expected)
+        self.assertEqual(len(found), len(i))
+
+    def test_head_on_robots_are_slowed(self):
+        d_min = 2 * config.ROBOT_RADIUS
+        pos = np.array([[-d_min * 0.45, d_min * 0.45], [0.0, 0.0]])
+        v_cmd = np.array([[0.1, -0.1], [0.0, 0.0]])
+        v = SafetyFilter().filter(pos, v_cmd)
+        # Déjà trop proches: ils doivent s'écarter
+        self.assertLessEqual(v[0, 0] - v[0, 1], 1e-6)
+
+    def test_far_robots_untouched(self):
+        pos = np.array([[-1.0, 1.0], [0.0, 0.0]])
+        v_cmd = np.array([[0.1, -0.1], [0.0, 0.0]])
+        safety = SafetyFilter()
+        self.assertTrue(np.allclose(safety.filter(pos, v_cmd), v_cmd))
+        self.assertEqual(safety.last_stats['pairs'], 0)
+
+    @staticmethod
+    def crossing(n_robots, spacing):
+        """Deux grilles décalées d'une demi-maille qui échangent leurs places."""
+        half = n_robots // 2
+        cols = int(np.ceil(np.sqrt(half)))
+        k = np.arange(half)
+        gx, gy = (k % cols) * spacing, (k // cols) * spacing
+        left = np.vstack([gx - gx.max() - 0.3, gy])
+        right = np.vstack([gx + 0.3, gy + spacing / 2])
+        return np.hstack([left, right]), np.hstack([right, left])
+
+    def simulate(self, safety, current, target, ticks):
+        """Intègre le croisement; renvoie (distance minimale, positions finales)."""
+        dt = 1.0 / config.FPS
+        closest = np.inf
+        for _ in range(ticks):
+            v = safety.filter(current, positions_to_velocities(current, target, dt))
+            self.assertTrue((np.hypot(v[0], v[1]) <= safety.max_speed + 1e-12).all())
+            current = current + v * dt
+            d = np.hypot(*(current[:, :, None] - current[:, None, :]))
+            np.fill_diagonal(d, np.inf)
+            closest = min(closest, d.min())
+        return closest, current
+
+    def test_feasible_crossing_keeps_min_distance(self):
+        safety = SafetyFilter()
+        current, target = self.crossing(40, spacing=0.35)
+        closest, final = self.simulate(safety, current, target, 450)
+        self.assertGreaterEqual(closest, safety.min_distance)
+        # Croisement réalisable: tout le monde arrive
+        self.assertLess(np.hypot(*(final - target)).max(), 0.01)
+
+    def test_fallback_keeps_min_distance(self):
+        # Croisement bloqué, solveur bridé: le repli par ralentissement reste sûr
+        safety = SafetyFilter(max_iterations=5)
+        current, target = self.crossing(40, spacing=0.22)
+        closest, _ = self.simulate(safety, current, target, 150)
+        self.assertGreaterEqual(closest, safety.min_distance)
+        self.assertFalse(safety.last_stats['converged'])
+        self.assertGreater(safety.last_stats['slowed'], 0)
+
+    def test_controller_applies_filter(self):
+        ctrl = RealTimeController(safety_filter=SafetyFilter())
+        ctrl.connect()
+        pos = np.array([[-0.07, 0.07], [0.0, 0.0]])
+        v = ctrl.command_positions(pos, -pos)
+        self.assertLessEqual(v[0, 0] - v[0, 1], 1e-6)
+
+class TestCommandProtocol(unittest.TestCase):
+    def setUp(self):
+        self.colors = np.random.default_rng(0).integers(0, 256, (200, 3)).astype(np.uint8)
+
+    def test_delta_frames_reconstructed_exactly(self):
+        encoder, decoder = CommandEncoder(200, keyframe_interval=10), CommandDecoder()
+        velocities = np.random.default_rng(1).normal(0, 0.1, (2, 200))
+        first = encoder.encode(velocities, self.colors)
+        decoder.decode(first)
+        self.assertTrue(np.allclose(decoder.velocities, velocities, atol=1e-6))
+        self.colors[[3, 50, 199]] = 7
+        delta = encoder.encode(velocities, self.colors)
+        # 3 robots changés: 5 octets chacun au lieu de la trame complète
+        self.assertEqual(len(delta), len(first) - 200 * 3 + 3 * 5)
+        decoder.decode(delta)
+        self.assertTrue(decoder.synced)
+        self.assertTrue(np.array_equal(decoder.colors, self.colors))
+        self.assertEqual(decoder.stats['keyframes'], 1)
+
+    def test_lost_packet_detected_then_resynced(self):
+        encoder, decoder = CommandEncoder(200, keyframe_interval=5), CommandDecoder()
+        decoder.decode(encoder.encode(colors=self.colors))
+        self.colors[0] = 1
+        encoder.encode(colors=self.colors)          # perdu
+        self.colors[1] = 2
+        decoder.decode(encoder.encode(colors=self.colors))
+        self.assertEqual(decoder.stats['lost'], 1)
+        self.assertFalse(decoder.synced)
+        for _ in range(3):
+            decoder.decode(encoder.encode(colors=self.colors))
+        self.assertTrue(decoder.synced)
+        self.assertTrue(np.array_equal(decoder.colors, self.colors))
+
+    def test_controller_coalesces_velocities_and_colors_over_udp(self):
+        with LoopbackReceiver() as receiver:
+            ctrl = RealTimeController(address=receiver.address)
+            ctrl.connect()
+            pos = np.zeros((2, 200))
+            ctrl.command_positions(pos, pos + 0.001, colors=self.colors, time_val=1.5)
+            self.assertEqual(receiver.poll(timeout=1.0), 1)
+            ctrl.disconnect()
+        decoder = receiver.decoder
+        self.assertTrue(decoder.synced)
+        self.assertEqual(decoder.time, 1.5)
+        self.assertTrue(np.array_equal(decoder.colors, self.colors))
+        self.assertTrue(np.allclose(decoder.velocities, 0.03, atol=1e-6))
+        # Hôte seul: port de commande par défaut
+        self.assertEqual(RealTimeController(address='127.0.0.1').address,
+                         ('127.0.0.1', config.COMMAND_PORT))
+
+class TestTelemetry(unittest.TestCase):
+    def test_store_publishes_complete_ticks_without_copy(self):
+        store = TelemetryStore(4, history=4)
+        poses = np.arange(12, dtype=float).reshape(3, 4)
+        records = telemetry_records(poses, 1.0, battery=0.5)
+        store.ingest(records[:2], tick=7)
+        self.assertIsNone(store.latest())
+        store.ingest(records[2:], tick=7)
+        latest, stamps, seq = store.latest()
+        self.assertTrue(np.allclose(latest, poses))
+        self.assertTrue(np.shares_memory(latest, store.poses))
+        self.assertTrue(np.allclose(store.battery, 0.5, atol=0.003))
+        # Paquet en retard: plus vieux que l'état connu, ignoré
+        store.ingest(telemetry_records(poses + 1, 0.5)[:1], tick=8)
+        self.assertEqual(store.stats['stale'], 1)
+        # Tick suivant incomplet: publié à l'arrivée du tick d'après
+        store.ingest(telemetry_records(poses + 1, 2.0)[:1], tick=9)
+        store.ingest(telemetry_records(poses + 2, 3.0)[3:], tick=10)
+        self.assertEqual(store.seq, 2)
+        self.assertEqual(store.latest()[0][0, 0], 1.0)
+        self.assertEqual(store.latest()[0][0, 1], 1.0)   # Robot non reçu: pose reportée
+        self.assertTrue(store.valid(seq))
+        for tick in range(11, 14):
+            store.ingest(records, tick=tick)
+        self.assertFalse(store.valid(seq))
+
+    def test_malformed_datagram_rejected(self):
+        packet = encode_telemetry(telemetry_records(np.zeros((3, 5)), 0.0))[0]
+        self.assertEqual(len(decode_telemetry(packet)[2]), 5)
+        with self.assertRaises(ValueError):
+            decode_telemetry(packet[:-3])
+
+    def test_fleet_process_over_udp(self):
+        store = TelemetryStore(300)
+        with TelemetryListener(store) as listener:
+            fleet = mp.Process(target=fleet_telemetry_process,
+                               args=(listener.address, 300, 100.0, 0.3))
+            fleet.start()
+            fleet.join(timeout=10)
+            deadline = time.monotonic() + 2.0
+            while store.stats['records'] < 30 * 300 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertEqual(store.stats['records'], 30 * 300)
+        self.assertEqual(store.seq, 30)
+        ctrl = RealTimeController(telemetry=store)
+        poses = ctrl.latest_poses()
+        radius = np.hypot(poses[0], poses[1])
+        self.assertTrue(np.all((radius > 0.19) & (radius < 0.91)))
+        self.assertTrue(np.all(store.age() < 5.0))
+
+class TestFleetSimulator(unittest.TestCase):
+    def test_unicycle_turns_then_drives(self):
+        fleet = FleetSimulator(3, ('127.0.0.1', 9), poses=np.zeros((3, 3)))
+        try:
+            v, omega = fleet.unicycle_commands(np.array([[0.1, 0.0, -0.1], [0.0, 0.1, 0.0]]))
+            # Devant: tout droit; à gauche: rotation sur place; derrière: marche arrière
+            self.assertTrue(np.allclose(v, [0.1, 0.0, -0.1]))
+            self.assertTrue(np.allclose(omega, [0.0, config.MAX_ANGULAR_VELOCITY, 0.0]))
+            fleet._v, fleet._omega = np.full(3, 0.1), np.array([0.0, 1.0, 0.0])
+            for _ in range(100):
+                fleet.step(0.01)
+            self.assertAlmostEqual(fleet.poses[0, 0], 0.1)
+            # Arc de rayon v/ω = 0.1 parcouru pendant 1 rad
+            self.assertAlmostEqual(fleet.poses[0, 1], 0.1 * np.sin(1.0))
+            self.assertAlmostEqual(fleet.poses[1, 1], 0.1 * (1 - np.cos(1.0)))
+        finally:
+            fleet.close()
+
+    def test_closed_loop_through_processes(self):
+        store = TelemetryStore(200)
+        with TelemetryListener(store) as listener:
+            fleet = FleetProcess(200, listener.address, latency=0.02)
+            ctrl = RealTimeController(address=fleet.start(), telemetry=store)
+            ctrl.connect()
+            deadline = time.monotonic() + 5.0
+            while store.seq == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            start = ctrl.latest_poses().copy()
+            colors = np.full((200, 3), 255, dtype=np.uint8)
+            for _ in range(15):
+                ctrl.command_positions(start[:2], start[:2] + [[0.0], [0.05]], colors=colors)
+                time.sleep(1 / 30)
+            time.sleep(0.1)
+            moved = ctrl.latest_poses()[1] - start[1]
+            ctrl.disconnect()
+            stats = fleet.stop()
+        self.assertGreater(stats['commands'], 10)
+        self.assertEqual(stats['led_corrupt'], 0)
+        self.assertTrue(np.all(moved > 0.01))
+
+class TestTrackingController(unittest.TestCase):
+    def circle_targets(self, angular_speed, n=50, frames=120):
+        t = np.arange(frames)[:, None] / config.FPS
+        centers = np.random.default_rng(0).uniform(-1, 1, (2, n))
+        angle = angular_speed * t
+        return np.stack([centers[0] + 0.2 * np.cos(angle), centers[1] + 0.2 * np.sin(angle)], axis=1)
+
+    def simulate(self, tracker, poses, moving=None, ticks=400):
+        dt = 1.0 / config.FPS
+        for _ in range(ticks):
+            velocities = tracker.update(poses, dt)
+            poses += velocities * dt * (1 if moving is None else moving)
+            if tracker.done:
+                break
+        return poses
+
+    def test_feasible_show_tracked_at_full_rate(self):
+        targets = self.circle_targets(0.3)
+        tracker = TrackingController(targets)
+        poses = targets[0].copy() + 0.02
+        self.simulate(tracker, poses)
+        self.assertTrue(tracker.done)
+        self.assertAlmostEqual(tracker.samples, len(targets) - 1, delta=1)
+        self.assertEqual(tracker.rate, 1.0)
+        self.assertLess(tracker.report()['max'], 0.005)
+        # Fin du spectacle: plus d'anticipation, la formation finale est tenue
+        self.assertTrue(np.allclose(tracker.sample(tracker.duration)[1], 0.0))
+
+    def test_clock_slows_for_fast_references_and_stalled_swarm(self):
+        fast = TrackingController(self.circle_targets(2.0))
+        self.simulate(fast, fast.targets[0].copy(), ticks=60)
+        # 0.4 m/s demandés pour 0.15 m/s disponibles (marge headroom)
+        self.assertAlmostEqual(fast.rate, 0.8 * config.MAX_LINEAR_VELOCITY / 0.4, places=2)
+        self.assertLess(fast.report()['p95'], 0.01)
+
+        stalled = TrackingController(self.circle_targets(0.3), min_rate=0.0)
+        moving = np.ones(50)
+        moving[:25] = 0.0   # La moitié des robots, bloquée loin de sa cible
+        poses = stalled.targets[0].copy()
+        poses[:, :25] += 0.3
+        self.simulate(stalled, poses, moving=moving, ticks=200)
+        self.assertEqual(stalled.rate, 0.0)
+        self.assertLess(stalled.show_time, 0.5)
+        self.assertEqual(stalled.report()['lagging'], 25)
+
+    def test_stale_robots_get_feedforward_only(self):
+        targets = self.circle_targets(0.3, n=4)
+        tracker = TrackingController(targets)
+        poses = targets[0] + 0.05
+        velocities = tracker.update(poses, 1.0 / config.FPS, age=np.array([0.0, 0.0, 1.0, np.inf]))
+        reference = (targets[1] - targets[0]) * config.FPS
+        self.assertTrue(np.allclose(velocities[:, 2:], reference[:, 2:]))
+        self.assertFalse(np.allclose(velocities[:, :2], reference[:, :2]))
+
+    def test_tick_cost_at_1000_robots(self):
+        targets = self.circle_targets(0.3, n=1000, frames=30)
+        tracker = TrackingController(targets)
+        poses = targets[0].copy()
+        start = time.perf_counter()
+        for _ in range(20):
+            tracker.update(poses, 1.0 / config.FPS)
+        self.assertLess((time.perf_counter() - start) / 20, 1.0 / config.FPS / 4)
+
+if __name__ == '__main__':
+    unittest.main()
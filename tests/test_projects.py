@@ -2,13 +2,19 @@
 import unittest
 import sys
 import os
+import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
 
 from projects.project_01_anem_lumiere import Project01AnemLumiere
 from projects.project_02_monuments import Project02Monuments
+from projects.project_04_constellations import Project04Constellations
+from projects.project_07_faune import Project07FauneNiger
+from projects.project_09_parade import Project09GrandeParade
 from projects.project_11_naissance_nation import Project11NaissanceNation
+from utils.baking import bake_positions
+from utils.config import config
 
 class TestProjects(unittest.TestCase):
     def test_project_01_init(self):
@@ -25,5 +31,66 @@ class TestProjects(unittest.TestCase):
         self.assertEqual(p.n, 100)
         self.assertTrue('1_desert' in p.phases)
 
+    def test_project_09_formations_any_n(self):
+        for n in (50, 73, 2000):
+            p = Project09GrandeParade(n_robots=n)
+            for name in ('military', 'wave', 'spiral', 'square', 'triangle', 'hexagon', 'star', 'heart'):
+                positions = getattr(p, f'_create_{name}_formation')()
+                self.assertEqual(positions.shape, (2, n))
+                self.assertEqual(len(np.unique(positions.round(9), axis=1).T), n)
+        # Chaque robot appartient à une rangée animée
+        positions, row_of = Project09GrandeParade(n_robots=200)._create_military_formation(with_rows=True)
+        self.assertEqual(len(row_of), 200)
+        for row in np.unique(row_of):
+            self.assertEqual(len(np.unique(positions[1, row_of == row])), 1)
+
+    def test_seeded_render_reproducible(self):
+        a = bake_positions(Project01AnemLumiere(n_robots=20, seed=5), max_frames=40)
+        b = bake_positions(Project01AnemLumiere(n_robots=20, seed=5), max_frames=40)
+        c = bake_positions(Project01AnemLumiere(n_robots=20, seed=6), max_frames=40)
+        self.assertTrue(np.array_equal(a, b))
+        self.assertFalse(np.array_equal(a, c))
+
+    def test_project_seed_drives_particles_and_curl_noise(self):
+        a = Project11NaissanceNation(n_robots=20, seed=5)
+        b = Project11NaissanceNation(n_robots=20, seed=6)
+        probe = np.array([np.linspace(-1, 1, 10), np.zeros(10)])
+        self.assertFalse(np.array_equal(a.sand_wind.velocity(probe, 1.0), b.sand_wind.velocity(probe, 1.0)))
+        for p in (a, b):
+            p.particles.clear()
+            p.particles.emit(50, np.zeros(3), velocity_spread=0.5)
+        self.assertFalse(np.array_equal(a.particles.velocities, b.particles.velocities))
+
+    def test_project_04_long_transition_fits_phase(self):
+        p = Project04Constellations(n_robots=20)
+        start = np.zeros((2, 20))
+        target = np.full((2, 20), 1.0)   # ~10.4 s en temps minimal
+        with self.assertLogs("Project04", level='WARNING'):
+            frames = list(p._planned_transition(start, target, 0.0, 60))
+        self.assertEqual(len(frames), 60)
+        # Accélérée pour tenir dans la phase: la cible est atteinte, pas de saut
+        self.assertTrue(np.allclose(frames[-1][0], target))
+        steps = np.sqrt((np.diff([pos for pos, _ in frames], axis=0) ** 2).sum(axis=1))
+        self.assertLess(steps.max(), 0.1)
+
+    def test_project_07_herd_continues_from_transition(self):
+        p = Project07FauneNiger(n_robots=200)
+        start = p._create_elephant_silhouette()
+        for phase in (p.phase_3_addax, p.phase_4_dromadaire):
+            frames = np.array([pos.copy() for pos, _ in phase(start, duration=7)])
+            steps = np.sqrt((np.diff(frames, axis=0) ** 2).sum(axis=1)).max(axis=1)
+            # Frame 149 -> 150: fin de transition -> animation instanciée, sans saut
+            boundary = int(5 * config.FPS) - 1
+            self.assertLess(steps[boundary], 0.04)
+            self.assertLessEqual(steps[boundary], steps[boundary + 1:].max() + 1e-9)
+
+    def test_storm_color_reproducible(self):
+        p = Project01AnemLumiere(n_robots=20, seed=5)
+        pos = np.zeros((3, 20))
+        first = [p.colors.get_phase_color(pos, "Tempête de Sable", 1.0, i) for i in range(20)]
+        p.colors.get_phase_color(pos, "Tempête de Sable", 2.0, 0)
+        again = [p.colors.get_phase_color(pos, "Tempête de Sable", 1.0, i) for i in range(20)]
+        self.assertEqual(first, again)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,342 @@
+import unittest
+import numpy as np
+import sys
+import os
+import tempfile
+import tracemalloc
+import contextlib
+import io
+import multiprocessing as mp
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+
+from utils.show_codec import ShowCodec, ShowWriter, ShowReader
+from utils.random_streams import ShowRandom, stream
+from utils.playlist import PlaylistRunner
+from utils.frame_bus import FrameBus, project_producer, _CLOSED
+from utils.frame_buffers import FrameBuffers
+from utils.baking import (load_project, iter_project_frames, bake_frames, bake_positions, bake_colors,
+                          bake_show, iter_baked_chunks, colors_path, iter_baked_colors)
+from projects.project_11_naissance_nation import Project11NaissanceNation
+from formations.base_formations import BaseFormations
+from utils.show_spec import ShowSpec, Keyframe
+from utils.swarm_renderer import SwarmRenderer, splat_density
+
+class TestShowCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = ShowCodec(resolution=0.001)
+        t = np.linspace(0, 1, 90)[:, None, None]
+        base = np.random.default_rng(0).uniform(-1.4, 1.4, (1, 3, 40))
+        self.frames = (base * (1 + 0.2 * np.sin(2 * np.pi * t))).astype(np.float32)
+
+    def test_roundtrip_within_resolution(self):
+        decoded = self.codec.decode_block(self.codec.encode_block(self.frames))
+        self.assertEqual(decoded.shape, self.frames.shape)
+        self.assertLessEqual(np.abs(decoded - self.frames).max(), 0.0005 + 1e-6)
+
+    def test_integer_colors_exact(self):
+        colors = np.random.default_rng(1).integers(0, 256, (10, 3, 40)).astype(np.uint8)
+        decoded = self.codec.decode_block(self.codec.encode_block(colors))
+        self.assertTrue(np.array_equal(decoded, colors))
+
+    def test_file_random_access(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'show.amsf')
+            ShowWriter(path, ShowCodec(method='lzma'), block_frames=30).write(self.frames)
+            with ShowReader(path) as reader:
+                self.assertEqual(len(reader), 90)
+                # Lecture d'une frame au milieu sans décoder les blocs précédents
+                frame = reader.frame(65)
+                self.assertEqual(reader._cached_block, 2)
+                self.assertTrue(np.allclose(frame, self.frames[65], atol=0.0006))
+
+    def test_streamed_append_matches_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            whole, streamed = os.path.join(tmp, 'a.amsf'), os.path.join(tmp, 'b.amsf')
+            ShowWriter(whole, block_frames=30).write(self.frames)
+            with ShowWriter(streamed, block_frames=30) as writer:
+                for start in range(0, 90, 20):   # paquets non alignés sur les blocs
+                    writer.append(self.frames[start:start + 20])
+            with open(whole, 'rb') as a, open(streamed, 'rb') as b:
+                self.assertEqual(a.read(), b.read())
+
+class TestColorBaking(unittest.TestCase):
+    def test_baked_colors_match_live_colors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'show.amsf')
+            n_frames = bake_show(load_project('01', 30, seed=2), path, chunk_frames=16, max_frames=70)
+            self.assertEqual(n_frames, 70)
+            with ShowReader(path) as reader:
+                self.assertEqual((len(reader), reader.dims, reader.n), (70, 3, 30))
+            colors = np.array(list(iter_baked_colors(colors_path(path))))
+            self.assertEqual((colors.shape, colors.dtype), ((70, 30, 3), np.uint8))
+
+            project = load_project('01', 30, seed=2)
+            for k, (positions, phase, t, _) in enumerate(iter_project_frames(project, 70)):
+                live = [project.colors.hex_to_rgb(project.colors.get_phase_color(positions, phase, t, i))
+                        for i in range(30)]
+                self.assertTrue(np.array_equal(colors[k], live))
+            resumed = np.array(list(iter_baked_colors(colors_path(path), start=45)))
+            self.assertTrue(np.array_equal(resumed, colors[45:]))
+
+    def test_cloth_shading_travels_with_frames(self):
+        # Phase "Drapeau Ondulant" de P01 (frames 3600+): ombrage du tissu simulé
+        positions, phases, times, shadings = bake_frames(load_project('01', 50, seed=1), max_frames=3660)
+        self.assertEqual(phases[3600], "Drapeau Ondulant")
+        self.assertIsNotNone(shadings[3600])
+        # Couleurs recalculées après coup = couleurs calculées pendant la génération
+        baked = bake_colors(load_project('01', 50, seed=1), positions, phases, times, shadings=shadings)
+        live = np.concatenate([colors.copy() for _, colors, _, _ in
+                               iter_baked_chunks(load_project('01', 50, seed=1), max_frames=3660)])
+        self.assertTrue(np.array_equal(baked, live))
+
+    def test_generator_error_is_not_a_short_show(self):
+        class Broken:
+            n = 4
+            def run_complete_animation(self):
+                for k in range(5):
+                    yield np.zeros((2, 4)), "Phase", k / 30, k
+                raise ValueError("formation de taille invalide")
+
+        with self.assertRaisesRegex(RuntimeError, "frame 5"):
+            bake_positions(Broken())
+        # Troncature seulement sur demande explicite
+        self.assertEqual(len(bake_positions(Broken(), allow_partial=True)), 5)
+
+class TestRandomStreams(unittest.TestCase):
+    def test_same_key_same_draws(self):
+        a = stream(7, 'tempête', 42).random(5)
+        b = stream(7, 'tempête', 42).random(5)
+        self.assertTrue(np.array_equal(a, b))
+
+    def test_frames_and_phases_independent(self):
+        r = ShowRandom(7)
+        f1 = r.stream('tempête', 1).random(5)
+        f2 = r.stream('tempête', 2).random(5)
+        other = r.stream('désert', 1).random(5)
+        self.assertFalse(np.array_equal(f1, f2))
+        self.assertFalse(np.array_equal(f1, other))
+
+    def test_frame_regenerated_out_of_order(self):
+        r = ShowRandom(3)
+        forward = [r.stream('p', k).random(3) for k in range(10)]
+        self.assertTrue(np.array_equal(r.stream('p', 7).random(3), forward[7]))
+
+class TestPlaylist(unittest.TestCase):
+    def test_shows_chained_with_transition(self):
+        runner = PlaylistRunner([('03', 1), ('01', 1)], n_robots=12, transition_duration=0.5)
+        frames = [(pos.copy(), label) for pos, label, _, _ in runner.run()]
+        self.assertEqual(len(frames), 30 + 15 + 30)
+        self.assertTrue(all(pos.shape == (3, 12) for pos, _ in frames))
+        self.assertEqual([label for _, label in frames[30:45]], ["Transition"] * 15)
+        # La transition part de la dernière frame du premier show
+        self.assertTrue(np.allclose(frames[30][0], frames[29][0]))
+
+    def test_unknown_project_rejected(self):
+        with self.assertRaises(ValueError):
+            PlaylistRunner([('99', 10)])
+
+class TestFrameBus(unittest.TestCase):
+    def test_backpressure_keeps_every_frame(self):
+        with FrameBus(n_slots=4, dims=3, n_robots=12) as bus:
+            producer = mp.Process(target=project_producer, args=('01', bus.name),
+                                  kwargs={'max_frames': 40})
+            producer.start()
+            frames = [frame for _, _, _, frame, _ in bus]
+            producer.join()
+            self.assertEqual(frames, list(range(40)))
+            self.assertEqual(bus.stats()['dropped_producer'], 0)
+
+    def test_dropped_frames_accounted(self):
+        with FrameBus(n_slots=2, dims=2, n_robots=5) as bus:
+            pos = np.zeros((2, 5))
+            results = [bus.publish(pos, frame=k, block=False) for k in range(5)]
+            self.assertEqual(results, [True, True, False, False, False])
+            self.assertEqual(bus.stats()['dropped_producer'], 3)
+            _, _, _, frame, _ = bus.acquire(latest=True)
+            self.assertEqual(frame, 1)
+            self.assertEqual(bus.stats()['dropped_consumer'], 1)
+
+    def test_last_frame_committed_while_closing_is_read(self):
+        with FrameBus(n_slots=2, dims=2, n_robots=3) as bus:
+            header = bus.header
+
+            class Interleaved:
+                """Le producteur publie sa dernière frame et ferme entre les deux lectures."""
+                def __getitem__(self, index):
+                    if index == _CLOSED and not header[index]:
+                        bus.header = header
+                        bus.publish(np.ones((2, 3)), frame=7)
+                        bus.close_stream()
+                    return header[index]
+
+                def __setitem__(self, index, value):
+                    header[index] = value
+
+            bus.header = Interleaved()
+            item = bus.acquire(timeout=1.0)
+            self.assertIsNotNone(item)
+            self.assertEqual(item[3], 7)
+            bus.release()
+            self.assertIsNone(bus.acquire(timeout=0.1))
+
+class TestFrameBuffers(unittest.TestCase):
+    def test_double_buffer_contract(self):
+        buffers = FrameBuffers(3, 10)
+        first, second, third = buffers.next(), buffers.next(), buffers.next()
+        self.assertFalse(np.shares_memory(first, second))
+        self.assertTrue(np.shares_memory(first, third))
+        start = buffers.snapshot(third)
+        self.assertFalse(np.shares_memory(start, buffers.buffers))
+
+    def test_in_place_frames_match_copies(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            frames = Project11NaissanceNation(n_robots=40).run_complete_animation()
+            previous = None
+            for pos, _, _, frame in frames:
+                if previous is not None:
+                    # La frame précédente reste lisible pendant la frame courante
+                    self.assertTrue(np.array_equal(previous_view, previous))
+                previous_view, previous = pos, pos.copy()
+
+    def test_steady_state_allocation_near_zero(self):
+        n = 1000
+        frame_bytes = 3 * n * 8
+        with contextlib.redirect_stdout(io.StringIO()):
+            frames = Project11NaissanceNation(n_robots=n).run_complete_animation()
+            tracemalloc.start()
+            try:
+                for pos, _, _, frame in frames:
+                    if frame in (100, 960, 1400):  # Désert, transition, ondulation
+                        tracemalloc.reset_peak()
+                        baseline = tracemalloc.get_traced_memory()[0]
+                    elif frame in (400, 1040, 1700):
+                        current, peak = tracemalloc.get_traced_memory()
+                        self.assertLess(peak - baseline, frame_bytes // 20)
+                        self.assertLess(current - baseline, 1024)
+            finally:
+                tracemalloc.stop()
+
+class TestShowSpec(unittest.TestCase):
+    def test_keyframes_compile_to_tensors(self):
+        spec = ShowSpec([Keyframe(0, 'base.circle', {'radius': 0.5}, color='#FF0000'),
+                         Keyframe(1, 'base.line', easing='linear', transition=1, color='#0000FF')],
+                        duration=2, n_robots=12, fps=10)
+        positions, colors = spec.compile()
+        self.assertEqual(positions.shape, (20, 2, 12))
+        self.assertEqual(colors.shape, (20, 12, 3))
+        self.assertEqual(colors.dtype, np.uint8)
+        circle = BaseFormations(12).circle(radius=0.5)
+        self.assertTrue(np.allclose(positions[0], circle))
+        # Mi-transition linéaire: moyenne des deux formations et des deux couleurs
+        expected = (circle + BaseFormations(12).line()) / 2
+        self.assertTrue(np.allclose(positions[15], expected, atol=1e-6))
+        self.assertEqual(colors[15, 0].tolist(), [127, 0, 127])
+        self.assertEqual([name for _, name in spec.segments()], ['base.circle', 'base.line'])
+
+    def test_first_keyframe_held_from_start(self):
+        spec = ShowSpec([Keyframe(2, 'base.circle', color='#FF0000'), Keyframe(4, 'base.line')],
+                        duration=5, n_robots=5)
+        positions, colors = spec.compile()
+        head = 2 * spec.fps
+        self.assertTrue(np.allclose(positions[:head], BaseFormations(5).circle()))
+        self.assertTrue(np.all(colors[:head] == [255, 0, 0]))
+
+    def test_fade_out_does_not_darken_next_transition(self):
+        spec = ShowSpec([Keyframe(0, 'base.circle', color='#FF0000',
+                                  effect={'type': 'fade_out', 'duration': 1}),
+                         Keyframe(2, 'base.circle', easing='linear', transition=2, color='#0000FF')],
+                        duration=4, n_robots=4, fps=10)
+        _, colors = spec.compile()
+        self.assertEqual(colors[19, 0].tolist(), [0, 0, 0])        # Fondu au noir terminé
+        # La transition repart du rouge de l'image clé, pas du noir
+        self.assertEqual(colors[20, 0].tolist(), [255, 0, 0])
+        self.assertEqual(colors[30, 0].tolist(), [127, 0, 127])
+
+    def test_modifiers_effects_and_json_example(self):
+        spec = ShowSpec.load(os.path.join(os.path.dirname(__file__), '../assets/shows/ceremonie_anem.json'),
+                             n_robots=50)
+        positions, colors = spec.compile()
+        self.assertEqual(positions.shape[0], spec.duration * spec.fps)
+        self.assertEqual(colors[0].max(), 0)     # fade_in depuis le noir
+        self.assertTrue(np.all(np.abs(positions[:, 0]) < 1.6))
+        with self.assertRaises(ValueError):
+            ShowSpec([Keyframe(0, 'base.circle', modifiers=[{'type': 'teleport'}])])
+
+    def test_auto_transition_uses_minimum_time(self):
+        spec = ShowSpec([Keyframe(0, 'base.circle', {'radius': 0.2}),
+                         Keyframe(0.5, 'base.circle', {'radius': 0.8}, transition='auto')],
+                        duration=4, n_robots=8, fps=30)
+        positions, _ = spec.compile()
+        arrival = spec.arrival_times([BaseFormations(8).circle(radius=r) for r in (0.2, 0.8)])[1]
+        self.assertAlmostEqual(arrival, 0.5 + 0.6 / 0.15 + 0.15 / 0.3)
+        speed = np.sqrt((np.diff(positions, axis=0)**2).sum(axis=1)).max() * 30
+        self.assertLessEqual(speed, 0.15 + 1e-3)
+
+    def test_spline_interpolation_passes_through_formations(self):
+        keyframes = [Keyframe(0, 'base.circle'), Keyframe(1, 'base.line', transition=1),
+                     Keyframe(2, 'base.circle', {'radius': 0.3}, transition=0.5)]
+        spec = ShowSpec(keyframes, duration=3, n_robots=10, fps=10, interpolation='cubic')
+        positions, _ = spec.compile()
+        self.assertTrue(np.allclose(positions[20], BaseFormations(10).line(), atol=1e-6))
+        self.assertTrue(np.allclose(positions[29], BaseFormations(10).circle(radius=0.3), atol=1e-6))
+
+    def test_spline_modifiers_do_not_jump_at_keyframes(self):
+        keyframes = [Keyframe(0, 'base.circle', {'radius': 0.8}),
+                     Keyframe(2, 'base.circle', {'radius': 0.5}, transition=2,
+                              modifiers=[{'type': 'rotate', 'speed': 0.3}]),
+                     Keyframe(10, 'base.line', transition=3)]
+        for interpolation in ('cubic', 'catmull_rom'):
+            spec = ShowSpec(keyframes, duration=14, n_robots=20, fps=30, interpolation=interpolation)
+            positions, _ = spec.compile(np.float64)
+            steps = np.sqrt((np.diff(positions, axis=0)**2).sum(axis=1))
+            # Rotation de 2.4 rad à défaire: au plus ~1 m/s, sans téléportation
+            self.assertLess(steps.max(), 0.035)
+            self.assertTrue(np.allclose(positions[-1], BaseFormations(20).line(), atol=1e-6))
+
+    def test_overlapping_transitions_give_increasing_arrivals(self):
+        # Transition de 3 s alors que l'image clé suivante arrive 1 s plus tard
+        keyframes = [Keyframe(0, 'base.circle'), Keyframe(1, 'base.line', transition=3),
+                     Keyframe(2, 'base.circle', {'radius': 0.3}, transition=0.5),
+                     Keyframe(2, 'base.circle', {'radius': 0.4}, transition=0)]
+        spec = ShowSpec(keyframes, duration=4, n_robots=10, fps=10, interpolation='cubic')
+        targets = [BaseFormations(10).circle()] * 4
+        arrivals = spec.arrival_times(targets)
+        self.assertTrue(np.all(np.diff(arrivals) > 0))
+        self.assertAlmostEqual(arrivals[1], 2.0)
+        positions, _ = spec.compile()
+        self.assertTrue(np.isfinite(positions).all())
+
+class TestSwarmRenderer(unittest.TestCase):
+    def test_splat_colour_and_density(self):
+        x, y = np.zeros(50), np.zeros(50)
+        rgb = np.tile([1.0, 0.5, 0.0], (50, 1))
+        image = splat_density(x, y, rgb, (-1, 1, -1, 1), resolution=(40, 20))
+        self.assertEqual(image.shape, (20, 40, 4))
+        peak = np.unravel_index(np.argmax(image[..., 3]), image.shape[:2])
+        self.assertEqual(peak, (10, 20))
+        self.assertTrue(np.allclose(image[peak][:3], [1.0, 0.5, 0.0], atol=1e-5))
+        self.assertEqual(image[0, 0, 3], 0.0)
+
+    def test_lod_switches_above_threshold(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(111, projection='3d')
+        renderer = SwarmRenderer(ax, lod_threshold=100, glow_fraction=0.5)
+        rng = np.random.default_rng(0)
+        renderer.draw(rng.uniform(-1, 1, (3, 50)), colors='#E05206')
+        self.assertEqual(renderer.last_mode, 'scatter')
+        self.assertEqual(len(ax.collections), 2)
+        self.assertEqual(len(ax.collections[0].get_offsets()), 25)  # Halo: moitié proche seulement
+        ax.clear()
+        renderer.draw(rng.uniform(-1, 1, (3, 500)), colors=rng.uniform(0, 1, (500, 3)))
+        self.assertEqual(renderer.last_mode, 'density')
+        self.assertEqual(len(ax.collections), 0)
+        fig.canvas.draw()
+        plt.close(fig)
+
+if __name__ == '__main__':
+    unittest.main()